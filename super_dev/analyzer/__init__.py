@@ -5,7 +5,13 @@ Super Dev 项目分析器
 """
 
 from .analyzer import ProjectAnalyzer, ArchitectureReport
+from .batch import BatchReport, BatchResult, aggregate_results
+from .cache import AnalysisCache
+from .ignore import IgnoreMatcher, load_ignore_matcher
 from .detectors import detect_project_type, detect_tech_stack
+from .imports import ImportGraph, build_import_graph
+from .manifest import FileEntry, FileManifest, build_manifest
+from .package_manifests import PackageManifests
 from .models import (
     Dependency,
     DesignPattern,
@@ -15,7 +21,12 @@ from .models import (
     ProjectType,
     FrameworkType,
     ArchitecturePattern,
+    ImportGraphSummary,
 )
+from .stream import NDJSONWriter
+from .tree import DirectoryTree, DirectoryView
+from .watch import create_watcher
+from .workspace import WorkspacePackage, detect_workspaces
 
 __all__ = [
     "ProjectAnalyzer",
@@ -30,6 +41,25 @@ __all__ = [
     "ArchitecturePattern",
     "detect_project_type",
     "detect_tech_stack",
+    "FileEntry",
+    "FileManifest",
+    "build_manifest",
+    "AnalysisCache",
+    "IgnoreMatcher",
+    "load_ignore_matcher",
+    "PackageManifests",
+    "create_watcher",
+    "WorkspacePackage",
+    "detect_workspaces",
+    "ImportGraph",
+    "ImportGraphSummary",
+    "build_import_graph",
+    "NDJSONWriter",
+    "DirectoryTree",
+    "DirectoryView",
+    "BatchResult",
+    "BatchReport",
+    "aggregate_results",
 ]
 
 
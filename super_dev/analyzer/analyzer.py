@@ -3,31 +3,84 @@
 Super Dev 项目分析器核心模块
 """
 
-import ast
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING
 
+import yaml
+
+from .cache import AnalysisCache
 from .detectors import (
     detect_architecture_pattern,
     detect_project_type,
     detect_tech_stack,
 )
+from .ignore import IgnoreMatcher, load_ignore_matcher
+from .imports import IMPORT_LANGUAGES, ImportGraph, build_import_graph, summarize_import_graph
+from .manifest import IGNORE_DIRS, LANGUAGE_MAP, FileEntry, FileManifest, build_manifest
 from .models import (
+    REPORT_SECTIONS,
     ArchitectureReport,
     ArchitecturePattern,
     DesignPattern,
     Dependency,
-    PatternType,
     ProjectCategory,
     ProjectType,
+    StageTiming,
     TechStack,
 )
+from .package_manifests import PackageManifests
+from .profiling import StageProfiler
+from .sampling import StratumKey, StratumSample, estimate_total, sampling_order, stratum_key
+from .scanner import (
+    MAX_FILE_SIZE,
+    SKIP_TOO_LARGE,
+    FileScanResult,
+    ScanTask,
+    resolve_workers,
+    scan_files,
+    scan_files_until,
+)
+from .stream import file_record
+from .tree import DirectoryTree, DirectoryView
+from .watch import create_watcher
+from .workspace import WorkspacePackage, detect_workspaces, merge_categories
+
+if TYPE_CHECKING:
+    from .batch import BatchResult
 
 
 # 类型别名，向后兼容
 ProjectType = ProjectCategory
 
+# 目录结构中展示的代码文件扩展名
+STRUCTURE_SUFFIXES = frozenset({".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".java"})
+
+# 时间预算中目录遍历最多使用的比例，其余时间用于读取文件
+WALK_BUDGET_FRACTION = 0.5
+
+# 变化时需要完整重新分析的文件（影响项目类型、技术栈或忽略规则）
+REANALYZE_FILES = frozenset({
+    "package.json", "requirements.txt", "pyproject.toml", "setup.py", "go.mod",
+    "Cargo.toml", "pom.xml", "build.gradle", "Gemfile", "composer.json",
+    "super-dev.yaml", ".gitignore", "pnpm-workspace.yaml", "go.work",
+})
+
+# Node.js 项目中参与设计模式检测的扩展名 -> 检测语言
+JS_PATTERN_LANGUAGES: dict[str, str] = {
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".vue": "vue",
+}
+
 
 class ProjectAnalyzer:
     """
@@ -49,33 +102,282 @@ class ProjectAnalyzer:
 
         self._report: ArchitectureReport | None = None
 
-    def analyze(self) -> ArchitectureReport:
+        # 增量更新（watch 模式）使用的内存状态
+        self._options: dict = {}
+        self._ignore: IgnoreMatcher | None = None
+        self._manifest: FileManifest | None = None
+        self._scan_state: dict[str, tuple[ScanTask, FileScanResult]] = {}
+        self._category = ProjectCategory.UNKNOWN
+        self._tech_stack: TechStack | None = None
+        self._architecture_pattern: ArchitecturePattern | None = None
+        self._packages: dict[str, tuple[WorkspacePackage, ProjectCategory, TechStack]] = {}
+        self._strata: dict[StratumKey, StratumSample] | None = None  # 抽样模式下的分层样本
+        self._manifests: dict[str, PackageManifests] = {}  # 目录 -> 已解析的清单文件
+        self._import_graph: ImportGraph | None = None
+
+    def analyze(
+        self,
+        workers: int = 1,
+        use_cache: bool = False,
+        max_file_size: int | None = MAX_FILE_SIZE,
+        budget_seconds: float | None = None,
+        sample_rate: float | None = None,
+        emit: Callable[[dict], None] | None = None,
+        profile: bool = False,
+        follow_symlinks: bool = False,
+    ) -> ArchitectureReport:
         """
         执行完整分析
 
+        指定 budget_seconds 或 sample_rate 时进入抽样模式：按 (目录, 语言) 分层抽样读取文件，
+        文件数、总行数和各语言行数为估计值，report.estimates 中给出 95% 置信区间；
+        设计模式只来自被读取的文件。
+
+        指定 emit 时边分析边输出记录（见 ArchitectureReport.iter_records）：
+        检测完成后输出 project，扫描过程中逐个输出 file（含该文件的设计模式，
+        缓存命中的文件先于新扫描的文件），结束时输出其余部分。
+
+        Args:
+            workers: 扫描文件的工作进程数，1 为单进程，0 表示使用全部 CPU
+            use_cache: 是否使用 .super-dev/cache 中的增量分析缓存（抽样模式下不使用）
+            max_file_size: 单文件大小上限（字节），超过的文件不读取，None 表示不限制
+            budget_seconds: 分析时间预算（秒），包括目录遍历：遍历最多使用一半预算，
+                到时不再进入新目录（report.unvisited_dirs），其余时间用于读取文件，到时停止读取
+            sample_rate: 抽样比例 (0, 1]
+            emit: 流式记录回调，如 NDJSONWriter
+            profile: 是否记录各阶段的耗时、读取量和内存峰值（report.timings）
+            follow_symlinks: 是否跟随符号链接（按 inode 去重，不会因链接环重复遍历）
+
         Returns:
             ArchitectureReport: 架构分析报告
+
+        Raises:
+            ValueError: 抽样参数无效
         """
-        # 检测项目类型
-        category = detect_project_type(self.project_path)
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate 必须在 (0, 1] 范围内: {sample_rate}")
+        if budget_seconds is not None and budget_seconds <= 0:
+            raise ValueError(f"budget_seconds 必须大于 0: {budget_seconds}")
+
+        started = time.monotonic()
+        self._options = {
+            "workers": workers,
+            "use_cache": use_cache,
+            "max_file_size": max_file_size,
+            "budget_seconds": budget_seconds,
+            "sample_rate": sample_rate,
+            "follow_symlinks": follow_symlinks,
+            "profile": profile,
+        }
+        profiler = StageProfiler(enabled=profile)
+        with profiler:
+            report = self._run_stages(profiler, started, emit)
+        report.timings = profiler.timings
+
+        if emit is not None:
+            # project 已输出，设计模式已随 file 记录输出
+            for record in report.iter_records(REPORT_SECTIONS[2:]):
+                emit(record)
+        return report
+
+    def _run_stages(
+        self,
+        profiler: StageProfiler,
+        started: float,
+        emit: Callable[[dict], None] | None,
+    ) -> ArchitectureReport:
+        """按阶段执行分析（参数取自 self._options）"""
+        workers = self._options["workers"]
+        max_file_size = self._options["max_file_size"]
+        budget_seconds = self._options["budget_seconds"]
+        sample_rate = self._options["sample_rate"]
+
+        with profiler.stage("walk") as stage:
+            self._ignore = self._load_ignore_matcher()
+
+            # 一次遍历生成文件清单，后续各阶段共享
+            manifest = build_manifest(
+                self.project_path,
+                ignore=self._ignore,
+                follow_symlinks=self._options["follow_symlinks"],
+                deadline=(
+                    started + budget_seconds * WALK_BUDGET_FRACTION
+                    if budget_seconds is not None else None
+                ),
+            )
+            stage.files = len(manifest.files)
+
+        with profiler.stage("detect") as stage:
+            # 检测项目类型
+            self._manifests = {}
+            root_manifests = self._package_manifests("")
+            self._category = detect_project_type(self.project_path, root_manifests)
+
+            # 检测技术栈
+            self._tech_stack = detect_tech_stack(self.project_path, root_manifests)
+
+            # 检测架构模式
+            self._architecture_pattern = detect_architecture_pattern(
+                self.project_path, manifest, root_manifests
+            )
 
-        # 检测技术栈
-        tech_stack = detect_tech_stack(self.project_path)
+            # 检测 monorepo 成员包
+            self._packages = {}
+            packages = detect_workspaces(self.project_path, manifest, root_manifests)
+            if packages:
+                self._detect_packages(packages, resolve_workers(workers))
+
+            for manifests in self._manifests.values():
+                files, size = manifests.read_stats()
+                stage.files += files
+                stage.bytes_read += size
+
+        on_result: Callable[[FileScanResult], None] | None = None
+        if emit is not None:
+            category = self._category
+            if category == ProjectCategory.UNKNOWN and self._packages:
+                category = merge_categories([c for _, c, _ in self._packages.values()])
+            header = ArchitectureReport(
+                project_path=self.project_path,
+                category=category,
+                tech_stack=self._tech_stack,
+                architecture_pattern=self._architecture_pattern,
+            )
+            for record in header.iter_records(("project",)):
+                emit(record)
+
+            def on_result(result: FileScanResult) -> None:
+                emit(file_record(result))
+
+        # 扫描文件（行数 + 设计模式），可分片并行
+        with profiler.stage("scan") as stage:
+            tasks = self._build_scan_tasks(manifest)
+            self._strata = None
+            if budget_seconds is None and sample_rate is None:
+                scan_results = self._scan(
+                    tasks,
+                    resolve_workers(workers),
+                    self._options["use_cache"],
+                    max_file_size,
+                    on_result,
+                )
+            else:
+                deadline = started + budget_seconds if budget_seconds is not None else None
+                tasks, scan_results = self._scan_sample(
+                    tasks, resolve_workers(workers), max_file_size, deadline, sample_rate, on_result
+                )
+            stage.files = len(scan_results)
+            stage.bytes_read = sum(result.bytes_read for result in scan_results)
+
+        # 解析耗时在扫描中逐文件累计（多进程时为各进程之和）
+        parsed = [result for result in scan_results if result.parse_ns]
+        profiler.add(StageTiming(
+            name="scan.parse",
+            wall_seconds=sum(result.parse_ns for result in parsed) / 1e9,
+            cpu_seconds=sum(result.parse_cpu_ns for result in parsed) / 1e9,
+            files=len(parsed),
+        ))
+
+        self._manifest = manifest
+        self._scan_state = {
+            task[0].rel_path: (task, result) for task, result in zip(tasks, scan_results)
+        }
+
+        with profiler.stage("report") as stage:
+            report = self._build_report()
+            stage.files = len(scan_results)
+        return report
+
+    @staticmethod
+    def analyze_many(
+        paths: Iterable[str | Path],
+        jobs: int = 0,
+        on_result: "Callable[[BatchResult], None] | None" = None,
+        **analyze_options,
+    ) -> "list[BatchResult]":
+        """
+        并发分析多个仓库（见 batch.analyze_many）
+
+        Args:
+            paths: 仓库路径
+            jobs: 同时分析的仓库数，0 表示使用全部 CPU
+            on_result: 每个仓库完成后立即调用（按完成顺序）
+            **analyze_options: 传给 analyze() 的参数
+
+        Returns:
+            list[BatchResult]: 与 paths 顺序一致的结果，可交给 aggregate_results() 汇总
+        """
+        from .batch import analyze_many
+
+        return analyze_many(paths, jobs, on_result, **analyze_options)
+
+    def _build_report(self) -> ArchitectureReport:
+        """根据内存中的分析状态生成报告"""
+        assert self._manifest is not None
+
+        scan_results = [result for _, result in self._scan_state.values()]
+
+        self._report = self._summarize(
+            self.project_path,
+            self._manifest,
+            scan_results,
+            self._category,
+            self._tech_stack,
+            self._architecture_pattern,
+        )
+
+        # 抽样模式下导入图不完整，不做依赖分析
+        self._import_graph = None
+        if self._strata is not None:
+            self._apply_estimates(self._report, self._strata)
+        else:
+            self._import_graph = build_import_graph(
+                (result.rel_path, result.imports)
+                for result in scan_results
+                if os.path.splitext(result.rel_path)[1] in IMPORT_LANGUAGES
+            )
+            self._report.import_graph = summarize_import_graph(self._import_graph)
+
+        # monorepo：按成员包拆分结果，并在根目录无法识别类型时由成员推断
+        if self._packages:
+            self._report.packages = self._build_package_reports()
+            if self._report.category == ProjectCategory.UNKNOWN:
+                self._report.category = merge_categories(
+                    [package.category for package in self._report.packages.values()]
+                )
 
-        # 检测架构模式
-        architecture_pattern = detect_architecture_pattern(self.project_path)
+        return self._report
 
+    def _summarize(
+        self,
+        project_path: Path,
+        manifest: FileManifest,
+        scan_results: list[FileScanResult],
+        category: ProjectCategory,
+        tech_stack: TechStack,
+        architecture_pattern: ArchitecturePattern | None,
+    ) -> ArchitectureReport:
+        """汇总一组扫描结果为报告"""
         # 分析目录结构
-        directory_structure = self._analyze_directory_structure()
+        directory_structure = self._analyze_directory_structure(manifest)
 
         # 统计文件和代码行数
-        file_count, total_lines, languages_used = self._count_files_and_lines()
+        file_count, total_lines, languages_used = self._count_files_and_lines(scan_results)
 
         # 检测设计模式
-        design_patterns = self._detect_design_patterns()
-
-        self._report = ArchitectureReport(
-            project_path=self.project_path,
+        design_patterns = self._collect_design_patterns(scan_results)
+
+        # 被跳过的文件（超过大小上限、压缩或生成文件）
+        skipped_files: dict[str, int] = {}
+        for result in scan_results:
+            if result.skipped:
+                skipped_files[result.skipped] = skipped_files.get(result.skipped, 0) + 1
+        # 硬链接或符号链接指向的重复文件/目录
+        if manifest.duplicates:
+            skipped_files["duplicate"] = manifest.duplicates
+
+        return ArchitectureReport(
+            project_path=project_path,
             category=category,
             tech_stack=tech_stack,
             architecture_pattern=architecture_pattern,
@@ -84,304 +386,555 @@ class ProjectAnalyzer:
             file_count=file_count,
             total_lines=total_lines,
             languages_used=languages_used,
+            skipped_files=skipped_files,
+            unvisited_dirs=manifest.unvisited_dirs,
         )
 
-        return self._report
+    def _detect_packages(self, packages: list[WorkspacePackage], workers: int) -> None:
+        """并行检测各成员包的项目类型和技术栈"""
+        for package in packages:
+            self._package_manifests(package.rel_path)
+
+        def detect(package: WorkspacePackage) -> tuple[ProjectCategory, TechStack]:
+            package_path = self.project_path / package.rel_path
+            manifests = self._manifests[package.rel_path]
+            return (
+                detect_project_type(package_path, manifests),
+                detect_tech_stack(package_path, manifests),
+            )
 
-    def _analyze_directory_structure(self, max_depth: int = 3) -> dict:
-        """
-        分析目录结构
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(packages)))) as executor:
+            detected = list(executor.map(detect, packages))
 
-        Args:
-            max_depth: 最大递归深度
+        self._packages = {
+            package.rel_path: (package, category, tech_stack)
+            for package, (category, tech_stack) in zip(packages, detected)
+        }
 
-        Returns:
-            dict: 目录结构树
+    def _build_package_reports(self) -> dict[str, ArchitectureReport]:
         """
-        result = {}
+        生成各成员包的报告
 
-        def _build_tree(path: Path, depth: int) -> dict | None:
-            if depth > max_depth:
-                return None
+        文件归属于路径最长的成员包（嵌套包不计入外层包），
+        各包共享同一次遍历和扫描的结果。
+        """
+        assert self._manifest is not None
 
-            tree = {}
-            try:
-                for item in sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name)):
-                    # 跳过隐藏文件和目录
-                    if item.name.startswith("."):
-                        continue
-
-                    # 跳过常见忽略目录
-                    if item.name in ["node_modules", "__pycache__", ".git", "venv", "dist", "build"]:
-                        continue
-
-                    if item.is_dir():
-                        subtree = _build_tree(item, depth + 1)
-                        if subtree:
-                            tree[item.name] = subtree
-                    else:
-                        # 只包含代码文件
-                        if item.suffix in [".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".java"]:
-                            tree[item.name] = None
-            except PermissionError:
-                pass
-
-            return tree if tree else None
-
-        top_tree = _build_tree(self.project_path, 0)
-        if top_tree:
-            result = top_tree
-
-        return result
+        grouped: dict[str, tuple[list[FileEntry], list[FileScanResult]]] = {
+            rel_path: ([], []) for rel_path in self._packages
+        }
+        scan_results = {
+            rel_path: result for rel_path, (_, result) in self._scan_state.items()
+        }
 
-    def _count_files_and_lines(
+        for entry in self._manifest.files:
+            owner = self._package_of(entry.rel_path)
+            if owner is None:
+                continue
+            prefix_length = len(owner) + 1
+            files, results = grouped[owner]
+            files.append(
+                FileEntry(
+                    path=entry.path,
+                    rel_path=entry.rel_path[prefix_length:],
+                    size=entry.size,
+                    mtime_ns=entry.mtime_ns,
+                    language=entry.language,
+                )
+            )
+            if entry.rel_path in scan_results:
+                results.append(scan_results[entry.rel_path])
+
+        reports: dict[str, ArchitectureReport] = {}
+        for rel_path, (package, category, tech_stack) in self._packages.items():
+            files, results = grouped[rel_path]
+            prefix = f"{rel_path}/"
+            package_manifest = FileManifest(
+                root=self.project_path / rel_path,
+                files=files,
+                dirs=[d[len(prefix):] for d in self._manifest.dirs if d.startswith(prefix)],
+            )
+            reports[rel_path] = self._summarize(
+                package_manifest.root,
+                package_manifest,
+                results,
+                category,
+                tech_stack,
+                detect_architecture_pattern(
+                    package_manifest.root, package_manifest, self._package_manifests(rel_path)
+                ),
+            )
+            if self._strata is not None:
+                self._apply_estimates(
+                    reports[rel_path],
+                    {key: sample for key, sample in self._strata.items() if key[0] == rel_path},
+                )
+
+        return reports
+
+    def _scan_sample(
         self,
-    ) -> tuple[int, int, dict[str, int]]:
+        tasks: list[ScanTask],
+        workers: int,
+        max_file_size: int | None,
+        deadline: float | None,
+        sample_rate: float | None,
+        on_result: Callable[[FileScanResult], None] | None = None,
+    ) -> tuple[list[ScanTask], list[FileScanResult]]:
         """
-        统计文件数量和代码行数
+        分层抽样扫描
+
+        Args:
+            tasks: 全部扫描任务
+            workers: 工作进程数
+            max_file_size: 单文件大小上限
+            deadline: 截止时间（time.monotonic() 时钟），None 表示不限时
+            sample_rate: 抽样比例，None 表示在时限内尽量多读
+            on_result: 每个文件扫描完成后的回调
 
         Returns:
-            tuple: (文件数量, 总行数, 各语言行数)
+            (被扫描的任务, 扫描结果)
         """
-        file_count = 0
-        total_lines = 0
-        languages_used: dict[str, int] = {}
+        keys = [
+            stratum_key(
+                entry.rel_path,
+                entry.language,
+                self._package_of(entry.rel_path) if self._packages else None,
+            )
+            for entry, _ in tasks
+        ]
+        order = sampling_order(keys)
+        if sample_rate is not None:
+            order = [(key, index) for key, index in order if key < sample_rate]
+
+        ordered = [tasks[index] for _, index in order]
+        if deadline is None:
+            results = scan_files(ordered, workers, max_file_size, on_result)
+        else:
+            results = scan_files_until(
+                ordered, deadline, workers, max_file_size, on_result=on_result
+            )
 
-        # 语言扩展名映射
-        lang_map = {
-            ".py": "Python",
-            ".js": "JavaScript",
-            ".ts": "TypeScript",
-            ".tsx": "TypeScript",
-            ".jsx": "JavaScript",
-            ".go": "Go",
-            ".java": "Java",
-            ".kt": "Kotlin",
-            ".swift": "Swift",
-            ".rb": "Ruby",
-            ".php": "PHP",
-            ".rs": "Rust",
-            ".cpp": "C++",
-            ".c": "C",
-            ".cs": "C#",
-            ".vue": "Vue",
-            ".svelte": "Svelte",
-        }
+        # 读取了全部文件时结果是精确值，无需估计
+        if len(results) < len(tasks):
+            strata: dict[StratumKey, StratumSample] = {}
+            for key in keys:
+                strata.setdefault(key, StratumSample()).population += 1
+            for (_, index), result in zip(order, results):
+                sample = strata[keys[index]]
+                sample.lines.append(result.lines or 0)
+                sample.files.append(0 if result.lines is None else 1)
+            self._strata = strata
+
+        return ordered[:len(results)], results
+
+    def _apply_estimates(
+        self, report: ArchitectureReport, strata: dict[StratumKey, StratumSample]
+    ) -> None:
+        """用分层估计替换报告中的文件数、总行数和各语言行数"""
+        by_language: dict[str, list[StratumSample]] = {}
+        for (_, language), sample in strata.items():
+            by_language.setdefault(language, []).append(sample)
+
+        file_estimate = estimate_total(strata.values(), lambda s: s.files)
+        line_estimate = estimate_total(strata.values(), lambda s: s.lines)
+        report.estimates = {"file_count": file_estimate, "total_lines": line_estimate}
+        report.file_count = round(file_estimate.value)
+        report.total_lines = round(line_estimate.value)
+
+        report.languages_used = {}
+        for language, samples in sorted(by_language.items()):
+            estimate = estimate_total(samples, lambda s: s.lines)
+            if language and round(estimate.value) > 0:
+                report.languages_used[language] = round(estimate.value)
+                report.estimates[f"languages_used.{language}"] = estimate
+
+    @property
+    def import_graph(self) -> ImportGraph | None:
+        """最近一次分析的模块导入图（抽样模式下为 None）"""
+        return self._import_graph
+
+    @property
+    def package_manifests(self) -> PackageManifests:
+        """项目根目录已解析的清单文件，可传给 QualityGateChecker 等复用"""
+        return self._package_manifests("")
+
+    def _package_manifests(self, rel_dir: str) -> PackageManifests:
+        """获取项目根目录或成员包的清单文件（每次分析只解析一次）"""
+        manifests = self._manifests.get(rel_dir)
+        if manifests is None:
+            manifests = PackageManifests(self.project_path / rel_dir if rel_dir else self.project_path)
+            self._manifests[rel_dir] = manifests
+        return manifests
+
+    def _package_of(self, rel_path: str) -> str | None:
+        """查找文件所属的（最内层）成员包"""
+        index = rel_path.rfind("/")
+        while index > 0:
+            prefix = rel_path[:index]
+            if prefix in self._packages:
+                return prefix
+            index = rel_path.rfind("/", 0, index)
+        return None
+
+    def update(self, changed_paths: Iterable[str]) -> ArchitectureReport:
+        """
+        增量更新分析结果
 
-        # 忽略的目录
-        ignore_dirs = {
-            "node_modules", "__pycache__", ".git", "venv", "env",
-            ".venv", "dist", "build", "target", "bin", "obj",
-            ".next", ".nuxt", "coverage", ".pytest_cache",
-        }
+        只重新扫描变化的代码文件；有文件或目录增删时重新遍历（不读取文件内容），
+        项目配置文件（package.json、.gitignore 等）变化时执行完整分析。
+        analyze(profile=True) 时每次更新重新剖析，report.timings 只包含本次更新执行的阶段。
 
-        for root, dirs, files in os.walk(self.project_path):
-            # 过滤忽略的目录
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
+        Args:
+            changed_paths: 变化的相对路径，空字符串表示整个项目
 
-            for file in files:
-                suffix = Path(file).suffix
+        Returns:
+            ArchitectureReport: 更新后的报告；没有影响分析结果的变化时返回原报告对象
+        """
+        if self._manifest is None or self._report is None:
+            return self.analyze()
+
+        changed = {path for path in changed_paths if self._affects_report(path)}
+        if not changed:
+            return self._report
+
+        # 抽样结果无法增量更新
+        if self._strata is not None or any(os.path.basename(path) in REANALYZE_FILES for path in changed):
+            return self.analyze(**self._options)
+
+        profiler = StageProfiler(enabled=self._options["profile"])
+        with profiler:
+            return self._update_files(changed, profiler)
+
+    def _update_files(self, changed: set[str], profiler: StageProfiler) -> ArchitectureReport:
+        """增量重新扫描变化的文件（update() 的实现）"""
+        max_file_size = self._options["max_file_size"]
+        structural = any(
+            path not in self._scan_state or not self.project_path.joinpath(path).is_file()
+            for path in changed
+        )
 
-                if suffix not in lang_map:
+        if not structural:
+            # 只有已知文件被修改：原地重新扫描这些文件
+            tasks: list[ScanTask] = []
+            for path in changed:
+                (entry, pattern_language), _ = self._scan_state[path]
+                stat = self.project_path.joinpath(path).stat()
+                if (stat.st_size, stat.st_mtime_ns) == (entry.size, entry.mtime_ns):
+                    continue
+                entry.size, entry.mtime_ns = stat.st_size, stat.st_mtime_ns
+                tasks.append((entry, pattern_language))
+
+            if not tasks:
+                return self._report
+            with profiler.stage("scan") as stage:
+                for task, result in zip(tasks, scan_files(tasks, 1, max_file_size)):
+                    self._scan_state[task[0].rel_path] = (task, result)
+                    stage.bytes_read += result.bytes_read
+                stage.files = len(tasks)
+            return self._build_profiled_report(profiler)
+
+        # 有增删：重新遍历，只扫描新增或变化的文件
+        with profiler.stage("walk") as stage:
+            manifest = build_manifest(
+                self.project_path,
+                ignore=self._ignore,
+                follow_symlinks=self._options["follow_symlinks"],
+            )
+            stage.files = len(manifest.files)
+        tasks = self._build_scan_tasks(manifest)
+
+        state: dict[str, tuple[ScanTask, FileScanResult]] = {}
+        pending: list[ScanTask] = []
+        for entry, pattern_language in tasks:
+            previous = self._scan_state.get(entry.rel_path)
+            if previous is not None:
+                (old_entry, old_language), old_result = previous
+                if (old_entry.size, old_entry.mtime_ns, old_language) == (
+                    entry.size, entry.mtime_ns, pattern_language
+                ):
+                    state[entry.rel_path] = ((entry, pattern_language), old_result)
                     continue
+            pending.append((entry, pattern_language))
+            state[entry.rel_path] = ((entry, pattern_language), None)  # type: ignore[assignment]
+
+        with profiler.stage("scan") as stage:
+            for task, result in zip(pending, scan_files(pending, 1, max_file_size)):
+                state[task[0].rel_path] = (task, result)
+                stage.bytes_read += result.bytes_read
+            stage.files = len(pending)
+
+        dirs_changed = manifest.dirs != self._manifest.dirs
+        if dirs_changed:
+            self._architecture_pattern = detect_architecture_pattern(
+                self.project_path, manifest, self._package_manifests("")
+            )
 
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = len(f.readlines())
-                        total_lines += lines
-                        file_count += 1
+        unchanged = not dirs_changed and not pending and state.keys() == self._scan_state.keys()
+        self._manifest = manifest
+        self._scan_state = state
+        if unchanged:
+            return self._report
+        return self._build_profiled_report(profiler)
+
+    def _build_profiled_report(self, profiler: StageProfiler) -> ArchitectureReport:
+        """生成报告并附上本次更新的剖析记录"""
+        with profiler.stage("report") as stage:
+            report = self._build_report()
+            stage.files = len(self._scan_state)
+        if profiler.enabled:
+            report.timings = profiler.timings
+        return report
+
+    def _affects_report(self, rel_path: str) -> bool:
+        """判断变化路径是否可能影响分析结果"""
+        if rel_path == "":
+            return True
+
+        parts = rel_path.split("/")
+        if any(part in IGNORE_DIRS for part in parts):
+            return False
+        if self._ignore:
+            if self._ignore.match(rel_path):
+                return False
+            for i in range(1, len(parts)):
+                if self._ignore.match("/".join(parts[:i]), is_dir=True):
+                    return False
+
+        if parts[-1] in REANALYZE_FILES or os.path.splitext(rel_path)[1] in LANGUAGE_MAP:
+            return True
+
+        # 目录增删可能带走或带来代码文件
+        assert self._manifest is not None
+        return rel_path in self._manifest.dirs or self.project_path.joinpath(rel_path).is_dir()
+
+    def watch(
+        self,
+        on_report: Callable[[ArchitectureReport], None],
+        interval: float = 0.5,
+        stop: threading.Event | None = None,
+        use_inotify: bool = True,
+        **analyze_options,
+    ) -> None:
+        """
+        持续监听文件变化并增量更新报告
 
-                        lang = lang_map[suffix]
-                        languages_used[lang] = languages_used.get(lang, 0) + lines
-                except (IOError, UnicodeDecodeError):
-                    pass
+        首次执行完整分析，之后每次有影响结果的变化时调用 on_report。
+        Linux 上使用 inotify，否则按 interval 轮询。
 
-        return file_count, total_lines, languages_used
+        Args:
+            on_report: 报告回调
+            interval: 轮询间隔（秒），也是检查 stop 的间隔
+            stop: 停止事件，为 None 时一直运行直到被中断
+            use_inotify: 是否尝试使用 inotify
+            **analyze_options: 传给 analyze() 的参数
+        """
+        report = self.analyze(**analyze_options)
+
+        assert self._manifest is not None
+        with create_watcher(
+            self.project_path,
+            dirs=self._manifest.dirs,
+            ignore=self._ignore,
+            interval=interval,
+            use_inotify=use_inotify,
+            follow_symlinks=self._options["follow_symlinks"],
+        ) as watcher:
+            # 监听建立后再输出首个报告，避免遗漏期间的变化
+            on_report(report)
+            while stop is None or not stop.is_set():
+                changed = watcher.poll(interval)
+                if not changed:
+                    continue
+                updated = self.update(changed)
+                if updated is not report:
+                    report = updated
+                    on_report(report)
+
+    def _load_ignore_matcher(self) -> IgnoreMatcher:
+        """加载 .gitignore、.git/info/exclude 和 super-dev.yaml 的 exclude 规则"""
+        from ..config.manager import ConfigManager
+
+        exclude: list[str] = []
+        config_manager = ConfigManager(self.project_path)
+        if config_manager.exists():
+            try:
+                exclude = list(config_manager.config.exclude or [])
+            except (TypeError, ValueError, yaml.YAMLError):
+                exclude = []
+
+        return load_ignore_matcher(self.project_path, exclude)
 
-    def _detect_design_patterns(self) -> list[DesignPattern]:
+    def _analyze_directory_structure(
+        self, manifest: FileManifest, max_depth: int = 3
+    ) -> DirectoryView:
         """
-        检测设计模式
+        分析目录结构
+
+        完整目录树以紧凑形式保存，报告中的视图默认只展开到 max_depth 层，
+        可通过 view.expand() 查看更深的层级。
+
+        Args:
+            manifest: 文件清单
+            max_depth: 默认展开的最大深度
 
         Returns:
-            list[DesignPattern]: 检测到的设计模式列表
+            DirectoryView: 目录结构树
         """
-        patterns: list[DesignPattern] = []
+        paths = (
+            entry.rel_path
+            for entry in manifest.files
+            if entry.suffix in STRUCTURE_SUFFIXES
+            # 跳过隐藏文件和目录
+            and not entry.rel_path.startswith(".")
+            and "/." not in entry.rel_path
+        )
+        return DirectoryTree.from_paths(paths).view(max_depth)
 
-        # 根据语言选择检测策略
-        if self.project_path.joinpath("package.json").exists():
-            patterns.extend(self._detect_js_patterns())
-        elif (
-            self.project_path.joinpath("requirements.txt").exists()
-            or self.project_path.joinpath("pyproject.toml").exists()
-        ):
-            patterns.extend(self._detect_python_patterns())
+    def _build_scan_tasks(self, manifest: FileManifest) -> list[ScanTask]:
+        """
+        生成扫描任务
 
-        return patterns
+        所有代码文件都统计行数；设计模式检测的范围与语言由项目类型决定：
+        Node.js 项目检测 src（不存在则为根目录）下的 JS/TS/Vue 文件，
+        Python 项目检测所有 .py 文件。monorepo 中按文件所属成员包分别判断。
 
-    def _detect_js_patterns(self) -> list[DesignPattern]:
-        """检测 JavaScript/TypeScript 设计模式"""
-        patterns: list[DesignPattern] = []
+        Args:
+            manifest: 文件清单
 
-        src_dir = self.project_path / "src"
-        if not src_dir.exists():
-            src_dir = self.project_path
+        Returns:
+            list[ScanTask]: 扫描任务
+        """
+        modes = {rel_dir: self._pattern_mode(rel_dir, manifest) for rel_dir in ("", *self._packages)}
 
-        # 遍历源文件
-        for js_file in src_dir.rglob("*.js"):
-            self._check_file_for_patterns(js_file, patterns, "javascript")
+        tasks: list[ScanTask] = []
+        for entry in manifest.code_files:
+            owner = self._package_of(entry.rel_path) if self._packages else None
+            pattern_mode, src_prefix = modes[owner or ""]
 
-        for ts_file in src_dir.rglob("*.ts"):
-            self._check_file_for_patterns(ts_file, patterns, "typescript")
+            pattern_language = None
+            if pattern_mode == "js" and entry.rel_path.startswith(src_prefix):
+                pattern_language = JS_PATTERN_LANGUAGES.get(entry.suffix)
+            elif pattern_mode == "python" and entry.suffix == ".py":
+                pattern_language = "python"
 
-        for tsx_file in src_dir.rglob("*.tsx"):
-            self._check_file_for_patterns(tsx_file, patterns, "typescript")
+            tasks.append((entry, pattern_language))
 
-        return patterns
+        return tasks
 
-    def _detect_python_patterns(self) -> list[DesignPattern]:
-        """检测 Python 设计模式"""
-        patterns: list[DesignPattern] = []
-
-        for py_file in self.project_path.rglob("*.py"):
-            self._check_file_for_patterns(py_file, patterns, "python")
+    def _pattern_mode(self, rel_dir: str, manifest: FileManifest) -> tuple[str | None, str]:
+        """
+        判断目录（项目根目录或成员包）的设计模式检测策略
 
-        return patterns
+        Returns:
+            (检测模式 js / python / None, JS 检测范围的路径前缀)
+        """
+        manifests = self._package_manifests(rel_dir)
 
-    def _check_file_for_patterns(
-        self, file_path: Path, patterns: list[DesignPattern], language: str
-    ) -> None:
+        # 根据语言选择检测策略
+        pattern_mode = None
+        if manifests.exists("package.json"):
+            pattern_mode = "js"
+        elif manifests.exists("requirements.txt") or manifests.exists("pyproject.toml"):
+            pattern_mode = "python"
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        if "src" in manifest.child_dirs(rel_dir):
+            prefix += "src/"
+        return pattern_mode, prefix
+
+    def _scan(
+        self,
+        tasks: list[ScanTask],
+        workers: int,
+        use_cache: bool,
+        max_file_size: int | None = MAX_FILE_SIZE,
+        on_result: Callable[[FileScanResult], None] | None = None,
+    ) -> list[FileScanResult]:
         """
-        检查文件中的设计模式
+        扫描代码文件，启用缓存时只处理变化的文件
 
         Args:
-            file_path: 文件路径
-            patterns: 模式列表（输出参数）
-            language: 编程语言
+            tasks: 扫描任务
+            workers: 工作进程数
+            use_cache: 是否使用增量缓存
+            max_file_size: 单文件大小上限
+            on_result: 每个文件得到结果后的回调（缓存命中的文件先于新扫描的文件）
+
+        Returns:
+            list[FileScanResult]: 与扫描任务顺序一致的结果
         """
-        try:
-            content = file_path.read_text(encoding="utf-8")
+        if not use_cache:
+            return scan_files(tasks, workers, max_file_size, on_result)
 
-            if language == "python":
-                self._detect_python_ast_patterns(file_path, patterns)
-            else:
-                self._detect_text_based_patterns(file_path, content, patterns)
+        cache = AnalysisCache(self.project_path)
+        cache.load()
 
-        except (IOError, UnicodeDecodeError):
-            pass
+        hits, misses = cache.partition(tasks, max_file_size)
+        if on_result is not None:
+            for index in sorted(hits):
+                on_result(hits[index])
+        scanned = scan_files([tasks[i] for i in misses], workers, max_file_size, on_result)
 
-    def _detect_python_ast_patterns(
-        self, file_path: Path, patterns: list[DesignPattern]
-    ) -> None:
-        """使用 AST 检测 Python 设计模式"""
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=str(file_path))
+        results: list[FileScanResult | None] = [None] * len(tasks)
+        for index, result in hits.items():
+            results[index] = result
+        for index, result in zip(misses, scanned):
+            entry, pattern_language = tasks[index]
+            # 超过大小上限的文件未被读取，不缓存，以便上限调整后重新统计
+            if result.skipped != SKIP_TOO_LARGE:
+                cache.store(entry, pattern_language, result)
+            results[index] = result
 
-            for node in ast.walk(tree):
-                # 检测 Singleton 模式
-                if isinstance(node, ast.ClassDef):
-                    self._check_singleton_class(node, file_path, patterns)
+        cache.prune({entry.rel_path for entry, _ in tasks})
+        cache.save()
 
-                # 检测 Observer 模式
-                if isinstance(node, ast.FunctionDef):
-                    self._check_observer_methods(node, file_path, patterns)
+        return results  # type: ignore[return-value]
 
-        except (SyntaxError, IOError):
-            pass
+    def _count_files_and_lines(
+        self, scan_results: list[FileScanResult]
+    ) -> tuple[int, int, dict[str, int]]:
+        """
+        统计文件数量和代码行数
 
-    def _check_singleton_class(
-        self, class_node: ast.ClassDef, file_path: Path, patterns: list[DesignPattern]
-    ) -> None:
-        """检查 Singleton 模式"""
-        # 查找 _instance 属性
-        has_instance = False
-        has_get_instance = False
-
-        for item in class_node.body:
-            if isinstance(item, ast.AnnAssign):
-                if isinstance(item.target, ast.Name):
-                    if item.target.id == "_instance":
-                        has_instance = True
-
-            if isinstance(item, ast.FunctionDef):
-                if item.name in ["__new__", "get_instance", "instance"]:
-                    has_get_instance = True
-
-        if has_instance or has_get_instance:
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.SINGLETON,
-                    location=file_path,
-                    description=f"类 {class_node.name} 实现了单例模式",
-                )
-            )
+        Args:
+            scan_results: 文件扫描结果
 
-    def _check_observer_methods(
-        self, func_node: ast.FunctionDef, file_path: Path, patterns: list[DesignPattern]
-    ) -> None:
-        """检查 Observer 模式相关方法"""
-        observer_methods = ["attach", "detach", "notify", "subscribe", "unsubscribe"]
-
-        if func_node.name in observer_methods:
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.OBSERVER,
-                    location=file_path,
-                    description=f"方法 {func_node.name} 可能是观察者模式的一部分",
-                    confidence=0.7,
-                )
-            )
+        Returns:
+            tuple: (文件数量, 总行数, 各语言行数)
+        """
+        file_count = 0
+        total_lines = 0
+        languages_used: dict[str, int] = {}
 
-    def _detect_text_based_patterns(
-        self, file_path: Path, content: str, patterns: list[DesignPattern]
-    ) -> None:
-        """基于文本检测设计模式（适用于 JS/TS 等）"""
-
-        # Singleton 检测
-        if "getInstance" in content or ("instance" in content and "private" in content):
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.SINGLETON,
-                    location=file_path,
-                    description="检测到单例模式相关代码",
-                    confidence=0.6,
-                )
-            )
+        for result in scan_results:
+            if result.lines is None or result.language is None:
+                continue
 
-        # Factory 检测
-        if "create" in content and ("Factory" in content or "factory" in content):
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.FACTORY,
-                    location=file_path,
-                    description="检测到工厂模式相关代码",
-                    confidence=0.7,
-                )
+            file_count += 1
+            total_lines += result.lines
+            languages_used[result.language] = (
+                languages_used.get(result.language, 0) + result.lines
             )
 
-        # Observer 检测
-        observer_keywords = ["subscribe", "unsubscribe", "notify", "emit", "addEventListener"]
-        if any(keyword in content for keyword in observer_keywords):
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.OBSERVER,
-                    location=file_path,
-                    description="检测到观察者模式相关代码",
-                    confidence=0.6,
-                )
-            )
+        return file_count, total_lines, languages_used
 
-        # Strategy 检测
-        if "Strategy" in content or ("execute" in content and "context" in content):
-            patterns.append(
-                DesignPattern(
-                    name=PatternType.STRATEGY,
-                    location=file_path,
-                    description="检测到策略模式相关代码",
-                    confidence=0.6,
-                )
-            )
+    def _collect_design_patterns(
+        self, scan_results: list[FileScanResult]
+    ) -> list[DesignPattern]:
+        """
+        汇总设计模式
+
+        Args:
+            scan_results: 文件扫描结果
+
+        Returns:
+            list[DesignPattern]: 检测到的设计模式列表
+        """
+        patterns: list[DesignPattern] = []
+        for result in scan_results:
+            patterns.extend(result.patterns)
+        return patterns
 
     def get_summary(self) -> str:
         """
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 多仓库批量分析
+
+在一个有界进程池中并发分析多个仓库（工作进程复用，避免每个仓库启动一次解释器），
+按完成顺序逐个回调结果，最后汇总跨仓库的项目类型、技术栈、语言和依赖分布。
+"""
+
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .models import ArchitectureReport, FrameworkType
+from .scanner import resolve_workers
+
+
+@dataclass
+class BatchResult:
+    """单个仓库的分析结果"""
+
+    path: Path
+    report: ArchitectureReport | None = None
+    error: str | None = None  # 分析失败时的错误信息
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.report is not None
+
+    def to_dict(self) -> dict:
+        """转换为字典（不含完整报告，只保留汇总字段）"""
+        data: dict = {
+            "path": str(self.path),
+            "ok": self.ok,
+            "error": self.error,
+            "seconds": round(self.seconds, 3),
+        }
+        if self.report is not None:
+            data.update({
+                "category": self.report.category.value,
+                "language": self.report.tech_stack.language,
+                "framework": _framework_name(self.report),
+                "file_count": self.report.file_count,
+                "total_lines": self.report.total_lines,
+            })
+        return data
+
+
+@dataclass
+class BatchReport:
+    """跨仓库汇总报告"""
+
+    repositories: int = 0
+    failures: dict[str, str] = field(default_factory=dict)  # 仓库路径 -> 错误信息
+    total_files: int = 0
+    total_lines: int = 0
+    categories: dict[str, int] = field(default_factory=dict)  # 项目类型 -> 仓库数
+    languages: dict[str, int] = field(default_factory=dict)  # 主语言 -> 仓库数
+    frameworks: dict[str, int] = field(default_factory=dict)  # 框架 -> 仓库数
+    language_lines: dict[str, int] = field(default_factory=dict)  # 语言 -> 代码行数
+    dependencies: dict[str, int] = field(default_factory=dict)  # 依赖 -> 使用的仓库数（前 50）
+    seconds: float = 0.0  # 各仓库分析耗时之和
+
+    @property
+    def succeeded(self) -> int:
+        return self.repositories - len(self.failures)
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "repositories": self.repositories,
+            "succeeded": self.succeeded,
+            "failures": self.failures,
+            "total_files": self.total_files,
+            "total_lines": self.total_lines,
+            "categories": self.categories,
+            "languages": self.languages,
+            "frameworks": self.frameworks,
+            "language_lines": self.language_lines,
+            "dependencies": self.dependencies,
+            "seconds": round(self.seconds, 3),
+        }
+
+    def to_markdown(self) -> str:
+        """生成 Markdown 报告"""
+        lines = [
+            "# 多仓库分析汇总",
+            "",
+            f"- **仓库数**: {self.repositories}（成功 {self.succeeded}，失败 {len(self.failures)}）",
+            f"- **文件数量**: {self.total_files:,}",
+            f"- **代码行数**: {self.total_lines:,}",
+            f"- **累计耗时**: {self.seconds:.1f}s",
+        ]
+
+        for title, counts in (
+            ("项目类型分布", self.categories),
+            ("主语言分布", self.languages),
+            ("框架分布", self.frameworks),
+        ):
+            if counts:
+                lines.extend(["", f"## {title}", "", "| 名称 | 仓库数 |", "|------|--------|"])
+                lines.extend(f"| {name} | {count} |" for name, count in counts.items())
+
+        if self.language_lines:
+            lines.extend(["", "## 语言代码行数", "", "| 语言 | 行数 | 占比 |", "|------|------|------|"])
+            for language, count in self.language_lines.items():
+                percentage = count / self.total_lines * 100 if self.total_lines else 0
+                lines.append(f"| {language} | {count:,} | {percentage:.1f}% |")
+
+        if self.dependencies:
+            lines.extend(["", "## 常用依赖", ""])
+            lines.extend(f"- {name}: {count} 个仓库" for name, count in self.dependencies.items())
+
+        if self.failures:
+            lines.extend(["", "## 分析失败", ""])
+            lines.extend(f"- `{path}`: {error}" for path, error in self.failures.items())
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _framework_name(report: ArchitectureReport) -> str:
+    framework = report.tech_stack.framework
+    return framework.value if isinstance(framework, FrameworkType) else str(framework)
+
+
+def analyze_repository(path: str | Path, analyze_options: dict | None = None) -> BatchResult:
+    """
+    分析单个仓库（进程池工作单元），异常转为错误信息
+
+    Args:
+        path: 仓库路径
+        analyze_options: 传给 ProjectAnalyzer.analyze() 的参数
+
+    Returns:
+        BatchResult: 分析结果
+    """
+    from .analyzer import ProjectAnalyzer
+
+    started = time.perf_counter()
+    try:
+        report = ProjectAnalyzer(path).analyze(**(analyze_options or {}))
+    except Exception as e:
+        return BatchResult(
+            path=Path(path),
+            error=f"{type(e).__name__}: {e}",
+            seconds=time.perf_counter() - started,
+        )
+    return BatchResult(path=Path(path), report=report, seconds=time.perf_counter() - started)
+
+
+def analyze_many(
+    paths: Iterable[str | Path],
+    jobs: int = 0,
+    on_result: Callable[[BatchResult], None] | None = None,
+    **analyze_options,
+) -> list[BatchResult]:
+    """
+    并发分析多个仓库
+
+    每个仓库在一个工作进程中单进程分析（仓库间并行），
+    jobs 为 1 时在当前进程中依次分析。
+
+    Args:
+        paths: 仓库路径
+        jobs: 同时分析的仓库数，0 表示使用全部 CPU
+        on_result: 每个仓库完成后立即调用（按完成顺序）
+        **analyze_options: 传给 analyze() 的参数（workers 默认为 1）
+
+    Returns:
+        list[BatchResult]: 与 paths 顺序一致的结果
+    """
+    paths = [Path(p) for p in paths]
+    analyze_options.setdefault("workers", 1)
+    jobs = min(resolve_workers(jobs), max(1, len(paths)))
+
+    results: list[BatchResult | None] = [None] * len(paths)
+    if jobs <= 1:
+        for index, path in enumerate(paths):
+            results[index] = analyze_repository(path, analyze_options)
+            if on_result is not None:
+                on_result(results[index])
+        return results  # type: ignore[return-value]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(analyze_repository, path, analyze_options): index
+            for index, path in enumerate(paths)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # 工作进程异常退出等
+                result = BatchResult(path=paths[index], error=f"{type(e).__name__}: {e}")
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+
+    return results  # type: ignore[return-value]
+
+
+def aggregate_results(results: Iterable[BatchResult], top_dependencies: int = 50) -> BatchReport:
+    """
+    汇总多个仓库的分析结果
+
+    Args:
+        results: 各仓库的分析结果
+        top_dependencies: 保留使用最广的依赖数
+
+    Returns:
+        BatchReport: 汇总报告（各分布按数量降序）
+    """
+    summary = BatchReport()
+    categories: Counter[str] = Counter()
+    languages: Counter[str] = Counter()
+    frameworks: Counter[str] = Counter()
+    language_lines: Counter[str] = Counter()
+    dependencies: Counter[str] = Counter()
+
+    for result in results:
+        summary.repositories += 1
+        summary.seconds += result.seconds
+        if result.report is None:
+            summary.failures[str(result.path)] = result.error or "unknown error"
+            continue
+
+        report = result.report
+        summary.total_files += report.file_count
+        summary.total_lines += report.total_lines
+        categories[report.category.value] += 1
+        languages[report.tech_stack.language] += 1
+        frameworks[_framework_name(report)] += 1
+        language_lines.update(report.languages_used)
+        dependencies.update({dep.name for dep in report.tech_stack.dependencies})
+
+    summary.categories = dict(categories.most_common())
+    summary.languages = dict(languages.most_common())
+    summary.frameworks = dict(frameworks.most_common())
+    summary.language_lines = dict(language_lines.most_common())
+    summary.dependencies = dict(dependencies.most_common(top_dependencies))
+    return summary
+
+
+def read_batch_file(path: str | Path) -> list[Path]:
+    """
+    读取仓库列表文件
+
+    每行一个路径，忽略空行和 # 注释；相对路径相对于列表文件所在目录。
+
+    Args:
+        path: 列表文件路径
+
+    Returns:
+        list[Path]: 仓库路径
+    """
+    path = Path(path)
+    base = path.resolve().parent
+    repositories: list[Path] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            repositories.append(base / Path(line).expanduser())
+    return repositories
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 增量分析缓存
+
+在 .super-dev/cache/ 中按文件保存行数、语言、设计模式和导入语句，
+以 (路径, 大小, mtime_ns) 为键，mtime 变化但大小不变时再比对内容哈希，
+再次分析时只处理发生变化的文件。
+"""
+
+import json
+import os
+from pathlib import Path
+
+from .manifest import FileEntry
+from .models import DesignPattern
+from .scanner import MAX_FILE_SIZE, FileScanResult, ScanTask, file_digest
+
+
+# 缓存格式版本，检测逻辑变化时递增以使旧缓存失效
+CACHE_VERSION = 5
+
+CACHE_DIR = Path(".super-dev") / "cache"
+CACHE_FILENAME = "analysis.json"
+
+
+class AnalysisCache:
+    """按文件的分析结果缓存"""
+
+    def __init__(self, project_path: str | Path, cache_dir: str | Path | None = None):
+        """
+        初始化缓存
+
+        Args:
+            project_path: 项目根目录
+            cache_dir: 缓存目录，默认为 <project>/.super-dev/cache
+        """
+        self.project_path = Path(project_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_path / CACHE_DIR
+        self.path = self.cache_dir / CACHE_FILENAME
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """加载缓存文件，版本不匹配或损坏时视为空缓存"""
+        self._entries = {}
+        if not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = data.get("files", {})
+
+    def save(self) -> None:
+        """原子写入缓存文件（无变化时跳过）"""
+        if not self._dirty:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "files": self._entries},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def lookup(
+        self,
+        entry: FileEntry,
+        pattern_language: str | None,
+        max_size: int | None = MAX_FILE_SIZE,
+    ) -> FileScanResult | None:
+        """
+        查找未变化文件的缓存结果
+
+        Args:
+            entry: 清单条目
+            pattern_language: 设计模式检测语言（与缓存时不同则失效）
+            max_size: 当前的单文件大小上限，超过上限的文件视为未命中（由扫描按上限跳过）
+
+        Returns:
+            命中时返回扫描结果，否则返回 None
+        """
+        if max_size is not None and entry.size > max_size:
+            return None
+        record = self._entries.get(entry.rel_path)
+        if record is None or record.get("size") != entry.size:
+            return None
+        if record.get("pattern_language") != pattern_language:
+            return None
+
+        if record.get("mtime_ns") != entry.mtime_ns:
+            # 大小相同但 mtime 变化（如 git checkout），比对内容哈希
+            if not record.get("digest") or self._read_digest(entry.path) != record["digest"]:
+                return None
+            record["mtime_ns"] = entry.mtime_ns
+            self._dirty = True
+
+        return FileScanResult(
+            rel_path=entry.rel_path,
+            language=record.get("language"),
+            lines=record.get("lines"),
+            patterns=[DesignPattern.from_dict(p) for p in record.get("patterns", [])],
+            digest=record.get("digest"),
+            skipped=record.get("skipped"),
+            imports=record.get("imports", []),
+        )
+
+    def store(
+        self, entry: FileEntry, pattern_language: str | None, result: FileScanResult
+    ) -> None:
+        """写入单个文件的扫描结果"""
+        self._entries[entry.rel_path] = {
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
+            "digest": result.digest,
+            "pattern_language": pattern_language,
+            "language": result.language,
+            "lines": result.lines,
+            "patterns": [p.to_dict() for p in result.patterns],
+            "skipped": result.skipped,
+            "imports": result.imports,
+        }
+        self._dirty = True
+
+    def prune(self, rel_paths: set[str]) -> None:
+        """删除已不存在文件的缓存记录"""
+        stale = [path for path in self._entries if path not in rel_paths]
+        for path in stale:
+            del self._entries[path]
+        if stale:
+            self._dirty = True
+
+    def partition(
+        self, tasks: list[ScanTask], max_size: int | None = MAX_FILE_SIZE
+    ) -> tuple[dict[int, FileScanResult], list[int]]:
+        """
+        将任务划分为缓存命中与需要扫描两部分
+
+        Args:
+            tasks: 扫描任务
+            max_size: 当前的单文件大小上限
+
+        Returns:
+            (命中结果: 任务下标 -> 结果, 未命中的任务下标)
+        """
+        hits: dict[int, FileScanResult] = {}
+        misses: list[int] = []
+        for index, (entry, pattern_language) in enumerate(tasks):
+            cached = self.lookup(entry, pattern_language, max_size)
+            if cached is None:
+                misses.append(index)
+            else:
+                hits[index] = cached
+        return hits, misses
+
+    def _read_digest(self, path: str) -> str | None:
+        """读取文件并计算内容哈希"""
+        try:
+            with open(path, "rb") as f:
+                return file_digest(f.read())
+        except OSError:
+            return None
@@ -4,20 +4,12 @@ Super Dev 项目类型检测器
 """
 
 import ast
-import json
 import re
 from pathlib import Path
 from typing import Literal
 
-# 尝试导入 TOML 解析库
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    try:
-        import tomli as tomllib  # Python < 3.11
-    except ImportError:
-        tomllib = None
-
+from .manifest import FileManifest
+from .package_manifests import PackageManifests
 from .models import (
     ArchitecturePattern,
     Dependency,
@@ -27,145 +19,98 @@ from .models import (
 )
 
 
-def detect_project_type(project_path: Path) -> ProjectCategory:
+def detect_project_type(
+    project_path: Path, manifests: PackageManifests | None = None
+) -> ProjectCategory:
     """
     检测项目类型
 
     Args:
         project_path: 项目根目录路径
+        manifests: 已解析的清单文件（提供时与其他检测器共享解析结果）
 
     Returns:
         ProjectCategory: 项目类型
     """
     project_path = Path(project_path).resolve()
-
-    # 检查关键文件
-    package_json = project_path / "package.json"
-    requirements_txt = project_path / "requirements.txt"
-    pyproject_toml = project_path / "pyproject.toml"
-    go_mod = project_path / "go.mod"
-    cargo_toml = project_path / "Cargo.toml"
-    pom_xml = project_path / "pom.xml"
-    build_gradle = project_path / "build.gradle"
-    gemfile = project_path / "Gemfile"
-    composer_json = project_path / "composer.json"
+    if manifests is None:
+        manifests = PackageManifests(project_path)
 
     # 检测前后端项目
-    if package_json.exists():
-        return _detect_node_project_type(project_path)
+    if manifests.exists("package.json"):
+        return _detect_node_project_type(manifests)
 
-    if requirements_txt.exists() or pyproject_toml.exists():
-        return _detect_python_project_type(project_path)
+    if manifests.exists("requirements.txt") or manifests.exists("pyproject.toml"):
+        return _detect_python_project_type(manifests)
 
-    if go_mod.exists():
+    if manifests.exists("go.mod"):
         return ProjectCategory.BACKEND
 
-    if cargo_toml.exists():
+    if manifests.exists("Cargo.toml"):
         return ProjectCategory.BACKEND
 
-    if pom_xml.exists() or build_gradle.exists():
+    if manifests.exists("pom.xml") or manifests.exists("build.gradle"):
         return ProjectCategory.BACKEND
 
-    if gemfile.exists():
+    if manifests.exists("Gemfile"):
         return ProjectCategory.BACKEND
 
-    if composer_json.exists():
+    if manifests.exists("composer.json"):
         # 可能是前端或后端
-        return __detect_php_project_type(project_path)
+        return _detect_php_project_type(manifests)
 
     # 检查是否有 Android/iOS 项目
-    if (project_path / "android").exists() or (project_path / "ios").exists():
+    if manifests.exists("android") or manifests.exists("ios"):
         return ProjectCategory.MOBILE
 
-    # 检查 Electron 项目
-    if package_json.exists():
-        try:
-            with open(package_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                deps = data.get("dependencies", {})
-                dev_deps = data.get("devDependencies", {})
-
-                if "electron" in deps or "electron" in dev_deps:
-                    return ProjectCategory.DESKTOP
-        except (json.JSONDecodeError, IOError):
-            pass
-
     return ProjectCategory.UNKNOWN
 
 
-def _detect_node_project_type(project_path: Path) -> ProjectCategory:
+def _detect_node_project_type(manifests: PackageManifests) -> ProjectCategory:
     """检测 Node.js 项目类型"""
-    package_json = project_path / "package.json"
-
-    try:
-        with open(package_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            deps = data.get("dependencies", {})
-            dev_deps = data.get("devDependencies", {})
+    if manifests.package_json is None:
+        return ProjectCategory.UNKNOWN
 
-            all_deps = {**deps, **dev_deps}
+    deps, dev_deps = manifests.node_dependencies
+    all_deps = {**deps, **dev_deps}
 
-            # 检测前端框架
-            frontend_frameworks = [
-                "react", "react-dom", "vue", "vue-router", "@angular/core",
-                "angular", "svelte", "next", "nuxt", "@remix-run/react",
-            ]
+    # 检测前端框架
+    frontend_frameworks = [
+        "react", "react-dom", "vue", "vue-router", "@angular/core",
+        "angular", "svelte", "next", "nuxt", "@remix-run/react",
+    ]
 
-            has_frontend = any(fw in all_deps for fw in frontend_frameworks)
+    has_frontend = any(fw in all_deps for fw in frontend_frameworks)
 
-            # 检测后端框架
-            backend_frameworks = [
-                "express", "fastify", "koa", "nest", "@nestjs/common",
-                "hapi", "feathers", "socket.io",
-            ]
+    # 检测后端框架
+    backend_frameworks = [
+        "express", "fastify", "koa", "nest", "@nestjs/common",
+        "hapi", "feathers", "socket.io",
+    ]
 
-            has_backend = any(bw in all_deps for bw in backend_frameworks)
+    has_backend = any(bw in all_deps for bw in backend_frameworks)
 
-            if has_frontend and has_backend:
-                return ProjectCategory.FULLSTACK
-            elif has_frontend:
-                return ProjectCategory.FRONTEND
-            elif has_backend:
-                return ProjectCategory.BACKEND
+    if has_frontend and has_backend:
+        return ProjectCategory.FULLSTACK
+    elif has_frontend:
+        return ProjectCategory.FRONTEND
+    elif has_backend:
+        return ProjectCategory.BACKEND
 
-            # 检查是否是 serverless
-            if "serverless" in all_deps or "aws-lambda" in all_deps:
-                return ProjectCategory.SERVERLESS
+    # 检查桌面应用
+    if "electron" in all_deps:
+        return ProjectCategory.DESKTOP
 
-            return ProjectCategory.BACKEND  # 默认为后端
+    # 检查是否是 serverless
+    if "serverless" in all_deps or "aws-lambda" in all_deps:
+        return ProjectCategory.SERVERLESS
 
-    except (json.JSONDecodeError, IOError):
-        return ProjectCategory.UNKNOWN
+    return ProjectCategory.BACKEND  # 默认为后端
 
 
-def _detect_python_project_type(project_path: Path) -> ProjectCategory:
+def _detect_python_project_type(manifests: PackageManifests) -> ProjectCategory:
     """检测 Python 项目类型"""
-    requirements_txt = project_path / "requirements.txt"
-    pyproject_toml = project_path / "pyproject.toml"
-
-    dependencies = set()
-
-    if requirements_txt.exists():
-        try:
-            with open(requirements_txt, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # 提取包名
-                        match = re.match(r"^([a-zA-Z0-9_-]+)", line)
-                        if match:
-                            dependencies.add(match.group(1).lower())
-        except IOError:
-            pass
-
-    if pyproject_toml.exists() and tomllib is not None:
-        try:
-            with open(pyproject_toml, "rb") as f:
-                data = tomllib.load(f)
-                deps = data.get("project", {}).get("dependencies", [])
-                dependencies.update(d.lower().split(">=")[0].split("==")[0] for d in deps)
-        except Exception:
-            pass
+    dependencies = manifests.python_dependency_names
 
     # 检测 Web 框架
     web_frameworks = {
@@ -191,54 +136,46 @@ def _detect_python_project_type(project_path: Path) -> ProjectCategory:
     return ProjectCategory.BACKEND
 
 
-def _detect_php_project_type(project_path: Path) -> ProjectCategory:
+def _detect_php_project_type(manifests: PackageManifests) -> ProjectCategory:
     """检测 PHP 项目类型"""
-    composer_json = project_path / "composer.json"
-
-    try:
-        with open(composer_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            deps = data.get("require", {})
+    deps = (manifests.composer_json or {}).get("require", {})
 
-            # Laravel/Symfony 等通常是后端
-            if any(fw in deps for fw in ["laravel/framework", "symfony/http-kernel"]):
-                return ProjectCategory.BACKEND
-
-    except (json.JSONDecodeError, IOError):
-        pass
+    # Laravel/Symfony 等通常是后端
+    if any(fw in deps for fw in ["laravel/framework", "symfony/http-kernel"]):
+        return ProjectCategory.BACKEND
 
     return ProjectCategory.BACKEND
 
 
-def detect_tech_stack(project_path: Path) -> TechStack:
+def detect_tech_stack(
+    project_path: Path, manifests: PackageManifests | None = None
+) -> TechStack:
     """
     检测技术栈
 
     Args:
         project_path: 项目根目录路径
+        manifests: 已解析的清单文件（提供时与其他检测器共享解析结果）
 
     Returns:
         TechStack: 技术栈信息
     """
     project_path = Path(project_path).resolve()
-    category = detect_project_type(project_path)
-
-    package_json = project_path / "package.json"
-    requirements_txt = project_path / "requirements.txt"
-    pyproject_toml = project_path / "pyproject.toml"
-    go_mod = project_path / "go.mod"
+    if manifests is None:
+        manifests = PackageManifests(project_path)
+    category = detect_project_type(project_path, manifests)
 
     # Node.js 项目
-    if package_json.exists():
-        return _detect_node_tech_stack(project_path, category)
+    if manifests.exists("package.json"):
+        return _detect_node_tech_stack(manifests, category)
 
     # Python 项目
-    if requirements_txt.exists() or pyproject_toml.exists():
-        return _detect_python_tech_stack(project_path, category)
+    if manifests.exists("requirements.txt") or manifests.exists("pyproject.toml"):
+        return _detect_python_tech_stack(manifests, category)
 
     # Go 项目
-    if go_mod.exists():
-        return _detect_go_tech_stack(project_path, category)
+    if manifests.exists("go.mod"):
+        return _detect_go_tech_stack(manifests, category)
 
     # 默认返回
     return TechStack(
@@ -248,142 +185,125 @@ def detect_tech_stack(project_path: Path) -> TechStack:
     )
 
 
-def _detect_node_tech_stack(project_path: Path, category: ProjectCategory) -> TechStack:
+def _detect_node_tech_stack(manifests: PackageManifests, category: ProjectCategory) -> TechStack:
     """检测 Node.js 技术栈"""
-    package_json = project_path / "package.json"
-
-    try:
-        with open(package_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            deps = data.get("dependencies", {})
-            dev_deps = data.get("devDependencies", {})
-
-            all_deps = {**deps, **dev_deps}
-
-            # 检测框架
-            framework = FrameworkType.UNKNOWN
-            if "next" in all_deps:
-                framework = FrameworkType.NEXTJS
-            elif "nuxt" in all_deps:
-                framework = FrameworkType.NUXT
-            elif "@remix-run/react" in all_deps:
-                framework = FrameworkType.REMIX
-            elif "react" in all_deps or "react-dom" in all_deps:
-                framework = FrameworkType.REACT
-            elif "vue" in all_deps:
-                framework = FrameworkType.VUE
-            elif "@angular/core" in all_deps or "angular" in all_deps:
-                framework = FrameworkType.ANGULAR
-            elif "svelte" in all_deps:
-                framework = FrameworkType.SVELTE
-            elif "express" in all_deps:
-                framework = FrameworkType.EXPRESS
-
-            # 检测 UI 库
-            ui_library = ""
-            ui_libraries = [
-                "@mui/material", "@chakra-ui/react", "@mantine/core",
-                "antd", "react-bootstrap", "tailwindcss",
-                "element-plus", "vuetify", "antd-mobile",
-            ]
-            for lib in ui_libraries:
-                if lib in all_deps:
-                    ui_library = lib
-                    break
-
-            # 检测状态管理
-            state_management = ""
-            state_libs = [
-                "redux", "@reduxjs/toolkit", "zustand", "jotai",
-                "recoil", "mobx", "pinia", "vuex",
-            ]
-            for lib in state_libs:
-                if lib in all_deps:
-                    state_management = lib
-                    break
-
-            # 检测构建工具
-            build_tool = ""
-            build_tools = [
-                "vite", "webpack", "rollup", "parcel",
-                "esbuild", "turbo",
-            ]
-            for tool in build_tools:
-                if tool in all_deps:
-                    build_tool = tool
-                    break
-
-            # 检测测试框架
-            testing_framework = ""
-            test_frameworks = [
-                "jest", "vitest", "@testing-library/react",
-                "mocha", "chai", "jasmine",
-            ]
-            for fw in test_frameworks:
-                if fw in all_deps:
-                    testing_framework = fw
-                    break
-
-            # 解析依赖
-            dependencies = []
-            for name, version in deps.items():
-                dependencies.append(
-                    Dependency(
-                        name=name,
-                        version=str(version),
-                        type="prod",
-                    )
-                )
-
-            return TechStack(
-                category=category,
-                language="javascript" if framework != FrameworkType.NEXTJS else "typescript",
-                framework=framework,
-                ui_library=ui_library,
-                state_management=state_management,
-                build_tool=build_tool,
-                testing_framework=testing_framework,
-                dependencies=dependencies,
-            )
-
-    except (json.JSONDecodeError, IOError):
+    if manifests.package_json is None:
         return TechStack(
             category=category,
             language="javascript",
             framework=FrameworkType.UNKNOWN,
         )
 
+    deps, dev_deps = manifests.node_dependencies
+    all_deps = {**deps, **dev_deps}
 
-def _detect_python_tech_stack(project_path: Path, category: ProjectCategory) -> TechStack:
-    """检测 Python 技术栈"""
-    requirements_txt = project_path / "requirements.txt"
-    pyproject_toml = project_path / "pyproject.toml"
+    # 检测框架
+    framework = FrameworkType.UNKNOWN
+    if "next" in all_deps:
+        framework = FrameworkType.NEXTJS
+    elif "nuxt" in all_deps:
+        framework = FrameworkType.NUXT
+    elif "@remix-run/react" in all_deps:
+        framework = FrameworkType.REMIX
+    elif "react" in all_deps or "react-dom" in all_deps:
+        framework = FrameworkType.REACT
+    elif "vue" in all_deps:
+        framework = FrameworkType.VUE
+    elif "@angular/core" in all_deps or "angular" in all_deps:
+        framework = FrameworkType.ANGULAR
+    elif "svelte" in all_deps:
+        framework = FrameworkType.SVELTE
+    elif "express" in all_deps:
+        framework = FrameworkType.EXPRESS
+
+    # 检测 UI 库
+    ui_library = ""
+    ui_libraries = [
+        "@mui/material", "@chakra-ui/react", "@mantine/core",
+        "antd", "react-bootstrap", "tailwindcss",
+        "element-plus", "vuetify", "antd-mobile",
+    ]
+    for lib in ui_libraries:
+        if lib in all_deps:
+            ui_library = lib
+            break
+
+    # 检测状态管理
+    state_management = ""
+    state_libs = [
+        "redux", "@reduxjs/toolkit", "zustand", "jotai",
+        "recoil", "mobx", "pinia", "vuex",
+    ]
+    for lib in state_libs:
+        if lib in all_deps:
+            state_management = lib
+            break
+
+    # 检测构建工具
+    build_tool = ""
+    build_tools = [
+        "vite", "webpack", "rollup", "parcel",
+        "esbuild", "turbo",
+    ]
+    for tool in build_tools:
+        if tool in all_deps:
+            build_tool = tool
+            break
+
+    # 检测测试框架
+    testing_framework = ""
+    test_frameworks = [
+        "jest", "vitest", "@testing-library/react",
+        "mocha", "chai", "jasmine",
+    ]
+    for fw in test_frameworks:
+        if fw in all_deps:
+            testing_framework = fw
+            break
 
+    # 解析依赖
+    dependencies = []
+    for name, version in deps.items():
+        dependencies.append(
+            Dependency(
+                name=name,
+                version=str(version),
+                type="prod",
+            )
+        )
+
+    return TechStack(
+        category=category,
+        language="javascript" if framework != FrameworkType.NEXTJS else "typescript",
+        framework=framework,
+        ui_library=ui_library,
+        state_management=state_management,
+        build_tool=build_tool,
+        testing_framework=testing_framework,
+        dependencies=dependencies,
+    )
+
+
+def _detect_python_tech_stack(manifests: PackageManifests, category: ProjectCategory) -> TechStack:
+    """检测 Python 技术栈"""
     dependencies = []
     framework = FrameworkType.UNKNOWN
     testing_framework = ""
 
     # 解析依赖
-    if requirements_txt.exists():
-        try:
-            with open(requirements_txt, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # 解析 requirement
-                        match = re.match(r"^([a-zA-Z0-9_-]+)([>=<~]+(.+))?", line)
-                        if match:
-                            name = match.group(1)
-                            version = match.group(3) or ""
-                            dependencies.append(
-                                Dependency(
-                                    name=name,
-                                    version=version,
-                                    type="prod",
-                                )
-                            )
-        except IOError:
-            pass
+    for line in manifests.requirements:
+        # 解析 requirement
+        match = re.match(r"^([a-zA-Z0-9_-]+)([>=<~]+(.+))?", line)
+        if match:
+            name = match.group(1)
+            version = match.group(3) or ""
+            dependencies.append(
+                Dependency(
+                    name=name,
+                    version=version,
+                    type="prod",
+                )
+            )
 
     # 检测框架
     dep_names = {d.name.lower() for d in dependencies}
@@ -411,77 +331,83 @@ def _detect_python_tech_stack(project_path: Path, category: ProjectCategory) ->
     )
 
 
-def _detect_go_tech_stack(project_path: Path, category: ProjectCategory) -> TechStack:
+def _detect_go_tech_stack(manifests: PackageManifests, category: ProjectCategory) -> TechStack:
     """检测 Go 技术栈"""
-    go_mod = project_path / "go.mod"
-
-    dependencies = []
-
-    try:
-        with open(go_mod, "r", encoding="utf-8") as f:
-            content = f.read()
-            # 解析 require 部分
-            require_match = re.search(r"require \((.*?)\)", content, re.DOTALL)
-            if require_match:
-                for line in require_match.group(1).split("\n"):
-                    line = line.strip()
-                    match = re.match(r"^([^\s]+)\s+([^\s]+)", line)
-                    if match:
-                        dependencies.append(
-                            Dependency(
-                                name=match.group(1),
-                                version=match.group(2),
-                                type="prod",
-                            )
-                        )
-
-        # 检测框架
-        dep_names = {d.name.lower() for d in dependencies}
-
-        framework = FrameworkType.UNKNOWN
-        if "github.com/gin-gonic/gin" in dep_names:
-            framework = FrameworkType.GIN
-        elif "github.com/labstack/echo/v4" in dep_names:
-            framework = FrameworkType.ECHO
-
-        return TechStack(
-            category=category,
-            language="go",
-            framework=framework,
-            dependencies=dependencies,
-        )
-
-    except IOError:
+    content = manifests.go_mod
+    if content is None:
         return TechStack(
             category=category,
             language="go",
             framework=FrameworkType.UNKNOWN,
         )
 
+    dependencies = []
+
+    # 解析 require 部分
+    require_match = re.search(r"require \((.*?)\)", content, re.DOTALL)
+    if require_match:
+        for line in require_match.group(1).split("\n"):
+            line = line.strip()
+            match = re.match(r"^([^\s]+)\s+([^\s]+)", line)
+            if match:
+                dependencies.append(
+                    Dependency(
+                        name=match.group(1),
+                        version=match.group(2),
+                        type="prod",
+                    )
+                )
+
+    # 检测框架
+    dep_names = {d.name.lower() for d in dependencies}
+
+    framework = FrameworkType.UNKNOWN
+    if "github.com/gin-gonic/gin" in dep_names:
+        framework = FrameworkType.GIN
+    elif "github.com/labstack/echo/v4" in dep_names:
+        framework = FrameworkType.ECHO
+
+    return TechStack(
+        category=category,
+        language="go",
+        framework=framework,
+        dependencies=dependencies,
+    )
+
 
-def detect_architecture_pattern(project_path: Path) -> ArchitecturePattern | None:
+def detect_architecture_pattern(
+    project_path: Path,
+    manifest: FileManifest | None = None,
+    manifests: PackageManifests | None = None,
+) -> ArchitecturePattern | None:
     """
     检测架构模式
 
     Args:
         project_path: 项目根目录路径
+        manifest: 文件清单（提供时不再访问文件系统列目录）
+        manifests: 已解析的清单文件
 
     Returns:
         ArchitecturePattern | None: 架构模式
     """
     project_path = Path(project_path).resolve()
-    package_json = project_path / "package.json"
+    if manifests is None:
+        manifests = PackageManifests(project_path)
 
     # 检查目录结构
-    dirs = [d.name for d in project_path.iterdir() if d.is_dir()]
+    if manifest is not None:
+        dirs = manifest.child_dirs()
+    else:
+        dirs = [d.name for d in project_path.iterdir() if d.is_dir()]
 
     # 微服务架构
     if "services" in dirs or "microservices" in dirs:
         return ArchitecturePattern.MICROSERVICES
 
     # 检查 Node.js 项目架构
-    if package_json.exists():
-        return _detect_node_architecture(project_path, dirs)
+    if manifests.exists("package.json"):
+        return _detect_node_architecture(project_path, dirs, manifest)
 
     # 分层架构（默认）
     if any(d in dirs for d in ["src", "lib", "app", "server"]):
@@ -490,12 +416,17 @@ def detect_architecture_pattern(project_path: Path) -> ArchitecturePattern | Non
     return None
 
 
-def _detect_node_architecture(project_path: Path, dirs: list[str]) -> ArchitecturePattern | None:
+def _detect_node_architecture(
+    project_path: Path, dirs: list[str], manifest: FileManifest | None = None
+) -> ArchitecturePattern | None:
     """检测 Node.js 项目架构"""
     src_dir = project_path / "src"
 
-    if src_dir.exists():
-        src_dirs = [d.name for d in src_dir.iterdir() if d.is_dir()]
+    if "src" in dirs:
+        if manifest is not None:
+            src_dirs = manifest.child_dirs("src")
+        else:
+            src_dirs = [d.name for d in src_dir.iterdir() if d.is_dir()]
 
         # MVC/MVVM 检测
         has_models = "models" in src_dirs or "entities" in src_dirs
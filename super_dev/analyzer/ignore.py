@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 忽略规则匹配器
+
+将 .gitignore、.git/info/exclude 和 super-dev.yaml 的 exclude 列表
+编译为正则表达式，在遍历时整体剪枝被忽略的目录。
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class IgnoreRule:
+    """单条忽略规则"""
+
+    pattern: str
+    regex: re.Pattern
+    negate: bool = False
+    dir_only: bool = False
+
+
+def _translate_glob(pattern: str) -> str:
+    """将 gitignore 通配符转换为正则表达式（不含锚点）"""
+    result: list[str] = []
+    i = 0
+    n = len(pattern)
+
+    while i < n:
+        char = pattern[i]
+
+        if char == "*":
+            if pattern.startswith("**", i):
+                before_ok = i == 0 or pattern[i - 1] == "/"
+                after = pattern[i + 2:i + 3]
+                if before_ok and after == "/":
+                    # "**/" 匹配零或多级目录
+                    result.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if before_ok and i + 2 == n:
+                    # 末尾 "**" 匹配其下所有内容
+                    result.append(".*")
+                    i += 2
+                    continue
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                result.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                result.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(char))
+        i += 1
+
+    return "".join(result)
+
+
+def compile_rule(line: str) -> IgnoreRule | None:
+    """
+    编译单行 gitignore 规则
+
+    Args:
+        line: 规则文本
+
+    Returns:
+        IgnoreRule，空行和注释返回 None
+    """
+    raw = line.rstrip("\n").rstrip("\r")
+    if not raw.strip() or raw.startswith("#"):
+        return None
+
+    # 去掉未转义的尾部空白
+    pattern = raw.rstrip()
+    if raw.endswith("\\ "):
+        pattern = raw[:-2].rstrip() + "\\ "
+
+    negate = False
+    if pattern.startswith("!"):
+        negate = True
+        pattern = pattern[1:]
+    elif pattern.startswith("\\!") or pattern.startswith("\\#"):
+        pattern = pattern[1:]
+
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+
+    # 包含 "/" 的规则相对于 .gitignore 所在目录锚定，否则匹配任意层级
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    body = _translate_glob(pattern)
+    prefix = "" if anchored else "(?:.*/)?"
+    regex = re.compile(f"^{prefix}{body}$")
+
+    return IgnoreRule(pattern=raw.strip(), regex=regex, negate=negate, dir_only=dir_only)
+
+
+@dataclass
+class IgnoreRuleSet:
+    """某个目录下定义的规则集合"""
+
+    base: str  # 规则所在目录（相对项目根目录），根目录为空字符串
+    rules: list[IgnoreRule] = field(default_factory=list)
+    # 没有否定规则时合并为单个正则
+    _combined: re.Pattern | None = field(default=None, init=False, repr=False)
+    _combined_dirs: re.Pattern | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rules and not any(rule.negate for rule in self.rules):
+            files = [rule.regex.pattern for rule in self.rules if not rule.dir_only]
+            dirs = [rule.regex.pattern for rule in self.rules if rule.dir_only]
+            self._combined = re.compile("|".join(f"(?:{p})" for p in files)) if files else None
+            self._combined_dirs = re.compile("|".join(f"(?:{p})" for p in dirs)) if dirs else None
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """
+        匹配路径
+
+        Returns:
+            True 忽略，False 显式保留（否定规则），None 无规则匹配
+        """
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1:]
+
+        if self._combined is not None or self._combined_dirs is not None:
+            if self._combined is not None and self._combined.match(rel_path):
+                return True
+            if is_dir and self._combined_dirs is not None and self._combined_dirs.match(rel_path):
+                return True
+            return None
+
+        # 后出现的规则优先
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel_path):
+                return not rule.negate
+        return None
+
+
+class IgnoreMatcher:
+    """
+    忽略规则匹配器
+
+    遍历时逐层调用 match() 判断目录或文件是否被忽略；
+    目录被忽略时调用方不再进入，其下内容自然不会被打开。
+    """
+
+    def __init__(self, rule_sets: list[IgnoreRuleSet] | None = None):
+        self.rule_sets: list[IgnoreRuleSet] = rule_sets or []
+
+    @staticmethod
+    def compile_lines(lines: list[str], base: str = "") -> IgnoreRuleSet:
+        """编译一组规则"""
+        rules = [rule for rule in (compile_rule(line) for line in lines) if rule is not None]
+        return IgnoreRuleSet(base=base, rules=rules)
+
+    def add_lines(self, lines: list[str], base: str = "") -> None:
+        """追加规则（后追加的优先级更高）"""
+        rule_set = self.compile_lines(lines, base)
+        if rule_set.rules:
+            self.rule_sets.append(rule_set)
+
+    def child(self, gitignore: Path, base: str) -> "IgnoreMatcher":
+        """
+        生成叠加了子目录 .gitignore 的匹配器
+
+        Args:
+            gitignore: 子目录中的 .gitignore 路径
+            base: 子目录相对路径
+        """
+        lines = _read_lines(gitignore)
+        if not lines:
+            return self
+        matcher = IgnoreMatcher(list(self.rule_sets))
+        matcher.add_lines(lines, base)
+        return matcher
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        判断路径是否被忽略
+
+        Args:
+            rel_path: 相对项目根目录的 POSIX 路径
+            is_dir: 是否为目录
+
+        Returns:
+            是否忽略
+        """
+        for rule_set in reversed(self.rule_sets):
+            result = rule_set.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(self.rule_sets)
+
+
+def _read_lines(path: Path) -> list[str]:
+    """读取规则文件"""
+    try:
+        return path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    except OSError:
+        return []
+
+
+def load_ignore_matcher(project_path: str | Path, exclude: list[str] | None = None) -> IgnoreMatcher:
+    """
+    加载项目的忽略规则
+
+    优先级从低到高：.git/info/exclude、根目录 .gitignore、super-dev.yaml exclude。
+    子目录中的 .gitignore 在遍历时通过 IgnoreMatcher.child() 叠加。
+
+    Args:
+        project_path: 项目根目录
+        exclude: super-dev.yaml 中的 exclude 列表
+
+    Returns:
+        IgnoreMatcher: 匹配器
+    """
+    project_path = Path(project_path)
+    matcher = IgnoreMatcher()
+    matcher.add_lines(_read_lines(project_path / ".git" / "info" / "exclude"))
+    matcher.add_lines(_read_lines(project_path / ".gitignore"))
+    if exclude:
+        matcher.add_lines(list(exclude))
+    return matcher
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 文件清单
+
+对项目执行一次 os.scandir 遍历，生成路径、大小、修改时间和语言的清单，
+供分析器各阶段共享，避免重复遍历文件系统。
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .ignore import IgnoreMatcher
+
+
+# 语言扩展名映射
+LANGUAGE_MAP: dict[str, str] = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".go": "Go",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".swift": "Swift",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".rs": "Rust",
+    ".cpp": "C++",
+    ".c": "C",
+    ".cs": "C#",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+}
+
+# 忽略的目录
+IGNORE_DIRS: frozenset[str] = frozenset({
+    "node_modules", "__pycache__", ".git", "venv", "env",
+    ".venv", "dist", "build", "target", "bin", "obj",
+    ".next", ".nuxt", "coverage", ".pytest_cache", ".super-dev",
+    "vendor", "third_party", ".tox", ".mypy_cache", ".ruff_cache",
+})
+
+
+@dataclass(slots=True)
+class FileEntry:
+    """清单中的单个文件"""
+
+    path: str  # 绝对路径
+    rel_path: str  # 相对项目根目录的 POSIX 路径
+    size: int
+    mtime_ns: int
+    language: str | None = None  # 非代码文件为 None
+
+    @property
+    def suffix(self) -> str:
+        """文件扩展名"""
+        return os.path.splitext(self.rel_path)[1]
+
+    @property
+    def depth(self) -> int:
+        """所在目录深度（根目录为 0）"""
+        return self.rel_path.count("/")
+
+
+@dataclass
+class FileManifest:
+    """项目文件清单"""
+
+    root: Path
+    files: list[FileEntry] = field(default_factory=list)
+    dirs: list[str] = field(default_factory=list)  # 相对路径，按遍历顺序
+    duplicates: int = 0  # 因 (st_dev, st_ino) 已访问而跳过的文件和目录数（硬链接、符号链接环）
+    unvisited_dirs: int = 0  # 到达截止时间时尚未进入的目录数（不含其子目录），非 0 表示清单不完整
+
+    @property
+    def code_files(self) -> list[FileEntry]:
+        """代码文件（语言可识别）"""
+        return [entry for entry in self.files if entry.language is not None]
+
+    def child_dirs(self, parent: str = "") -> list[str]:
+        """
+        获取某目录下的直接子目录名
+
+        Args:
+            parent: 相对路径，空字符串表示项目根目录
+        """
+        prefix = f"{parent}/" if parent else ""
+        depth = prefix.count("/")
+        return [
+            d[len(prefix):]
+            for d in self.dirs
+            if d.startswith(prefix) and d.count("/") == depth
+        ]
+
+    def files_under(self, parent: str = "") -> list[FileEntry]:
+        """获取某目录（递归）下的文件"""
+        if not parent:
+            return list(self.files)
+        prefix = f"{parent}/"
+        return [entry for entry in self.files if entry.rel_path.startswith(prefix)]
+
+
+def _inode_key(entry: os.DirEntry, stat: os.stat_result) -> tuple[int, int] | None:
+    """
+    文件或目录的 (st_dev, st_ino)
+
+    Windows 上 DirEntry.stat() 不填充 st_ino / st_dev（均为 0），此时改用 os.stat() 获取；
+    仍为 0 时（部分网络文件系统）返回 None，该条目不参与去重。
+    """
+    if not stat.st_ino:
+        try:
+            stat = os.stat(entry.path)
+        except OSError:
+            return None
+        if not stat.st_ino:
+            return None
+    return stat.st_dev, stat.st_ino
+
+
+def build_manifest(
+    root: str | Path,
+    ignore_dirs: frozenset[str] | set[str] = IGNORE_DIRS,
+    ignore: IgnoreMatcher | None = None,
+    follow_symlinks: bool = False,
+    deadline: float | None = None,
+) -> FileManifest:
+    """
+    遍历项目生成文件清单
+
+    使用基于栈的 os.scandir 遍历，每个目录只读取一次，
+    忽略目录整体剪枝，不会进入 node_modules 等目录。
+
+    按 (st_dev, st_ino) 去重（无法获取 inode 时不去重）：硬链接的同一文件只计入一次；跟随符号链接时
+    已访问的目录不再进入（避免自引用链接造成的无限遍历和 pnpm/Nix 式布局的重复统计），
+    已计入的文件也不再重复计入。先遍历到的路径保留（按名称深度优先）。
+
+    Args:
+        root: 项目根目录
+        ignore_dirs: 忽略的目录名
+        ignore: gitignore 规则匹配器，提供时同时加载子目录中的 .gitignore
+        follow_symlinks: 是否跟随符号链接；默认不跟随，符号链接（文件和目录）不计入清单
+        deadline: 截止时间（time.monotonic() 时钟）；到时不再进入新目录（根目录总会遍历），
+            尚未进入的目录数记入 unvisited_dirs
+
+    Returns:
+        FileManifest: 文件清单
+    """
+    root = Path(root).resolve()
+    manifest = FileManifest(root=root)
+
+    # 已访问的 (st_dev, st_ino)：不跟随符号链接时只有硬链接文件（st_nlink > 1）可能重复
+    seen_dirs: set[tuple[int, int]] = set()
+    seen_files: set[tuple[int, int]] = set()
+    if follow_symlinks:
+        try:
+            root_stat = root.stat()
+            seen_dirs.add((root_stat.st_dev, root_stat.st_ino))
+        except OSError:
+            pass
+
+    stack: list[tuple[str, str, IgnoreMatcher | None]] = [(str(root), "", ignore)]
+    while stack:
+        dir_path, rel_dir, matcher = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+
+        # 子目录的 .gitignore 只作用于该目录树
+        if matcher is not None and rel_dir and any(e.name == ".gitignore" for e in entries):
+            matcher = matcher.child(Path(dir_path) / ".gitignore", rel_dir)
+
+        subdirs: list[tuple[str, str, IgnoreMatcher | None]] = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if not follow_symlinks and entry.is_symlink():
+                    continue
+
+                if entry.is_dir():
+                    if entry.name in ignore_dirs:
+                        continue
+                    if matcher and matcher.match(rel_path, is_dir=True):
+                        continue
+                    if follow_symlinks:
+                        key = _inode_key(entry, entry.stat())
+                        if key is not None:
+                            if key in seen_dirs:
+                                manifest.duplicates += 1
+                                continue
+                            seen_dirs.add(key)
+                    manifest.dirs.append(rel_path)
+                    subdirs.append((entry.path, rel_path, matcher))
+                elif entry.is_file():
+                    if matcher and matcher.match(rel_path):
+                        continue
+                    stat = entry.stat()
+                    if follow_symlinks or stat.st_nlink > 1:
+                        key = _inode_key(entry, stat)
+                        if key is not None:
+                            if key in seen_files:
+                                manifest.duplicates += 1
+                                continue
+                            seen_files.add(key)
+                    manifest.files.append(
+                        FileEntry(
+                            path=entry.path,
+                            rel_path=rel_path,
+                            size=stat.st_size,
+                            mtime_ns=stat.st_mtime_ns,
+                            language=LANGUAGE_MAP.get(os.path.splitext(entry.name)[1]),
+                        )
+                    )
+            except OSError:
+                continue
+
+        # 逆序入栈，保证按名称顺序深度优先遍历
+        stack.extend(reversed(subdirs))
+
+        if deadline is not None and stack and time.monotonic() >= deadline:
+            manifest.unvisited_dirs = len(stack)
+            break
+
+    return manifest
@@ -3,11 +3,14 @@
 Super Dev 分析器数据模型
 """
 
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Literal
 
+from .tree import DirectoryView, render_tree
+
 
 class ProjectCategory(Enum):
     """项目分类"""
@@ -170,6 +173,104 @@ class DesignPattern:
             "confidence": self.confidence,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DesignPattern":
+        """从字典创建"""
+        return cls(
+            name=PatternType(data["name"]),
+            location=Path(data["location"]),
+            description=data.get("description", ""),
+            confidence=data.get("confidence", 1.0),
+        )
+
+
+@dataclass
+class Estimate:
+    """抽样估计值（95% 置信区间）"""
+
+    value: float
+    margin: float = 0.0  # 置信区间半宽
+    sampled: int = 0  # 样本文件数
+    population: int = 0  # 总体文件数
+
+    @property
+    def low(self) -> float:
+        return max(0.0, self.value - self.margin)
+
+    @property
+    def high(self) -> float:
+        return self.value + self.margin
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "value": round(self.value),
+            "low": round(self.low),
+            "high": round(self.high),
+            "sampled": self.sampled,
+            "population": self.population,
+        }
+
+
+@dataclass
+class StageTiming:
+    """分析阶段的耗时与资源统计"""
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    files: int = 0  # 涉及的文件数
+    bytes_read: int = 0
+    peak_memory: int | None = None  # tracemalloc 峰值增量（字节），未统计时为 None
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "name": self.name,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "files": self.files,
+            "bytes_read": self.bytes_read,
+            "peak_memory": self.peak_memory,
+        }
+
+
+@dataclass
+class ImportGraphSummary:
+    """模块导入图分析结果"""
+
+    module_count: int = 0
+    edge_count: int = 0
+    cycle_count: int = 0  # 含多个模块的强连通分量数
+    cycles: list[list[str]] = field(default_factory=list)  # 最大的若干个循环依赖（模块路径）
+    hotspots: list[tuple[str, int, int]] = field(default_factory=list)  # (模块, 被依赖数, 依赖数)
+    layer_violation_count: int = 0
+    layer_violations: list[tuple[str, str]] = field(default_factory=list)  # (下层模块, 被导入的上层模块)
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "module_count": self.module_count,
+            "edge_count": self.edge_count,
+            "cycle_count": self.cycle_count,
+            "cycles": self.cycles,
+            "hotspots": [
+                {"module": module, "fan_in": fan_in, "fan_out": fan_out}
+                for module, fan_in, fan_out in self.hotspots
+            ],
+            "layer_violation_count": self.layer_violation_count,
+            "layer_violations": [
+                {"source": source, "target": target}
+                for source, target in self.layer_violations
+            ],
+        }
+
+
+# iter_records() 输出的报告部分（按输出顺序）
+REPORT_SECTIONS = (
+    "project", "design_pattern", "directory", "package", "import_graph", "summary", "timing",
+)
+
 
 @dataclass
 class ArchitectureReport:
@@ -180,10 +281,18 @@ class ArchitectureReport:
     tech_stack: TechStack
     architecture_pattern: ArchitecturePattern | None = None
     design_patterns: list[DesignPattern] = field(default_factory=list)
-    directory_structure: dict = field(default_factory=dict)
+    # 目录结构：目录为映射、文件为 None（分析器生成按需展开的 DirectoryView）
+    directory_structure: Mapping = field(default_factory=dict)
     file_count: int = 0
     total_lines: int = 0
     languages_used: dict[str, int] = field(default_factory=dict)  # 语言 -> 行数
+    skipped_files: dict[str, int] = field(default_factory=dict)  # 跳过原因 -> 文件数
+    packages: dict[str, "ArchitectureReport"] = field(default_factory=dict)  # monorepo 成员包路径 -> 报告
+    # 抽样模式下的估计值: "file_count" / "total_lines" / "languages_used.<语言>" -> 估计
+    estimates: dict[str, Estimate] = field(default_factory=dict)
+    unvisited_dirs: int = 0  # 时间预算内未遍历到的目录数，非 0 时统计只覆盖已遍历部分
+    import_graph: ImportGraphSummary | None = None  # Python / JS / TS 模块导入图
+    timings: list[StageTiming] = field(default_factory=list)  # 各阶段剖析（analyze(profile=True)）
 
     def to_dict(self) -> dict:
         """转换为字典"""
@@ -195,12 +304,96 @@ class ArchitectureReport:
                 self.architecture_pattern.value if self.architecture_pattern else None
             ),
             "design_patterns": [p.to_dict() for p in self.design_patterns],
-            "directory_structure": self.directory_structure,
+            "directory_structure": (
+                self.directory_structure.to_dict()
+                if isinstance(self.directory_structure, DirectoryView)
+                else self.directory_structure
+            ),
             "file_count": self.file_count,
             "total_lines": self.total_lines,
             "languages_used": self.languages_used,
+            "skipped_files": self.skipped_files,
+            "packages": {path: report.to_dict() for path, report in self.packages.items()},
+            "estimates": {name: e.to_dict() for name, e in self.estimates.items()},
+            "unvisited_dirs": self.unvisited_dirs,
+            "import_graph": self.import_graph.to_dict() if self.import_graph else None,
+            "timings": [t.to_dict() for t in self.timings],
         }
 
+    def iter_records(self, sections: Iterable[str] = REPORT_SECTIONS) -> Iterator[dict]:
+        """
+        逐条生成报告记录（NDJSON 输出使用）
+
+        与 to_dict() 不同，目录树按条目展开、设计模式逐个输出，
+        不构建完整的嵌套结构。每条记录的 "type" 字段为所属部分。
+
+        Args:
+            sections: 需要输出的部分，取值见 REPORT_SECTIONS
+
+        Yields:
+            dict: 报告记录
+        """
+        sections = set(sections)
+
+        if "project" in sections:
+            yield {
+                "type": "project",
+                "project_path": str(self.project_path),
+                "category": self.category.value,
+                "tech_stack": self.tech_stack.to_dict(),
+                "architecture_pattern": (
+                    self.architecture_pattern.value if self.architecture_pattern else None
+                ),
+            }
+
+        if "design_pattern" in sections:
+            for pattern in self.design_patterns:
+                yield {"type": "design_pattern", **pattern.to_dict()}
+
+        if "directory" in sections:
+            stack: list[tuple[str, Mapping]] = [("", self.directory_structure)]
+            while stack:
+                prefix, tree = stack.pop()
+                for name, subtree in tree.items():
+                    path = f"{prefix}{name}"
+                    yield {
+                        "type": "directory",
+                        "path": path,
+                        "kind": "file" if subtree is None else "dir",
+                    }
+                    if subtree:
+                        stack.append((f"{path}/", subtree))
+
+        if "package" in sections:
+            for path, package in self.packages.items():
+                yield {
+                    "type": "package",
+                    "path": path,
+                    "category": package.category.value,
+                    "tech_stack": package.tech_stack.to_dict(),
+                    "file_count": package.file_count,
+                    "total_lines": package.total_lines,
+                    "languages_used": package.languages_used,
+                }
+
+        if "import_graph" in sections and self.import_graph is not None:
+            yield {"type": "import_graph", **self.import_graph.to_dict()}
+
+        if "summary" in sections:
+            yield {
+                "type": "summary",
+                "file_count": self.file_count,
+                "total_lines": self.total_lines,
+                "languages_used": self.languages_used,
+                "skipped_files": self.skipped_files,
+                "estimates": {name: e.to_dict() for name, e in self.estimates.items()},
+                "unvisited_dirs": self.unvisited_dirs,
+            }
+
+        if "timing" in sections:
+            for timing in self.timings:
+                yield {"type": "timing", **timing.to_dict()}
+
     def to_markdown(self) -> str:
         """生成 Markdown 报告"""
         # 处理 framework 可能是字符串或枚举
@@ -239,6 +432,14 @@ class ArchitectureReport:
                 f"识别到: **{self.architecture_pattern.value}**",
             ])
 
+        if self.directory_structure:
+            lines.extend([
+                f"",
+                f"## 目录结构",
+                f"",
+                *render_tree(self.directory_structure, max_depth=2),
+            ])
+
         if self.design_patterns:
             lines.extend([
                 f"",
@@ -254,8 +455,24 @@ class ArchitectureReport:
             f"",
             f"## 项目统计",
             f"",
-            f"- **文件数量**: {self.file_count}",
-            f"- **代码行数**: {self.total_lines:,}",
+        ])
+
+        if self.estimates:
+            total = self.estimates.get("total_lines")
+            if total is not None:
+                lines.append(
+                    f"- **抽样**: 读取 {total.sampled:,} / {total.population:,} 个文件，"
+                    f"标注 ≈ 的数值为 95% 置信区间估计"
+                )
+        if self.unvisited_dirs:
+            lines.append(
+                f"- **遍历未完成**: 时间预算内有 {self.unvisited_dirs:,} 个目录未进入，"
+                f"统计只覆盖已遍历的部分"
+            )
+
+        lines.extend([
+            f"- **文件数量**: {self.format_count('file_count', self.file_count, grouped=False)}",
+            f"- **代码行数**: {self.format_count('total_lines', self.total_lines)}",
         ])
 
         if self.languages_used:
@@ -264,7 +481,68 @@ class ArchitectureReport:
                 self.languages_used.items(), key=lambda x: x[1], reverse=True
             ):
                 percentage = (count / self.total_lines * 100) if self.total_lines else 0
-                lines.append(f"  - {lang}: {count:,} 行 ({percentage:.1f}%)")
+                formatted = self.format_count(f"languages_used.{lang}", count)
+                lines.append(f"  - {lang}: {formatted} 行 ({percentage:.1f}%)")
+
+        if self.skipped_files:
+            skipped = ", ".join(f"{reason} {count}" for reason, count in self.skipped_files.items())
+            lines.append(f"- **跳过文件**: {skipped}")
+
+        if self.packages:
+            lines.extend([
+                f"",
+                f"## 工作区成员包 ({len(self.packages)})",
+                f"",
+                f"| 路径 | 类型 | 语言 | 框架 | 文件数 | 代码行数 |",
+                f"|------|------|------|------|--------|----------|",
+            ])
+            for path, package in self.packages.items():
+                package_framework = (
+                    package.tech_stack.framework.value
+                    if isinstance(package.tech_stack.framework, FrameworkType)
+                    else package.tech_stack.framework
+                )
+                lines.append(
+                    f"| `{path}` | {package.category.value} | {package.tech_stack.language} "
+                    f"| {package_framework} | {package.file_count} | {package.total_lines:,} |"
+                )
+
+        if self.import_graph and self.import_graph.module_count:
+            graph = self.import_graph
+            lines.extend([
+                f"",
+                f"## 模块依赖",
+                f"",
+                f"- **模块数**: {graph.module_count:,}，**导入关系**: {graph.edge_count:,}",
+                f"- **循环依赖**: {graph.cycle_count}",
+            ])
+            for cycle in graph.cycles[:5]:
+                shown = ", ".join(f"`{module}`" for module in cycle[:5])
+                more = f" 等 {len(cycle)} 个模块" if len(cycle) > 5 else ""
+                lines.append(f"  - {shown}{more}")
+            if graph.hotspots:
+                lines.append(f"- **依赖热点**（被依赖数 / 依赖数）:")
+                for module, fan_in, fan_out in graph.hotspots[:5]:
+                    lines.append(f"  - `{module}`: {fan_in} / {fan_out}")
+            if graph.layer_violation_count:
+                lines.append(f"- **分层违规**: {graph.layer_violation_count}")
+                for source, target in graph.layer_violations[:5]:
+                    lines.append(f"  - `{source}` → `{target}`")
+
+        if self.timings:
+            lines.extend([
+                f"",
+                f"## 性能剖析",
+                f"",
+                f"| 阶段 | 墙钟 (s) | CPU (s) | 文件数 | 读取 | 内存峰值 |",
+                f"|------|----------|---------|--------|------|----------|",
+            ])
+            for timing in self.timings:
+                lines.append(
+                    f"| {timing.name} | {timing.wall_seconds:.3f} | {timing.cpu_seconds:.3f} "
+                    f"| {timing.files:,} | {_format_bytes(timing.bytes_read)} "
+                    f"| {_format_bytes(timing.peak_memory)} |"
+                )
 
         if self.tech_stack.dependencies:
             lines.extend([
@@ -281,6 +559,36 @@ class ArchitectureReport:
         lines.append("")
         return "\n".join(lines)
 
+    def format_count(self, name: str, value: int, grouped: bool = True) -> str:
+        """
+        格式化统计值，估计值附带置信区间
+
+        Args:
+            name: 统计项（file_count / total_lines / languages_used.<语言>）
+            value: 统计值
+            grouped: 是否使用千位分隔符
+
+        Returns:
+            如 "23,441"，抽样估计时为 "≈23,441 (95% CI 21,000–25,900)"
+        """
+        formatted = f"{value:,}" if grouped else str(value)
+        estimate = self.estimates.get(name)
+        if estimate is None:
+            return formatted
+        return f"≈{formatted} (95% CI {round(estimate.low):,}–{round(estimate.high):,})"
+
+
+def _format_bytes(size: int | None) -> str:
+    """格式化字节数"""
+    if size is None:
+        return "-"
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
 
 # 项目类型别名（向后兼容）
 ProjectType = ProjectCategory
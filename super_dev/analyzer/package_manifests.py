@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 项目清单文件解析缓存
+
+package.json、pyproject.toml、requirements.txt、go.mod 等文件在一次分析中
+只读取、解析一次，由各检测器和质量门禁共享。
+"""
+
+import json
+import os
+import re
+from functools import cached_property
+from pathlib import Path
+
+# 尝试导入 TOML 解析库
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib  # Python < 3.11
+    except ImportError:
+        tomllib = None
+
+
+class PackageManifests:
+    """
+    单个项目（或 monorepo 成员包）的清单文件
+
+    所有属性按需解析并缓存：文件不存在时文本为 None，
+    JSON/TOML 无法解析时解析结果为 None（与文件不存在区分请使用 exists()）。
+    """
+
+    def __init__(self, project_path: str | Path):
+        """
+        初始化
+
+        Args:
+            project_path: 项目根目录
+        """
+        self.project_path = Path(project_path).resolve()
+        self._texts: dict[str, str | None] = {}
+
+    @cached_property
+    def entries(self) -> frozenset[str]:
+        """根目录下的文件和目录名（只列一次目录）"""
+        try:
+            return frozenset(os.listdir(self.project_path))
+        except OSError:
+            return frozenset()
+
+    def exists(self, name: str) -> bool:
+        """根目录下是否存在该文件或目录"""
+        return name in self.entries
+
+    def read_text(self, name: str) -> str | None:
+        """
+        读取根目录下的文本文件（按文件名缓存）
+
+        Args:
+            name: 文件名
+
+        Returns:
+            文件内容，不存在或无法读取时返回 None
+        """
+        if name not in self._texts:
+            text = None
+            if self.exists(name):
+                try:
+                    text = (self.project_path / name).read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    text = None
+            self._texts[name] = text
+        return self._texts[name]
+
+    def read_stats(self) -> tuple[int, int]:
+        """已读取的文件数和字节数（UTF-8）"""
+        texts = [text for text in self._texts.values() if text is not None]
+        return len(texts), sum(len(text.encode("utf-8")) for text in texts)
+
+    # ==================== 解析结果 ====================
+
+    @cached_property
+    def package_json(self) -> dict | None:
+        """package.json 内容"""
+        return self._load_json("package.json")
+
+    @cached_property
+    def composer_json(self) -> dict | None:
+        """composer.json 内容"""
+        return self._load_json("composer.json")
+
+    @cached_property
+    def pyproject(self) -> dict | None:
+        """pyproject.toml 内容（缺少 TOML 解析库时为 None）"""
+        text = self.read_text("pyproject.toml")
+        if text is None or tomllib is None:
+            return None
+        try:
+            return tomllib.loads(text)
+        except Exception:
+            return None
+
+    @cached_property
+    def requirements(self) -> list[str]:
+        """requirements.txt 中的有效行（去掉空行和注释）"""
+        text = self.read_text("requirements.txt")
+        if text is None:
+            return []
+        return [
+            line for line in (raw.strip() for raw in text.splitlines())
+            if line and not line.startswith("#")
+        ]
+
+    @cached_property
+    def go_mod(self) -> str | None:
+        """go.mod 内容"""
+        return self.read_text("go.mod")
+
+    @cached_property
+    def node_dependencies(self) -> tuple[dict, dict]:
+        """package.json 的 (dependencies, devDependencies)"""
+        data = self.package_json or {}
+        return data.get("dependencies", {}) or {}, data.get("devDependencies", {}) or {}
+
+    @cached_property
+    def python_dependency_names(self) -> set[str]:
+        """requirements.txt 与 pyproject.toml [project].dependencies 中的包名（小写）"""
+        names = set()
+        for line in self.requirements:
+            match = re.match(r"^([a-zA-Z0-9_-]+)", line)
+            if match:
+                names.add(match.group(1).lower())
+
+        deps = (self.pyproject or {}).get("project", {}).get("dependencies", [])
+        names.update(d.lower().split(">=")[0].split("==")[0] for d in deps)
+        return names
+
+    def _load_json(self, name: str) -> dict | None:
+        text = self.read_text(name)
+        if text is None:
+            return None
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 设计模式检测
+
+按文件检测设计模式，函数均为模块级，可在子进程中执行。
+"""
+
+import ast
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+from .models import DesignPattern, PatternType
+
+
+def detect_file_patterns(file_path: Path, language: str, data: bytes) -> list[DesignPattern]:
+    """
+    检查文件中的设计模式
+
+    Args:
+        file_path: 文件路径（用于记录位置）
+        language: 编程语言 (python / javascript / typescript / vue)
+        data: 文件内容（由调用方读取一次后传入）
+
+    Returns:
+        list[DesignPattern]: 检测到的设计模式
+    """
+    patterns: list[DesignPattern] = []
+
+    if language == "python":
+        detect_python_ast_patterns(file_path, data, patterns)
+    else:
+        detect_text_based_patterns(file_path, data, patterns)
+
+    return patterns
+
+
+# ==================== Python AST 检测 ====================
+
+
+class PythonPatternDetector(ABC):
+    """
+    Python 设计模式检测器基类
+
+    子类声明关心的节点类型 node_types，并实现 visit()；
+    所有检测器共享同一次解析和同一次遍历。
+    """
+
+    node_types: tuple[type[ast.AST], ...] = ()
+
+    def __init__(self, file_path: Path, patterns: list[DesignPattern]):
+        self.file_path = file_path
+        self.patterns = patterns
+
+    @abstractmethod
+    def visit(self, node: ast.AST) -> None:
+        """处理一个节点"""
+
+    def report(
+        self, name: PatternType, description: str, confidence: float = 1.0
+    ) -> None:
+        """记录检测结果"""
+        self.patterns.append(
+            DesignPattern(
+                name=name,
+                location=self.file_path,
+                description=description,
+                confidence=confidence,
+            )
+        )
+
+
+# 已注册的检测器（按注册顺序执行）
+PYTHON_DETECTORS: list[type[PythonPatternDetector]] = []
+
+
+def register_python_detector(
+    detector: type[PythonPatternDetector],
+) -> type[PythonPatternDetector]:
+    """
+    注册 Python 设计模式检测器（可用作装饰器）
+
+    新增检测器不会增加文件读取或 AST 遍历次数。
+    """
+    if detector not in PYTHON_DETECTORS:
+        PYTHON_DETECTORS.append(detector)
+    return detector
+
+
+class PatternVisitor(ast.NodeVisitor):
+    """单次遍历 AST，按节点类型分发给所有检测器"""
+
+    def __init__(self, detectors: list[PythonPatternDetector | ast.NodeVisitor]):
+        self._dispatch: dict[type[ast.AST], list[PythonPatternDetector | ast.NodeVisitor]] = {}
+        for detector in detectors:
+            for node_type in detector.node_types:
+                self._dispatch.setdefault(node_type, []).append(detector)
+
+    def visit(self, node: ast.AST) -> None:
+        for detector in self._dispatch.get(type(node), ()):
+            detector.visit(node)
+        self.generic_visit(node)
+
+
+def detect_python_ast_patterns(
+    file_path: Path,
+    data: bytes,
+    patterns: list[DesignPattern],
+    extra_detectors: list[PythonPatternDetector | ast.NodeVisitor] | None = None,
+    detect_patterns: bool = True,
+) -> None:
+    """
+    使用 AST 检测 Python 设计模式（一次解析、一次遍历）
+
+    Args:
+        file_path: 文件路径
+        data: 文件内容
+        patterns: 检测结果输出列表
+        extra_detectors: 共享同一次遍历的其他访问器实例（声明 node_types，如导入收集）
+        detect_patterns: 是否运行已注册的设计模式检测器
+    """
+    try:
+        tree = ast.parse(data, filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return
+
+    detectors: list[PythonPatternDetector | ast.NodeVisitor] = (
+        [detector(file_path, patterns) for detector in PYTHON_DETECTORS]
+        if detect_patterns else []
+    )
+    detectors.extend(extra_detectors or ())
+    PatternVisitor(detectors).visit(tree)
+
+
+def _method_names(class_node: ast.ClassDef) -> set[str]:
+    """类中定义的方法名"""
+    return {
+        item.name
+        for item in class_node.body
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+@register_python_detector
+class SingletonDetector(PythonPatternDetector):
+    """Singleton: _instance 属性或 __new__/get_instance/instance 方法"""
+
+    node_types = (ast.ClassDef,)
+
+    def visit(self, node: ast.ClassDef) -> None:
+        has_instance = False
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                has_instance = has_instance or item.target.id == "_instance"
+            elif isinstance(item, ast.Assign):
+                has_instance = has_instance or any(
+                    isinstance(target, ast.Name) and target.id == "_instance"
+                    for target in item.targets
+                )
+
+        has_get_instance = bool(_method_names(node) & {"__new__", "get_instance", "instance"})
+
+        if has_instance or has_get_instance:
+            self.report(PatternType.SINGLETON, f"类 {node.name} 实现了单例模式")
+
+
+@register_python_detector
+class ObserverDetector(PythonPatternDetector):
+    """Observer: attach/detach/notify/subscribe/unsubscribe 方法"""
+
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    observer_methods = frozenset({"attach", "detach", "notify", "subscribe", "unsubscribe"})
+
+    def visit(self, node: ast.FunctionDef) -> None:
+        if node.name in self.observer_methods:
+            self.report(
+                PatternType.OBSERVER,
+                f"方法 {node.name} 可能是观察者模式的一部分",
+                confidence=0.7,
+            )
+
+
+@register_python_detector
+class FactoryDetector(PythonPatternDetector):
+    """Factory: *Factory 类，或包含 create_* 方法的类"""
+
+    node_types = (ast.ClassDef,)
+
+    def visit(self, node: ast.ClassDef) -> None:
+        if node.name.endswith("Factory"):
+            self.report(PatternType.FACTORY, f"类 {node.name} 实现了工厂模式", confidence=0.8)
+        elif any(name.startswith("create_") for name in _method_names(node)):
+            self.report(
+                PatternType.FACTORY, f"类 {node.name} 包含工厂方法", confidence=0.6
+            )
+
+
+@register_python_detector
+class StrategyDetector(PythonPatternDetector):
+    """Strategy: *Strategy 类"""
+
+    node_types = (ast.ClassDef,)
+
+    def visit(self, node: ast.ClassDef) -> None:
+        if node.name.endswith("Strategy"):
+            self.report(PatternType.STRATEGY, f"类 {node.name} 实现了策略模式", confidence=0.7)
+
+
+@register_python_detector
+class BuilderDetector(PythonPatternDetector):
+    """Builder: *Builder 类且包含 build 方法"""
+
+    node_types = (ast.ClassDef,)
+
+    def visit(self, node: ast.ClassDef) -> None:
+        if node.name.endswith("Builder") and "build" in _method_names(node):
+            self.report(PatternType.BUILDER, f"类 {node.name} 实现了建造者模式", confidence=0.8)
+
+
+# ==================== 文本检测 ====================
+
+
+@dataclass(frozen=True)
+class TextPatternRule:
+    """
+    基于关键字的设计模式规则
+
+    any_of 中任一关键字出现，或 all_of 中每组至少出现一个关键字，即视为命中。
+    """
+
+    name: PatternType
+    description: str
+    confidence: float
+    any_of: frozenset[str] = frozenset()
+    all_of: tuple[frozenset[str], ...] = ()
+
+    def first_match(self, found: dict[str, int]) -> int | None:
+        """返回命中时最早出现的关键字位置，未命中返回 None"""
+        positions = [found[k] for k in self.any_of if k in found]
+        if self.all_of:
+            group_positions = [
+                [found[k] for k in group if k in found] for group in self.all_of
+            ]
+            if all(group_positions):
+                positions.append(max(min(group) for group in group_positions))
+        return min(positions) if positions else None
+
+
+# JS/TS/Vue 设计模式规则
+TEXT_PATTERN_RULES: tuple[TextPatternRule, ...] = (
+    TextPatternRule(
+        name=PatternType.SINGLETON,
+        description="检测到单例模式相关代码",
+        confidence=0.6,
+        any_of=frozenset({"getInstance"}),
+        all_of=(frozenset({"instance"}), frozenset({"private"})),
+    ),
+    TextPatternRule(
+        name=PatternType.FACTORY,
+        description="检测到工厂模式相关代码",
+        confidence=0.7,
+        all_of=(frozenset({"create"}), frozenset({"Factory", "factory"})),
+    ),
+    TextPatternRule(
+        name=PatternType.OBSERVER,
+        description="检测到观察者模式相关代码",
+        confidence=0.6,
+        any_of=frozenset({"subscribe", "unsubscribe", "notify", "emit", "addEventListener"}),
+    ),
+    TextPatternRule(
+        name=PatternType.STRATEGY,
+        description="检测到策略模式相关代码",
+        confidence=0.6,
+        any_of=frozenset({"Strategy"}),
+        all_of=(frozenset({"execute"}), frozenset({"context"})),
+    ),
+)
+
+
+def _compile_keywords(rules: tuple[TextPatternRule, ...]) -> re.Pattern[bytes]:
+    """将所有规则的关键字合并为一个正则（长关键字优先）"""
+    keywords: set[str] = set()
+    for rule in rules:
+        keywords |= rule.any_of
+        for group in rule.all_of:
+            keywords |= group
+    ordered = sorted(keywords, key=lambda k: (-len(k), k))
+    return re.compile("|".join(re.escape(k) for k in ordered).encode())
+
+
+_KEYWORD_REGEX = _compile_keywords(TEXT_PATTERN_RULES)
+
+
+def scan_keywords(data: bytes, regex: re.Pattern[bytes] = _KEYWORD_REGEX) -> dict[str, int]:
+    """
+    单次扫描文件内容，返回每个关键字首次出现的字节位置
+
+    Args:
+        data: 文件内容
+        regex: 合并后的关键字正则
+
+    Returns:
+        dict[str, int]: 关键字 -> 首次出现位置
+    """
+    found: dict[str, int] = {}
+    for match in regex.finditer(data):
+        keyword = match.group().decode()
+        if keyword not in found:
+            found[keyword] = match.start()
+    return found
+
+
+def detect_text_based_patterns(
+    file_path: Path, data: bytes, patterns: list[DesignPattern]
+) -> None:
+    """基于关键字检测设计模式（适用于 JS/TS/Vue 等）"""
+    found = scan_keywords(data)
+    if not found:
+        return
+
+    for rule in TEXT_PATTERN_RULES:
+        position = rule.first_match(found)
+        if position is None:
+            continue
+        line = data.count(b"\n", 0, position) + 1
+        patterns.append(
+            DesignPattern(
+                name=rule.name,
+                location=file_path,
+                description=f"{rule.description}（第 {line} 行）",
+                confidence=rule.confidence,
+            )
+        )
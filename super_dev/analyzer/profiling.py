@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 分析阶段剖析
+
+记录 ProjectAnalyzer.analyze() 各阶段的墙钟时间、CPU 时间、涉及文件数、读取字节数
+和 tracemalloc 内存峰值。CPU 时间包含已结束的子进程（进程池）；
+内存峰值只统计当前进程的 Python 分配，不含进程池中的工作进程。
+启用 super_dev.tracing 时，每个阶段同时记录为一个 span。
+"""
+
+import os
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from ..tracing import span
+from .models import StageTiming
+
+
+def _cpu_seconds() -> float:
+    """当前进程及已回收子进程的 CPU 时间"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class StageProfiler:
+    """
+    阶段剖析器
+
+    未启用时 stage() 只返回一个不会被记录的 StageTiming，开销可忽略。
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = True):
+        """
+        初始化剖析器
+
+        Args:
+            enabled: 是否记录
+            trace_memory: 是否使用 tracemalloc 统计内存峰值（会使分配变慢）
+        """
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.timings: list[StageTiming] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> "StageProfiler":
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTiming]:
+        """
+        记录一个阶段
+
+        调用方可在阶段内设置 files / bytes_read。
+
+        Args:
+            name: 阶段名称
+
+        Yields:
+            StageTiming: 本阶段的记录
+        """
+        timing = StageTiming(name=name)
+        with span(f"analyze.{name}", "analyzer") as current:
+            if not self.enabled:
+                yield timing
+                current.set(files=timing.files)
+                return
+
+            tracing = self.trace_memory and tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            wall = time.perf_counter()
+            cpu = _cpu_seconds()
+            try:
+                yield timing
+            finally:
+                timing.wall_seconds = time.perf_counter() - wall
+                timing.cpu_seconds = _cpu_seconds() - cpu
+                if tracing:
+                    timing.peak_memory = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+                self.timings.append(timing)
+                current.set(files=timing.files, bytes_read=timing.bytes_read)
+
+    def add(self, timing: StageTiming) -> None:
+        """添加由调用方汇总的记录（如各文件解析耗时之和）"""
+        if self.enabled:
+            self.timings.append(timing)
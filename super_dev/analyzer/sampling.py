@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 抽样估计
+
+超大仓库在时间预算内只读取部分文件：按 (目录, 语言) 分层，
+各层内随机排列后按 rank / N_h 交错排序，任意前缀都近似为按比例分层抽样；
+再用分层估计量给出总行数、文件数和各语言行数的 95% 置信区间。
+"""
+
+import math
+import random
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from .models import Estimate
+
+
+# 95% 置信区间的正态分位数
+Z_95 = 1.96
+
+# 分层键: (目录, 语言)
+StratumKey = tuple[str, str]
+
+
+@dataclass
+class StratumSample:
+    """单个分层的总体大小与样本"""
+
+    population: int = 0
+    lines: list[int] = field(default_factory=list)  # 样本行数（跳过的文件记 0）
+    files: list[int] = field(default_factory=list)  # 样本是否计入文件数 (1/0)
+
+    @property
+    def sampled(self) -> int:
+        return len(self.lines)
+
+
+def stratum_key(rel_path: str, language: str | None, package: str | None = None) -> StratumKey:
+    """
+    计算文件所属分层
+
+    Args:
+        rel_path: 相对路径
+        language: 语言
+        package: 所属 monorepo 成员包，提供时以成员包为目录层
+
+    Returns:
+        StratumKey: (目录, 语言)
+    """
+    if package:
+        directory = package
+    else:
+        directory = rel_path.split("/", 1)[0] if "/" in rel_path else ""
+    return directory, language or ""
+
+
+def sampling_order(keys: list[StratumKey], seed: int = 0) -> list[tuple[float, int]]:
+    """
+    生成分层抽样顺序
+
+    每层随机排列后，第 r 个文件的排序键为 (r + u) / N_h（u 为该层随机偏移，
+    首个文件固定为 0 以保证每层至少有一个样本），按键排序后任意前缀都是
+    近似按比例分配的系统抽样；键小于 sample_rate 的前缀即抽样比例为 sample_rate 的样本。
+
+    Args:
+        keys: 每个文件的分层键
+        seed: 随机种子（固定种子使结果可复现）
+
+    Returns:
+        list[(排序键, 文件下标)]: 按排序键升序
+    """
+    groups: dict[StratumKey, list[int]] = {}
+    for index, key in enumerate(keys):
+        groups.setdefault(key, []).append(index)
+
+    rng = random.Random(seed)
+    order: list[tuple[float, int]] = []
+    for key in sorted(groups):
+        indices = groups[key]
+        rng.shuffle(indices)
+        size = len(indices)
+        offset = rng.random()
+        order.append((0.0, indices[0]))
+        order.extend(((rank + offset) / size, index) for rank, index in enumerate(indices[1:], 1))
+
+    order.sort()
+    return order
+
+
+def _mean_and_variance(values: list[int]) -> tuple[float, float | None]:
+    """样本均值与无偏方差（样本不足两个时方差为 None）"""
+    if not values:
+        return 0.0, None
+    mean = sum(values) / len(values)
+    if len(values) < 2:
+        return mean, None
+    return mean, sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+
+def estimate_total(
+    strata: Iterable[StratumSample],
+    values: Callable[[StratumSample], list[int]],
+) -> Estimate:
+    """
+    分层估计总量及 95% 置信区间
+
+    总量 = Σ N_h·ȳ_h，方差 = Σ N_h²·(1 - n_h/N_h)·s_h²/n_h。
+    样本不足的分层使用所有分层合并样本的均值/方差。
+
+    Args:
+        strata: 分层样本
+        values: 从分层中取出样本值的函数
+
+    Returns:
+        Estimate: 估计值
+    """
+    strata = [s for s in strata if s.population]
+    pooled_mean, pooled_variance = _mean_and_variance(
+        [v for s in strata for v in values(s)]
+    )
+    pooled_variance = pooled_variance or 0.0
+
+    total = 0.0
+    variance = 0.0
+    sampled = 0
+    population = 0
+    for stratum in strata:
+        sample = values(stratum)
+        n, size = len(sample), stratum.population
+        sampled += n
+        population += size
+
+        if n == 0:
+            total += size * pooled_mean
+            variance += size * size * pooled_variance
+            continue
+
+        mean, stratum_variance = _mean_and_variance(sample)
+        if stratum_variance is None:
+            stratum_variance = pooled_variance
+        total += size * mean
+        variance += size * size * (1 - n / size) * stratum_variance / n
+
+    return Estimate(
+        value=total,
+        margin=Z_95 * math.sqrt(variance),
+        sampled=sampled,
+        population=population,
+    )
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 文件扫描器
+
+对清单中的代码文件统计行数、检测设计模式并收集导入语句，支持按分片在进程池中并行执行，
+各分片结果按清单顺序确定性合并。
+"""
+
+import hashlib
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from .imports import IMPORT_LANGUAGES, ImportCollector, extract_js_imports
+from .manifest import FileEntry
+from .models import DesignPattern
+from .patterns import detect_python_ast_patterns, detect_text_based_patterns
+
+
+# 扫描任务: (文件, 设计模式检测语言；None 表示只统计行数)
+ScanTask = tuple[FileEntry, str | None]
+
+# 少于该数量的任务不启动进程池（进程启动开销大于收益）
+MIN_PARALLEL_TASKS = 256
+
+# 按块读取的块大小
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# 默认文件大小上限，超过的文件不读取（通常是打包产物或数据文件）
+MAX_FILE_SIZE = 4 << 20  # 4 MiB
+
+# 压缩/生成文件判定
+MINIFIED_SUFFIXES = (".min.js", ".min.mjs", ".min.css", ".bundle.js", ".chunk.js")
+MINIFIED_AVG_LINE_LENGTH = 300  # 文件头平均行长超过该值视为压缩文件
+GENERATED_MARKERS = (b"@generated", b"DO NOT EDIT", b"auto-generated", b"autogenerated")
+HEAD_SIZE = 4096  # 判定时检查的文件头长度
+
+# 跳过原因
+SKIP_TOO_LARGE = "too_large"
+SKIP_MINIFIED = "minified"
+SKIP_GENERATED = "generated"
+
+
+@dataclass
+class FileScanResult:
+    """单个文件的扫描结果"""
+
+    rel_path: str
+    language: str | None
+    lines: int | None = None  # None 表示无法读取或被跳过
+    patterns: list[DesignPattern] = field(default_factory=list)
+    digest: str | None = None  # 内容哈希
+    skipped: str | None = None  # 跳过原因
+    imports: list[str] = field(default_factory=list)  # 导入语句（Python 模块名 / JS 路径）
+    bytes_read: int = 0  # 本次扫描读取的字节数（缓存命中为 0）
+    parse_ns: int = 0  # 设计模式检测与导入收集耗时（纳秒）
+    parse_cpu_ns: int = 0  # 同上的 CPU 时间（当前线程，纳秒）
+
+
+def file_digest(data: bytes) -> str:
+    """计算文件内容哈希"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def detect_skip_reason(name: str, head: bytes) -> str | None:
+    """
+    根据文件名和文件头判断是否为压缩或生成文件
+
+    Args:
+        name: 文件名
+        head: 文件头部字节
+
+    Returns:
+        跳过原因，正常源码返回 None
+    """
+    if name.endswith(MINIFIED_SUFFIXES):
+        return SKIP_MINIFIED
+
+    if any(marker in head[:1024] for marker in GENERATED_MARKERS):
+        return SKIP_GENERATED
+
+    if len(head) >= HEAD_SIZE:
+        newlines = head.count(b"\n")
+        if newlines == 0 or len(head) / newlines > MINIFIED_AVG_LINE_LENGTH:
+            return SKIP_MINIFIED
+
+    return None
+
+
+def count_file_lines(
+    path: str,
+    size: int,
+    max_size: int | None = MAX_FILE_SIZE,
+    keep_content: bool = False,
+) -> tuple[int | None, str | None, str | None, bytes | None]:
+    """
+    统计文件行数
+
+    以二进制方式按块读取并统计换行符，不解码、不按行分配字符串。
+    末行没有换行符时也计为一行，与 readlines() 一致。
+
+    Args:
+        path: 文件路径
+        size: 文件大小（来自清单）
+        max_size: 文件大小上限，None 表示不限制
+        keep_content: 是否返回文件内容（供设计模式检测复用，避免二次读取）
+
+    Returns:
+        (行数, 内容哈希, 跳过原因, 文件内容)
+    """
+    if max_size is not None and size > max_size:
+        return None, None, SKIP_TOO_LARGE, None
+
+    try:
+        with open(path, "rb") as f:
+            head = f.read(CHUNK_SIZE)
+
+            reason = detect_skip_reason(os.path.basename(path), head)
+            if reason is not None:
+                return None, None, reason, None
+
+            hasher = hashlib.blake2b(head, digest_size=16)
+            lines = head.count(b"\n")
+            last = head[-1:]
+            chunks = [head] if keep_content else None
+
+            if len(head) == CHUNK_SIZE:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    lines += chunk.count(b"\n")
+                    last = chunk[-1:]
+                    if chunks is not None:
+                        chunks.append(chunk)
+    except (OSError, ValueError):
+        return None, None, None, None
+
+    if last and last != b"\n":
+        lines += 1
+
+    content = None
+    if chunks is not None:
+        content = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    return lines, hasher.hexdigest(), None, content
+
+
+def scan_file(
+    entry: FileEntry,
+    pattern_language: str | None = None,
+    max_size: int | None = MAX_FILE_SIZE,
+) -> FileScanResult:
+    """
+    扫描单个文件
+
+    每个文件只读取一次：行数统计、设计模式检测和导入收集共享同一份内容，
+    Python 文件的设计模式检测与导入收集共享同一次 AST 解析和遍历。
+
+    Args:
+        entry: 清单条目
+        pattern_language: 设计模式检测语言
+        max_size: 文件大小上限
+
+    Returns:
+        FileScanResult: 扫描结果
+    """
+    import_language = IMPORT_LANGUAGES.get(os.path.splitext(entry.rel_path)[1])
+    lines, digest, skipped, content = count_file_lines(
+        entry.path,
+        entry.size,
+        max_size,
+        keep_content=pattern_language is not None or import_language is not None,
+    )
+    result = FileScanResult(
+        rel_path=entry.rel_path,
+        language=entry.language,
+        lines=lines,
+        digest=digest,
+        skipped=skipped,
+    )
+    if lines is not None:
+        result.bytes_read = entry.size
+    elif skipped in (SKIP_MINIFIED, SKIP_GENERATED):
+        result.bytes_read = min(entry.size, CHUNK_SIZE)  # 只读取了文件头
+
+    if content is None:
+        return result
+
+    started = time.perf_counter_ns()
+    cpu_started = time.thread_time_ns()
+    file_path = Path(entry.path)
+    if import_language == "python":
+        detect_python_ast_patterns(
+            file_path,
+            content,
+            result.patterns,
+            extra_detectors=[ImportCollector(result.imports)],
+            detect_patterns=pattern_language == "python",
+        )
+    elif import_language is not None:
+        result.imports = extract_js_imports(content)
+
+    if pattern_language is not None and pattern_language != "python":
+        detect_text_based_patterns(file_path, content, result.patterns)
+
+    result.parse_ns = time.perf_counter_ns() - started
+    result.parse_cpu_ns = time.thread_time_ns() - cpu_started
+
+    return result
+
+
+def scan_chunk(
+    tasks: list[ScanTask], max_size: int | None = MAX_FILE_SIZE
+) -> list[FileScanResult]:
+    """扫描一个分片（进程池工作单元）"""
+    return [
+        scan_file(entry, pattern_language, max_size)
+        for entry, pattern_language in tasks
+    ]
+
+
+def resolve_workers(workers: int | None) -> int:
+    """解析工作进程数，0 或 None 表示使用全部 CPU"""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def scan_files(
+    tasks: list[ScanTask],
+    workers: int = 1,
+    max_size: int | None = MAX_FILE_SIZE,
+    on_result: Callable[[FileScanResult], None] | None = None,
+) -> list[FileScanResult]:
+    """
+    扫描文件
+
+    workers > 1 时将任务切分为连续分片交给进程池，
+    executor.map 按提交顺序返回，合并结果与单进程完全一致。
+
+    Args:
+        tasks: 扫描任务
+        workers: 工作进程数
+        max_size: 文件大小上限，None 表示不限制
+        on_result: 每个文件扫描完成后按顺序调用（用于流式输出）
+
+    Returns:
+        list[FileScanResult]: 与 tasks 顺序一致的扫描结果
+    """
+    if workers <= 1 or len(tasks) < MIN_PARALLEL_TASKS:
+        if on_result is None:
+            return scan_chunk(tasks, max_size)
+        results = []
+        for entry, pattern_language in tasks:
+            result = scan_file(entry, pattern_language, max_size)
+            on_result(result)
+            results.append(result)
+        return results
+
+    # 每个进程约 4 个分片，兼顾负载均衡与调度开销
+    chunk_size = max(1, math.ceil(len(tasks) / (workers * 4)))
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    results: list[FileScanResult] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_results in executor.map(partial(scan_chunk, max_size=max_size), chunks):
+            if on_result is not None:
+                for result in chunk_results:
+                    on_result(result)
+            results.extend(chunk_results)
+
+    return results
+
+
+def scan_files_until(
+    tasks: list[ScanTask],
+    deadline: float,
+    workers: int = 1,
+    max_size: int | None = MAX_FILE_SIZE,
+    chunk_size: int = 32,
+    on_result: Callable[[FileScanResult], None] | None = None,
+) -> list[FileScanResult]:
+    """
+    在截止时间前按顺序扫描文件
+
+    返回值始终是 tasks 的一个前缀的结果（到达截止时间后丢弃未按序完成的分片），
+    因此当 tasks 按抽样顺序排列时，结果仍是有效的分层样本。
+
+    Args:
+        tasks: 扫描任务（按优先级排序）
+        deadline: 截止时间（time.monotonic() 时钟）
+        workers: 工作进程数
+        max_size: 文件大小上限
+        chunk_size: 进程池模式下每个分片的文件数
+        on_result: 每个计入结果的文件扫描完成后按顺序调用
+
+    Returns:
+        list[FileScanResult]: tasks 前缀的扫描结果
+    """
+    results: list[FileScanResult] = []
+
+    if workers <= 1:
+        for entry, pattern_language in tasks:
+            # 至少扫描一个文件，保证估计有样本
+            if results and time.monotonic() >= deadline:
+                break
+            result = scan_file(entry, pattern_language, max_size)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # 保持每个进程约 2 个在途分片，截止时未提交的分片无需取消
+        pending: deque[Future] = deque()
+        next_chunk = 0
+        while next_chunk < len(chunks) or pending:
+            while next_chunk < len(chunks) and len(pending) < workers * 2:
+                pending.append(executor.submit(scan_chunk, chunks[next_chunk], max_size))
+                next_chunk += 1
+
+            timeout = None if not results else max(0.0, deadline - time.monotonic())
+            try:
+                chunk_results = pending.popleft().result(timeout=timeout)
+            except FutureTimeoutError:
+                break
+            if on_result is not None:
+                for result in chunk_results:
+                    on_result(result)
+            results.extend(chunk_results)
+            if time.monotonic() >= deadline:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
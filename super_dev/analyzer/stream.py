@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 流式报告输出
+
+以 NDJSON（每行一个 JSON 对象）输出分析结果：项目信息在检测完成后立即输出，
+每个文件的扫描结果在扫描过程中逐条输出，其余部分在分析结束时输出。
+下游工具可以逐行消费，不必等待完整报告，输出端也不会拼接整份 JSON 文档。
+分析器仍在内存中保留每个文件的扫描结果（汇总统计、导入图和 watch 增量更新需要），
+因此内存占用仍随文件数增长。
+"""
+
+import json
+from typing import TextIO
+
+from .models import ArchitectureReport
+from .scanner import FileScanResult
+
+
+def file_record(result: FileScanResult) -> dict:
+    """
+    单个文件扫描结果的记录
+
+    Args:
+        result: 文件扫描结果
+
+    Returns:
+        dict: type 为 "file" 的记录
+    """
+    return {
+        "type": "file",
+        "path": result.rel_path,
+        "language": result.language,
+        "lines": result.lines,
+        "skipped": result.skipped,
+        "patterns": [pattern.to_dict() for pattern in result.patterns],
+        "imports": len(result.imports),
+    }
+
+
+class NDJSONWriter:
+    """NDJSON 记录写入器，可直接作为 ProjectAnalyzer.analyze(emit=...) 的回调"""
+
+    def __init__(self, stream: TextIO, flush: bool = True):
+        """
+        初始化写入器
+
+        Args:
+            stream: 文本输出流
+            flush: 是否每条记录后刷新（管道另一端可实时读取）
+        """
+        self.stream = stream
+        self.flush = flush
+        self.count = 0
+
+    def __call__(self, record: dict) -> None:
+        """写入一条记录"""
+        self.stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self.stream.write("\n")
+        if self.flush:
+            self.stream.flush()
+        self.count += 1
+
+    def write_report(self, report: ArchitectureReport) -> None:
+        """写入整个报告的全部记录"""
+        for record in report.iter_records():
+            self(record)
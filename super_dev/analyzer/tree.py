@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 紧凑目录树
+
+完整目录树以 CSR 形式保存：节点名为驻留后的路径段 ID，
+子节点列表是一个共享的 array（offsets / children），并记录每个子树中文件的最小深度，
+按深度限制展开时无需遍历被截断的部分。DirectoryView 以只读映射的形式按需展开，
+与原先嵌套 dict（目录为 dict、文件为 None）的用法兼容。
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+
+# 无文件子树的最小文件深度
+_NO_FILES = 1 << 30
+
+
+class DirectoryTree:
+    """
+    不可变目录树
+
+    节点 0 为根目录，同一目录下的子节点按目录在前、名称升序排列。
+    """
+
+    ROOT = 0
+
+    __slots__ = ("segments", "names", "is_dir", "offsets", "children", "min_file_depth")
+
+    def __init__(
+        self,
+        segments: list[str],
+        names: array,
+        is_dir: bytearray,
+        offsets: array,
+        children: array,
+        min_file_depth: array,
+    ):
+        self.segments = segments  # 段 ID -> 名称
+        self.names = names  # 节点 -> 段 ID
+        self.is_dir = is_dir
+        self.offsets = offsets  # 节点 i 的子节点为 children[offsets[i]:offsets[i + 1]]
+        self.children = children
+        self.min_file_depth = min_file_depth  # 子树中文件的最小深度（路径中 / 的个数）
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "DirectoryTree":
+        """
+        由文件相对路径构建目录树
+
+        Args:
+            paths: 文件的 POSIX 相对路径
+
+        Returns:
+            DirectoryTree: 目录树
+        """
+        segments: list[str] = [""]
+        segment_ids: dict[str, int] = {"": 0}
+        names = array("i", [0])
+        parents = array("i", [-1])
+        is_dir = bytearray(b"\x01")
+        min_file_depth = array("i", [_NO_FILES])
+        kids: dict[int, list[int]] = {cls.ROOT: []}  # 只有目录有子节点列表
+        dir_nodes: dict[str, int] = {"": cls.ROOT}  # 目录路径 -> 节点，同目录文件只查一次
+        seen: set[str] = set()
+
+        def intern(part: str) -> int:
+            segment = segment_ids.get(part)
+            if segment is None:
+                segment = segment_ids[part] = len(segments)
+                segments.append(part)
+            return segment
+
+        def add_node(parent: int, segment: int, directory: bool, depth: int) -> int:
+            node = len(names)
+            names.append(segment)
+            parents.append(parent)
+            is_dir.append(directory)
+            min_file_depth.append(depth)
+            kids[parent].append(node)
+            if directory:
+                kids[node] = []
+            return node
+
+        for path in paths:
+            if path in seen:
+                continue
+            seen.add(path)
+
+            dir_path, _, file_name = path.rpartition("/")
+            node = dir_nodes.get(dir_path)
+            if node is None:
+                node = cls.ROOT
+                prefix = ""
+                for part in dir_path.split("/"):
+                    prefix = f"{prefix}/{part}" if prefix else part
+                    child = dir_nodes.get(prefix)
+                    if child is None:
+                        child = dir_nodes[prefix] = add_node(node, intern(part), True, _NO_FILES)
+                    node = child
+
+            # 祖先的最小文件深度不大于子孙，遇到不需要更新的节点即可停止
+            depth = path.count("/")
+            add_node(node, intern(file_name), False, depth)
+            while node >= 0 and depth < min_file_depth[node]:
+                min_file_depth[node] = depth
+                node = parents[node]
+
+        offsets = array("i", [0])
+        children = array("i")
+        for node in range(len(names)):
+            node_kids = kids.get(node)
+            if node_kids:
+                node_kids.sort(key=lambda child: (not is_dir[child], segments[names[child]]))
+                children.extend(node_kids)
+            offsets.append(len(children))
+
+        return cls(segments, names, is_dir, offsets, children, min_file_depth)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def name(self, node: int) -> str:
+        return self.segments[self.names[node]]
+
+    def child_nodes(self, node: int) -> array:
+        """直接子节点（目录在前、按名称排序）"""
+        return self.children[self.offsets[node]:self.offsets[node + 1]]
+
+    def view(self, max_depth: int | None = None) -> "DirectoryView":
+        """根目录的映射视图，只包含深度不超过 max_depth 的文件及其所在目录"""
+        return DirectoryView(self, self.ROOT, max_depth)
+
+
+class DirectoryView(Mapping):
+    """
+    目录树的只读映射视图
+
+    子目录为 DirectoryView，文件为 None；访问时才展开对应的一层。
+    """
+
+    __slots__ = ("tree", "node", "max_depth", "_entries")
+
+    def __init__(self, tree: DirectoryTree, node: int = DirectoryTree.ROOT, max_depth: int | None = None):
+        self.tree = tree
+        self.node = node
+        self.max_depth = _NO_FILES - 1 if max_depth is None else max_depth
+        self._entries: dict[str, int] | None = None
+
+    def _children(self) -> dict[str, int]:
+        if self._entries is None:
+            tree = self.tree
+            self._entries = {
+                tree.name(child): child
+                for child in tree.child_nodes(self.node)
+                if tree.min_file_depth[child] <= self.max_depth
+            }
+        return self._entries
+
+    def __getitem__(self, name: str) -> "DirectoryView | None":
+        child = self._children()[name]
+        if not self.tree.is_dir[child]:
+            return None
+        return DirectoryView(self.tree, child, self.max_depth)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._children())
+
+    def __len__(self) -> int:
+        return len(self._children())
+
+    def __repr__(self) -> str:
+        return f"DirectoryView({list(self._children())!r})"
+
+    def expand(self, max_depth: int | None) -> "DirectoryView":
+        """以新的深度限制查看同一目录"""
+        return DirectoryView(self.tree, self.node, max_depth)
+
+    def to_dict(self) -> dict:
+        """展开为嵌套 dict（目录为 dict、文件为 None）"""
+        return {
+            name: subtree.to_dict() if subtree is not None else None
+            for name, subtree in self.items()
+        }
+
+
+def render_tree(tree: Mapping, max_depth: int = 2, max_children: int = 20) -> list[str]:
+    """
+    将目录树渲染为缩进列表（Markdown 使用）
+
+    Args:
+        tree: 目录映射（DirectoryView 或嵌套 dict）
+        max_depth: 展开的目录层数
+        max_children: 每个目录最多列出的条目数
+
+    Returns:
+        list[str]: 每行一个条目
+    """
+    lines: list[str] = []
+
+    def render(subtree: Mapping, level: int) -> None:
+        for index, (name, child) in enumerate(subtree.items()):
+            if index == max_children:
+                lines.append(f"{'  ' * level}- ... 还有 {len(subtree) - max_children} 项")
+                break
+            if child is None:
+                lines.append(f"{'  ' * level}- {name}")
+                continue
+            lines.append(f"{'  ' * level}- {name}/")
+            if level + 1 < max_depth:
+                render(child, level + 1)
+
+    render(tree, 0)
+    return lines
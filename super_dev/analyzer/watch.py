@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 文件变化监听
+
+Linux 上通过 ctypes 调用 inotify，其他平台或 inotify 不可用时
+退化为基于清单 (大小, mtime) 的轮询。两种实现都返回变化文件的相对路径集合，
+空字符串表示需要重新遍历整个项目（如 inotify 事件队列溢出）。
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from .ignore import IgnoreMatcher
+from .manifest import IGNORE_DIRS, build_manifest
+
+
+# 表示整个项目需要重新遍历
+RESCAN_ALL = ""
+
+# inotify 事件掩码（见 <sys/inotify.h>）
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class BaseWatcher(ABC):
+    """文件变化监听器基类"""
+
+    @abstractmethod
+    def poll(self, timeout: float) -> set[str]:
+        """
+        等待文件变化
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            set[str]: 变化路径（相对项目根目录），超时返回空集合
+        """
+
+    def close(self) -> None:
+        """释放资源"""
+
+    def __enter__(self) -> "BaseWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PollingWatcher(BaseWatcher):
+    """基于 (大小, mtime) 快照轮询的监听器"""
+
+    def __init__(
+        self,
+        root: str | Path,
+        ignore: IgnoreMatcher | None = None,
+        interval: float = 0.5,
+        follow_symlinks: bool = False,
+    ):
+        """
+        初始化监听器
+
+        Args:
+            root: 项目根目录
+            ignore: 忽略规则
+            interval: 轮询间隔（秒）
+            follow_symlinks: 是否跟随符号链接（与分析时的遍历策略一致）
+        """
+        self.root = Path(root).resolve()
+        self.ignore = ignore
+        self.interval = interval
+        self.follow_symlinks = follow_symlinks
+        self._snapshot, self._dirs = self._take_snapshot()
+
+    def _take_snapshot(self) -> tuple[dict[str, tuple[int, int]], set[str]]:
+        manifest = build_manifest(
+            self.root, ignore=self.ignore, follow_symlinks=self.follow_symlinks
+        )
+        files = {entry.rel_path: (entry.size, entry.mtime_ns) for entry in manifest.files}
+        return files, set(manifest.dirs)
+
+    def poll(self, timeout: float) -> set[str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot, dirs = self._take_snapshot()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            changed |= dirs ^ self._dirs
+            self._snapshot, self._dirs = snapshot, dirs
+            if changed:
+                return changed
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+
+class InotifyWatcher(BaseWatcher):
+    """基于 Linux inotify 的监听器"""
+
+    def __init__(
+        self,
+        root: str | Path,
+        dirs: list[str] | None = None,
+        debounce: float = 0.02,
+    ):
+        """
+        初始化监听器
+
+        Args:
+            root: 项目根目录
+            dirs: 需要监听的子目录（相对路径，通常取自文件清单），None 时自行遍历
+            debounce: 收到首个事件后继续合并事件的时间（秒），用于合并编辑器的连续写入
+
+        Raises:
+            OSError: 当前平台不支持 inotify 或监听数量超过系统上限
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify 仅在 Linux 上可用")
+
+        self.root = Path(root).resolve()
+        self.debounce = debounce
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._watches: dict[int, str] = {}
+        try:
+            self._add_watch("")
+            for rel_dir in dirs if dirs is not None else self._walk_dirs(""):
+                self._add_watch(rel_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, rel_dir: str) -> None:
+        path = os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self._watches[wd] = rel_dir
+
+    def _walk_dirs(self, rel_dir: str) -> list[str]:
+        """列出某目录下（含自身以下各层）需要监听的目录"""
+        result: list[str] = []
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            path = os.path.join(self.root, current) if current else str(self.root)
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name in IGNORE_DIRS or not entry.is_dir(follow_symlinks=False):
+                            continue
+                        child = f"{current}/{entry.name}" if current else entry.name
+                        result.append(child)
+                        stack.append(child)
+            except OSError:
+                continue
+        return result
+
+    def _read_events(self, changed: set[str]) -> None:
+        """读取并解析当前可读的全部事件"""
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            if not buffer:
+                return
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0").decode(
+                    sys.getfilesystemencoding(), "surrogateescape"
+                )
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(RESCAN_ALL)
+                    continue
+
+                rel_dir = self._watches.get(wd)
+                if rel_dir is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._watches[wd]
+                    continue
+
+                rel_path = f"{rel_dir}/{name}" if rel_dir and name else (name or rel_dir)
+                if name and name in IGNORE_DIRS and mask & IN_ISDIR:
+                    continue
+                changed.add(rel_path)
+
+                # 新建或移入的目录需要补充监听
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._add_watch(rel_path)
+                        for child in self._walk_dirs(rel_path):
+                            self._add_watch(child)
+                    except OSError:
+                        changed.add(RESCAN_ALL)
+
+    def poll(self, timeout: float) -> set[str]:
+        changed: set[str] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+
+        self._read_events(changed)
+        deadline = time.monotonic() + self.debounce
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                break
+            self._read_events(changed)
+
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+
+def create_watcher(
+    root: str | Path,
+    dirs: list[str] | None = None,
+    ignore: IgnoreMatcher | None = None,
+    interval: float = 0.5,
+    use_inotify: bool = True,
+    follow_symlinks: bool = False,
+) -> BaseWatcher:
+    """
+    创建文件变化监听器
+
+    优先使用 inotify，不可用时（非 Linux、监听数量超限等）退化为轮询。
+
+    Args:
+        root: 项目根目录
+        dirs: 需要监听的子目录（inotify 使用）
+        ignore: 忽略规则（轮询使用）
+        interval: 轮询间隔（秒）
+        use_inotify: 是否尝试使用 inotify
+        follow_symlinks: 轮询遍历是否跟随符号链接
+
+    Returns:
+        BaseWatcher: 监听器
+    """
+    if use_inotify:
+        try:
+            return InotifyWatcher(root, dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, ignore, interval, follow_symlinks)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 工作区（monorepo）检测
+
+识别 npm/yarn/pnpm workspaces、uv workspace、Poetry 路径依赖和 Go workspace，
+返回各成员包相对项目根目录的路径。成员通配符与文件清单中的目录匹配，不额外遍历磁盘。
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from .ignore import _translate_glob
+from .manifest import FileManifest
+from .models import ProjectCategory
+from .package_manifests import PackageManifests
+
+
+@dataclass(frozen=True)
+class WorkspacePackage:
+    """工作区成员包"""
+
+    rel_path: str  # 相对项目根目录的 POSIX 路径
+    kind: str  # npm / yarn / pnpm / uv / poetry / go
+
+
+# 各类工作区成员目录中必须存在的清单文件
+_MARKERS = {
+    "npm": "package.json",
+    "yarn": "package.json",
+    "pnpm": "package.json",
+    "uv": "pyproject.toml",
+    "poetry": "pyproject.toml",
+    "go": "go.mod",
+}
+
+
+def detect_workspaces(
+    project_path: str | Path,
+    manifest: FileManifest,
+    manifests: PackageManifests | None = None,
+) -> list[WorkspacePackage]:
+    """
+    检测工作区成员包
+
+    Args:
+        project_path: 项目根目录
+        manifest: 文件清单（用于展开成员通配符）
+        manifests: 根目录已解析的清单文件
+
+    Returns:
+        list[WorkspacePackage]: 按路径排序的成员包，非 monorepo 返回空列表
+    """
+    if manifests is None:
+        manifests = PackageManifests(project_path)
+    file_paths = {entry.rel_path for entry in manifest.files}
+    packages: dict[str, WorkspacePackage] = {}
+
+    for kind, includes, excludes in (
+        _node_workspace_globs(manifests),
+        _uv_workspace_globs(manifests),
+        _poetry_workspace_globs(manifests),
+        _go_workspace_globs(manifests),
+    ):
+        if not includes:
+            continue
+        marker = _MARKERS[kind]
+        for rel_dir in _expand_globs(includes, excludes, manifest.dirs):
+            if f"{rel_dir}/{marker}" in file_paths and rel_dir not in packages:
+                packages[rel_dir] = WorkspacePackage(rel_path=rel_dir, kind=kind)
+
+    return sorted(packages.values(), key=lambda p: p.rel_path)
+
+
+def merge_categories(categories: list[ProjectCategory]) -> ProjectCategory:
+    """
+    由成员包类型推断整个工作区的类型
+
+    同时包含前端和后端（或已有全栈包）时为全栈，否则取出现最多的类型。
+    """
+    known = [c for c in categories if c != ProjectCategory.UNKNOWN]
+    if not known:
+        return ProjectCategory.UNKNOWN
+
+    kinds = set(known)
+    if ProjectCategory.FULLSTACK in kinds or {
+        ProjectCategory.FRONTEND, ProjectCategory.BACKEND
+    } <= kinds:
+        return ProjectCategory.FULLSTACK
+    return max(kinds, key=lambda c: (known.count(c), c.value))
+
+
+def _normalize(pattern: str) -> str:
+    """去掉 ./ 前缀和末尾的 /"""
+    pattern = pattern.strip()
+    while pattern.startswith("./"):
+        pattern = pattern[2:]
+    return pattern.rstrip("/")
+
+
+def _expand_globs(includes: list[str], excludes: list[str], dirs: list[str]) -> list[str]:
+    """将成员通配符与清单目录匹配"""
+    def compile_globs(globs: list[str]) -> re.Pattern | None:
+        bodies = [_translate_glob(g) for g in map(_normalize, globs) if g and g != "."]
+        return re.compile("|".join(f"(?:{b})$" for b in bodies)) if bodies else None
+
+    include_re = compile_globs(includes)
+    exclude_re = compile_globs(excludes)
+    if include_re is None:
+        return []
+
+    return [
+        rel_dir for rel_dir in dirs
+        if include_re.match(rel_dir) and not (exclude_re and exclude_re.match(rel_dir))
+    ]
+
+
+def _split_negations(patterns: list) -> tuple[list[str], list[str]]:
+    """拆分包含规则与 ! 开头的排除规则"""
+    includes: list[str] = []
+    excludes: list[str] = []
+    for pattern in patterns:
+        if not isinstance(pattern, str):
+            continue
+        if pattern.startswith("!"):
+            excludes.append(pattern[1:])
+        else:
+            includes.append(pattern)
+    return includes, excludes
+
+
+def _node_workspace_globs(manifests: PackageManifests) -> tuple[str, list[str], list[str]]:
+    """package.json workspaces 或 pnpm-workspace.yaml"""
+    pnpm_text = manifests.read_text("pnpm-workspace.yaml")
+    if pnpm_text is not None:
+        try:
+            data = yaml.safe_load(pnpm_text) or {}
+            return ("pnpm", *_split_negations(data.get("packages") or []))
+        except (yaml.YAMLError, AttributeError):
+            pass
+
+    workspaces = (manifests.package_json or {}).get("workspaces")
+    if isinstance(workspaces, dict):  # yarn: {"packages": [...], "nohoist": [...]}
+        workspaces = workspaces.get("packages")
+    if isinstance(workspaces, list):
+        kind = "yarn" if manifests.exists("yarn.lock") else "npm"
+        return (kind, *_split_negations(workspaces))
+
+    return "npm", [], []
+
+
+def _uv_workspace_globs(manifests: PackageManifests) -> tuple[str, list[str], list[str]]:
+    """[tool.uv.workspace] members / exclude"""
+    workspace = (manifests.pyproject or {}).get("tool", {}).get("uv", {}).get("workspace", {})
+    return "uv", list(workspace.get("members", [])), list(workspace.get("exclude", []))
+
+
+def _poetry_workspace_globs(manifests: PackageManifests) -> tuple[str, list[str], list[str]]:
+    """Poetry 没有原生工作区，以指向项目内目录的路径依赖作为成员"""
+    poetry = (manifests.pyproject or {}).get("tool", {}).get("poetry", {})
+
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables.extend(group.get("dependencies", {}) for group in poetry.get("group", {}).values())
+
+    members: list[str] = []
+    for table in tables:
+        for spec in table.values():
+            if isinstance(spec, dict) and isinstance(spec.get("path"), str):
+                path = _normalize(spec["path"])
+                if path and not path.startswith(".."):
+                    members.append(path)
+    return "poetry", members, []
+
+
+def _go_workspace_globs(manifests: PackageManifests) -> tuple[str, list[str], list[str]]:
+    """go.work 中的 use 指令"""
+    content = manifests.read_text("go.work")
+    if content is None:
+        return "go", [], []
+
+    members: list[str] = []
+    for block in re.findall(r"^use\s*\(([^)]*)\)", content, re.MULTILINE):
+        members.extend(line.split("//")[0].strip() for line in block.splitlines())
+    members.extend(re.findall(r"^use\s+([^\s(]+)", content, re.MULTILINE))
+    # 成员路径中的 glob 元字符按字面处理
+    return "go", [re.sub(r"([*?\[])", r"\\\1", m) for m in members if m], []
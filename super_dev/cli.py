@@ -23,6 +23,7 @@ except ImportError:
 from . import __version__, __description__
 from .config import get_config_manager, ConfigManager
 from .orchestrator import WorkflowEngine, Phase
+from .tracing import SpanSequence, span, start_tracing, stop_tracing
 
 
 class SuperDevCLI:
@@ -55,6 +56,11 @@ class SuperDevCLI:
             action="version",
             version=f"%(prog)s {__version__}"
         )
+        parser.add_argument(
+            "--trace",
+            metavar="FILE",
+            help="记录各阶段耗时并写入 Chrome trace 文件（可在 Perfetto / chrome://tracing 中打开）"
+        )
 
         # 子命令
         subparsers = parser.add_subparsers(
@@ -156,15 +162,68 @@ class SuperDevCLI:
         )
         analyze_parser.add_argument(
             "-f", "--format",
-            choices=["json", "markdown", "text"],
+            choices=["json", "markdown", "text", "ndjson"],
             default="text",
-            help="输出格式"
+            help="输出格式 (ndjson: 边分析边逐行输出 JSON 记录，适合超大仓库)"
         )
         analyze_parser.add_argument(
             "--json",
             action="store_true",
             help="以 JSON 格式输出"
         )
+        analyze_parser.add_argument(
+            "-j", "--jobs",
+            type=int,
+            default=1,
+            help="并行扫描的工作进程数 (0 表示使用全部 CPU，默认 1)；--batch 模式下为同时分析的仓库数"
+        )
+        analyze_parser.add_argument(
+            "--batch",
+            metavar="REPOS_FILE",
+            help="批量分析列表文件中的仓库 (每行一个路径)，逐个输出结果并生成跨仓库汇总报告"
+        )
+        analyze_parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="不使用 .super-dev/cache 增量分析缓存"
+        )
+        analyze_parser.add_argument(
+            "--max-file-size",
+            type=int,
+            default=4096,
+            help="单文件大小上限 (KB)，超过的文件不读取 (0 表示不限制，默认 4096)"
+        )
+        analyze_parser.add_argument(
+            "--budget",
+            type=float,
+            help="时间预算 (秒，含目录遍历)，到时停止读取文件，按分层抽样估计行数并给出 95%% 置信区间"
+        )
+        analyze_parser.add_argument(
+            "--sample-rate",
+            type=float,
+            help="抽样比例 (0-1]，按目录和语言分层抽样读取文件"
+        )
+        analyze_parser.add_argument(
+            "-w", "--watch",
+            action="store_true",
+            help="持续监听文件变化，增量更新并重新输出报告 (Ctrl+C 退出)"
+        )
+        analyze_parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.5,
+            help="监听模式下的轮询间隔 (秒，默认 0.5；inotify 可用时仅用于检查退出)"
+        )
+        analyze_parser.add_argument(
+            "--follow-symlinks",
+            action="store_true",
+            help="跟随符号链接 (按 inode 去重，避免链接环和重复统计；默认不跟随)"
+        )
+        analyze_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="记录并输出各阶段的耗时、CPU 时间、读取量和内存峰值"
+        )
 
         # workflow 命令
         workflow_parser = subparsers.add_parser(
@@ -183,6 +242,29 @@ class SuperDevCLI:
             type=int,
             help="质量门禁阈值 (0-100)"
         )
+        workflow_parser.add_argument(
+            "-j", "--jobs",
+            type=int,
+            help="同时执行的阶段数上限（互不依赖的阶段并发执行，默认使用配置 phase_concurrency）"
+        )
+        workflow_parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="不复用 .super-dev/cache/workflow 中的阶段结果，全部重新执行"
+        )
+        workflow_parser.add_argument(
+            "--resume",
+            nargs="?",
+            const="latest",
+            metavar="RUN_ID",
+            help="从 .super-dev/runs/<RUN_ID>/ 检查点继续运行（省略 RUN_ID 时为最近一次运行）"
+        )
+        workflow_parser.add_argument(
+            "--events",
+            action="store_true",
+            help="以 NDJSON 逐行输出工作流事件（阶段开始/完成/进度/门禁失败），便于 CI 日志与看板消费；"
+                 "其余输出改写到标准错误"
+        )
 
         # expert 命令
         expert_parser = subparsers.add_parser(
@@ -806,11 +888,18 @@ class SuperDevCLI:
             self.console.print(f"[red]未知命令: {parsed_args.command}[/red]")
             return 1
 
+        tracer = start_tracing() if parsed_args.trace else None
         try:
-            return command_handler(parsed_args)
+            with span(f"cli.{parsed_args.command}", "cli"):
+                return command_handler(parsed_args)
         except Exception as e:
             self.console.print(f"[red]错误: {e}[/red]")
             return 1
+        finally:
+            if tracer is not None:
+                stop_tracing()
+                trace_path = tracer.write_chrome_trace(parsed_args.trace)
+                self.console.print(f"[dim]追踪已写入: {trace_path}[/dim]")
 
     # ==================== 命令处理器 ====================
 
@@ -866,58 +955,50 @@ class SuperDevCLI:
         """分析现有项目"""
         from .analyzer import ProjectAnalyzer
 
+        if args.batch:
+            return self._cmd_analyze_batch(args)
+
         project_path = Path(args.path).resolve()
 
         if not project_path.exists():
             self.console.print(f"[red]项目不存在: {project_path}[/red]")
             return 1
 
-        self.console.print(f"[cyan]正在分析项目: {project_path}[/cyan]")
+        # ndjson 输出到 stdout 时，stdout 只保留记录
+        streaming = args.format == "ndjson" and not args.json
+        if not (streaming and not args.output):
+            self.console.print(f"[cyan]正在分析项目: {project_path}[/cyan]")
 
         try:
             analyzer = ProjectAnalyzer(project_path)
-            report = analyzer.analyze()
-
-            # 根据格式输出
-            output_format = "json" if args.json else args.format
-
-            if output_format == "json":
-                import json
-                output = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
-
-                if args.output:
-                    Path(args.output).write_text(output, encoding="utf-8")
-                    self.console.print(f"[green]报告已保存到: {args.output}[/green]")
-                else:
-                    self.console.print(output)
-
-            elif output_format == "markdown":
-                output = report.to_markdown()
-
-                if args.output:
-                    Path(args.output).write_text(output, encoding="utf-8")
-                    self.console.print(f"[green]报告已保存到: {args.output}[/green]")
-                else:
-                    self.console.print(output)
+            analyze_options = {
+                "workers": args.jobs,
+                "use_cache": not args.no_cache,
+                "max_file_size": args.max_file_size * 1024 or None,
+                "budget_seconds": args.budget,
+                "sample_rate": args.sample_rate,
+                "profile": args.profile,
+                "follow_symlinks": args.follow_symlinks,
+            }
 
-            else:  # text
-                self.console.print(f"[cyan]项目分析报告[/cyan]")
-                self.console.print(f"  路径: {report.project_path}")
-                self.console.print(f"  类型: {report.category.value}")
-                self.console.print(f"  语言: {report.tech_stack.language}")
-                self.console.print(f"  框架: {report.tech_stack.framework.value}")
-                if report.tech_stack.ui_library:
-                    self.console.print(f"  UI 库: {report.tech_stack.ui_library}")
-                if report.tech_stack.state_management:
-                    self.console.print(f"  状态管理: {report.tech_stack.state_management}")
-                self.console.print(f"  文件数: {report.file_count}")
-                self.console.print(f"  代码行数: {report.total_lines:,}")
-                self.console.print(f"  依赖数: {len(report.tech_stack.dependencies)}")
+            if args.watch:
+                self.console.print("[dim]监听文件变化中，按 Ctrl+C 退出[/dim]")
+                try:
+                    analyzer.watch(
+                        lambda report: self._print_analyze_report(report, args),
+                        interval=args.interval,
+                        **analyze_options,
+                    )
+                except KeyboardInterrupt:
+                    self.console.print("[yellow]已停止监听[/yellow]")
+                return 0
 
-                if args.output:
-                    Path(args.output).write_text(report.to_markdown(), encoding="utf-8")
-                    self.console.print(f"[green]报告已保存到: {args.output}[/green]")
+            if streaming:
+                self._stream_analyze_report(analyzer, analyze_options, args)
+                return 0
 
+            report = analyzer.analyze(**analyze_options)
+            self._print_analyze_report(report, args)
             return 0
 
         except Exception as e:
@@ -926,6 +1007,163 @@ class SuperDevCLI:
             self.console.print(traceback.format_exc())
             return 1
 
+    def _cmd_analyze_batch(self, args) -> int:
+        """批量分析多个仓库"""
+        import json
+
+        from .analyzer import ProjectAnalyzer, aggregate_results
+        from .analyzer.batch import read_batch_file
+        from .analyzer.stream import NDJSONWriter
+
+        try:
+            repositories = read_batch_file(args.batch)
+        except OSError as e:
+            self.console.print(f"[red]无法读取仓库列表: {e}[/red]")
+            return 1
+
+        output_format = "json" if args.json else args.format
+        writer = NDJSONWriter(sys.stdout) if output_format == "ndjson" else None
+        finished = 0
+
+        def on_result(result) -> None:
+            nonlocal finished
+            finished += 1
+            if writer is not None:
+                writer({"type": "repository", **result.to_dict()})
+            elif result.ok:
+                self.console.print(
+                    f"[green]✓[/green] [{finished}/{len(repositories)}] {result.path} "
+                    f"({result.report.tech_stack.language}, {result.report.total_lines:,} 行, "
+                    f"{result.seconds:.1f}s)"
+                )
+            else:
+                self.console.print(
+                    f"[red]✗[/red] [{finished}/{len(repositories)}] {result.path}: {result.error}"
+                )
+
+        results = ProjectAnalyzer.analyze_many(
+            repositories,
+            jobs=args.jobs,
+            on_result=on_result,
+            use_cache=not args.no_cache,
+            max_file_size=args.max_file_size * 1024 or None,
+            budget_seconds=args.budget,
+            sample_rate=args.sample_rate,
+            follow_symlinks=args.follow_symlinks,
+        )
+        summary = aggregate_results(results)
+
+        if writer is not None:
+            writer({"type": "batch_summary", **summary.to_dict()})
+            output = None
+        elif output_format == "json":
+            output = json.dumps(summary.to_dict(), indent=2, ensure_ascii=False)
+        else:
+            output = summary.to_markdown()
+
+        if output is not None:
+            if args.output:
+                Path(args.output).write_text(output, encoding="utf-8")
+                self.console.print(f"[green]汇总报告已保存到: {args.output}[/green]")
+            else:
+                self.console.print(output)
+
+        return 0 if not summary.failures else 1
+
+    def _stream_analyze_report(self, analyzer, analyze_options: dict, args) -> None:
+        """边分析边以 NDJSON 输出报告"""
+        from .analyzer.stream import NDJSONWriter
+
+        if not args.output:
+            analyzer.analyze(emit=NDJSONWriter(sys.stdout), **analyze_options)
+            return
+
+        with open(args.output, "w", encoding="utf-8") as f:
+            writer = NDJSONWriter(f, flush=False)
+            analyzer.analyze(emit=writer, **analyze_options)
+        self.console.print(f"[green]报告已保存到: {args.output} ({writer.count} 条记录)[/green]")
+
+    def _print_analyze_report(self, report, args) -> None:
+        """按 analyze 命令参数输出报告"""
+        # 根据格式输出
+        output_format = "json" if args.json else args.format
+
+        if output_format == "ndjson":
+            from .analyzer.stream import NDJSONWriter
+
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as f:
+                    NDJSONWriter(f, flush=False).write_report(report)
+                self.console.print(f"[green]报告已保存到: {args.output}[/green]")
+            else:
+                NDJSONWriter(sys.stdout).write_report(report)
+
+        elif output_format == "json":
+            import json
+            output = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+
+            if args.output:
+                Path(args.output).write_text(output, encoding="utf-8")
+                self.console.print(f"[green]报告已保存到: {args.output}[/green]")
+            else:
+                self.console.print(output)
+
+        elif output_format == "markdown":
+            output = report.to_markdown()
+
+            if args.output:
+                Path(args.output).write_text(output, encoding="utf-8")
+                self.console.print(f"[green]报告已保存到: {args.output}[/green]")
+            else:
+                self.console.print(output)
+
+        else:  # text
+            self.console.print(f"[cyan]项目分析报告[/cyan]")
+            self.console.print(f"  路径: {report.project_path}")
+            self.console.print(f"  类型: {report.category.value}")
+            self.console.print(f"  语言: {report.tech_stack.language}")
+            self.console.print(f"  框架: {report.tech_stack.framework.value}")
+            if report.tech_stack.ui_library:
+                self.console.print(f"  UI 库: {report.tech_stack.ui_library}")
+            if report.tech_stack.state_management:
+                self.console.print(f"  状态管理: {report.tech_stack.state_management}")
+            total = report.estimates.get("total_lines")
+            if total is not None:
+                self.console.print(
+                    f"  抽样: 读取 {total.sampled:,} / {total.population:,} 个文件，"
+                    f"标注 ≈ 的数值为 95% 置信区间估计"
+                )
+            if report.unvisited_dirs:
+                self.console.print(
+                    f"  [yellow]遍历未完成: {report.unvisited_dirs:,} 个目录未进入，"
+                    f"统计只覆盖已遍历的部分[/yellow]"
+                )
+            self.console.print(f"  文件数: {report.format_count('file_count', report.file_count, grouped=False)}")
+            self.console.print(f"  代码行数: {report.format_count('total_lines', report.total_lines)}")
+            if report.estimates:
+                for language, lines in sorted(
+                    report.languages_used.items(), key=lambda item: item[1], reverse=True
+                ):
+                    formatted = report.format_count(f"languages_used.{language}", lines)
+                    self.console.print(f"    {language}: {formatted} 行")
+            self.console.print(f"  依赖数: {len(report.tech_stack.dependencies)}")
+            if report.timings:
+                self.console.print(f"[cyan]各阶段耗时[/cyan]")
+                for timing in report.timings:
+                    memory = (
+                        f"  峰值 {timing.peak_memory / 1024:.0f} KiB"
+                        if timing.peak_memory is not None else ""
+                    )
+                    self.console.print(
+                        f"  {timing.name:<11} 墙钟 {timing.wall_seconds:.3f}s  "
+                        f"CPU {timing.cpu_seconds:.3f}s  文件 {timing.files}  "
+                        f"读取 {timing.bytes_read / 1024:.0f} KiB{memory}"
+                    )
+
+            if args.output:
+                Path(args.output).write_text(report.to_markdown(), encoding="utf-8")
+                self.console.print(f"[green]报告已保存到: {args.output}[/green]")
+
     def _cmd_workflow(self, args) -> int:
         """运行工作流"""
         config_manager = get_config_manager()
@@ -954,11 +1192,39 @@ class SuperDevCLI:
 
         # 运行工作流
         import asyncio
-        engine = WorkflowEngine()
-        results = asyncio.run(engine.run(phases=phases))
+        engine = WorkflowEngine(max_concurrency=args.jobs, use_cache=not args.no_cache)
+        if args.events:
+            from .analyzer.stream import NDJSONWriter
+            # 标准输出只留给 NDJSON 事件，进度与提示改写到标准错误
+            if RICH_AVAILABLE:
+                self.console = Console(stderr=True)
+                engine.console = Console(stderr=True)
+            writer = NDJSONWriter(sys.stdout)
+            engine.add_listener(lambda event: writer(event.to_dict()))
+        try:
+            if args.resume:
+                run_id = None if args.resume == "latest" else args.resume
+                results = asyncio.run(engine.resume(run_id))
+            else:
+                results = asyncio.run(engine.run(phases=phases))
+        except ValueError as e:
+            self.console.print(f"[red]{e}[/red]")
+            return 1
+        except KeyboardInterrupt:
+            # asyncio.run 会取消运行中的阶段，已完成的阶段保存在检查点中
+            if engine.run_id:
+                self.console.print(
+                    f"\n[yellow]已中止，可使用 'super-dev workflow --resume {engine.run_id}' 继续[/yellow]"
+                )
+            return 130
 
         # 检查是否全部成功
         all_success = all(r.success for r in results.values())
+        if not all_success:
+            self.console.print(
+                f"[dim]运行 ID: {engine.run_id}，修复后可使用 "
+                f"'super-dev workflow --resume {engine.run_id}' 继续[/dim]"
+            )
 
         return 0 if all_success else 1
 
@@ -1110,6 +1376,7 @@ class SuperDevCLI:
     def _cmd_design(self, args) -> int:
         """设计智能引擎命令"""
         from .design import DesignIntelligenceEngine, DesignSystemGenerator, TokenGenerator
+        from .design.generator import EXPORT_MANIFEST
 
         if args.design_command == "search":
             # 搜索设计资产
@@ -1174,7 +1441,8 @@ class SuperDevCLI:
             self.console.print(f"  平台: {args.platform}")
             self.console.print()
 
-            generator = DesignSystemGenerator()
+            # 增量导出清单保存在 .super-dev/cache 中，不写入输出目录
+            generator = DesignSystemGenerator(manifest_path=Path.cwd() / EXPORT_MANIFEST)
 
             design_system = generator.generate(
                 product_type=args.product,
@@ -1743,8 +2011,11 @@ class SuperDevCLI:
         self.console.print(f"[dim]技术栈: {args.platform} | {args.frontend} | {args.backend}[/dim]")
         self.console.print("")
 
+        stages = SpanSequence("pipeline")
+
         try:
             # ========== 第 1 阶段: 生成文档 ==========
+            stages.next("pipeline.documents")
             self.console.print("[cyan]第 1 阶段: 生成专业文档...[/cyan]")
             from .creators import DocumentGenerator
 
@@ -1783,6 +2054,7 @@ class SuperDevCLI:
             self._save_tech_stack_to_config(project_dir, tech_stack, args.description)
 
             # ========== 第 2 阶段: 创建 Spec ==========
+            stages.next("pipeline.spec")
             self.console.print("[cyan]第 2 阶段: 创建 Spec 规范...[/cyan]")
             from .creators import SpecBuilder
 
@@ -1800,15 +2072,27 @@ class SuperDevCLI:
             self.console.print("")
 
             # ========== 第 3 阶段: 红队审查 ==========
+            stages.next("pipeline.redteam", skipped=args.skip_redteam)
             redteam_report = None
+            analyzer = None
             if not args.skip_redteam:
                 self.console.print("[cyan]第 3 阶段: 红队审查...[/cyan]")
+                from .analyzer import ProjectAnalyzer
                 from .reviewers import RedTeamReviewer
 
+                # 已有代码时，架构审查使用真实的模块依赖数据
+                analyzer = ProjectAnalyzer(project_dir)
+                try:
+                    # 不写入 .super-dev/cache/analysis.json，避免在用户项目中留下缓存文件
+                    architecture_report = analyzer.analyze(use_cache=False)
+                except (OSError, ValueError):
+                    architecture_report = None
+
                 reviewer = RedTeamReviewer(
                     project_dir=project_dir,
                     name=project_name,
-                    tech_stack=tech_stack
+                    tech_stack=tech_stack,
+                    architecture=architecture_report,
                 )
                 redteam_report = reviewer.review()
 
@@ -1828,14 +2112,17 @@ class SuperDevCLI:
                 self.console.print("")
 
             # ========== 第 4 阶段: 质量门禁 ==========
+            stages.next("pipeline.quality_gate", skipped=args.skip_quality_gate)
             if not args.skip_quality_gate:
                 self.console.print("[cyan]第 4 阶段: 质量门禁检查...[/cyan]")
                 from .reviewers import QualityGateChecker
 
+                # 复用第 3 阶段已解析的清单文件
                 gate_checker = QualityGateChecker(
                     project_dir=project_dir,
                     name=project_name,
-                    tech_stack=tech_stack
+                    tech_stack=tech_stack,
+                    manifests=analyzer.package_manifests if analyzer is not None else None,
                 )
 
                 gate_result = gate_checker.check(redteam_report)
@@ -1868,6 +2155,7 @@ class SuperDevCLI:
                 self.console.print("")
 
             # ========== 第 5 阶段: 代码审查指南 ==========
+            stages.next("pipeline.code_review")
             self.console.print("[cyan]第 5 阶段: 生成代码审查指南...[/cyan]")
             from .reviewers import CodeReviewGenerator
 
@@ -1885,6 +2173,7 @@ class SuperDevCLI:
             self.console.print("")
 
             # ========== 第 6 阶段: AI 提示词 ==========
+            stages.next("pipeline.ai_prompt")
             self.console.print("[cyan]第 6 阶段: 生成 AI 提示词...[/cyan]")
             from .creators import AIPromptGenerator
 
@@ -1901,6 +2190,7 @@ class SuperDevCLI:
             self.console.print("")
 
             # ========== 第 7 阶段: CI/CD 配置 ==========
+            stages.next("pipeline.cicd", platform=args.cicd)
             self.console.print(f"[cyan]第 7 阶段: 生成 CI/CD 配置 ({args.cicd.upper()})...[/cyan]")
             from .deployers import CICDGenerator
 
@@ -1922,6 +2212,7 @@ class SuperDevCLI:
             self.console.print("")
 
             # ========== 第 8 阶段: 数据库迁移 ==========
+            stages.next("pipeline.migrations")
             self.console.print("[cyan]第 8 阶段: 生成数据库迁移脚本...[/cyan]")
             from .deployers import MigrationGenerator
 
@@ -1942,6 +2233,7 @@ class SuperDevCLI:
             self.console.print("")
 
             # ========== 完成 ==========
+            stages.close()
             self.console.print(f"[cyan]{'=' * 60}[/cyan]")
             self.console.print("[green]✓ 流水线完成！[/green]")
             self.console.print(f"[cyan]{'=' * 60}[/cyan]")
@@ -1979,6 +2271,8 @@ class SuperDevCLI:
             import traceback
             self.console.print(traceback.format_exc())
             return 1
+        finally:
+            stages.close()
 
         return 0
 
@@ -45,6 +45,14 @@ class ProjectConfig:
         "redteam", "qa", "delivery", "deployment"
     ])
 
+    # 同时执行的阶段数上限（互不依赖的阶段并发执行）
+    phase_concurrency: int = 4
+
+    # 超时（秒，None 表示不限制）：phase_timeouts 按阶段名单独设置，优先于 phase_timeout
+    phase_timeout: Optional[float] = None
+    phase_timeouts: Dict[str, float] = field(default_factory=dict)
+    run_timeout: Optional[float] = None
+
     # 专家配置
     experts: list = field(default_factory=lambda: [
         "PM", "ARCHITECT", "UI", "UX", "SECURITY", "CODE"
@@ -56,6 +64,9 @@ class ProjectConfig:
     # 输出目录
     output_dir: str = "output"
 
+    # 分析时排除的路径（gitignore 语法）
+    exclude: List[str] = field(default_factory=list)
+
     # CLI 设置
     cli: Dict[str, Any] = field(default_factory=dict)
 
@@ -176,6 +187,9 @@ class ConfigManager:
         # 类型转换映射
         type_converters = {
             "quality_gate": int,  # 质量门禁必须是整数
+            "phase_concurrency": int,
+            "phase_timeout": float,
+            "run_timeout": float,
         }
 
         # 转换类型
@@ -248,6 +262,15 @@ class ConfigManager:
         if not 0 <= self.config.quality_gate <= 100:
             errors.append("质量门禁必须在 0-100 之间")
 
+        # 验证阶段并发数
+        if self.config.phase_concurrency < 1:
+            errors.append("阶段并发数必须大于 0")
+
+        # 验证超时
+        timeouts = [self.config.phase_timeout, self.config.run_timeout, *self.config.phase_timeouts.values()]
+        if any(timeout is not None and timeout <= 0 for timeout in timeouts):
+            errors.append("超时时间必须大于 0")
+
         return len(errors) == 0, errors
 
 
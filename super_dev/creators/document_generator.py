@@ -12,6 +12,8 @@
 from typing import Optional, List
 from datetime import datetime
 
+from ..tracing import traced
+
 
 class DocumentGenerator:
     """文档生成器 - 生成专家级项目文档"""
@@ -148,6 +150,7 @@ class DocumentGenerator:
         return keywords
 
 
+    @traced("docs.generate_prd", "docs")
     def generate_prd(self) -> str:
         """生成高质量 PRD 文档"""
         return f"""# {self.name} - 产品需求文档 (PRD)
@@ -345,6 +348,7 @@ class DocumentGenerator:
 | v1.0.0 | {datetime.now().strftime('%Y-%m-%d')} | 初始版本 | Super Dev |
 """
 
+    @traced("docs.generate_architecture", "docs")
     def generate_architecture(self) -> str:
         """生成架构设计文档"""
         return f"""# {self.name} - 架构设计文档
@@ -719,6 +723,7 @@ jobs:
 - [REST API Design](https://restfulapi.net/)
 """
 
+    @traced("docs.generate_uiux", "docs")
     def generate_uiux(self) -> str:
         """生成智能 UI/UX 设计文档（基于设计引擎推荐）"""
         # 获取智能设计推荐
@@ -14,6 +14,8 @@ from enum import Enum
 import csv
 from pathlib import Path
 
+from ..tracing import traced
+
 
 class ChartCategory(str, Enum):
     """图表类别"""
@@ -326,6 +328,7 @@ class ChartRecommender:
 
         return considerations
 
+    @traced(category="design")
     def search(self, query: str, max_results: int = 5) -> List[ChartType]:
         """
         搜索图表类型
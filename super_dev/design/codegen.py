@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from enum import Enum
 from .generator import DesignSystem
 from .tokens import TokenGenerator
+from ..tracing import traced
 
 
 class Framework(str, Enum):
@@ -151,6 +152,7 @@ class CodeGenerator:
             )
         ]
 
+    @traced(category="design")
     def search_components(
         self,
         query: str,
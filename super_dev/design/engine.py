@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from math import log
 from collections import defaultdict
 from .aesthetics import AestheticEngine, AestheticDirection
+from ..tracing import traced
 
 
 # ============ 配置 ============
@@ -230,6 +231,7 @@ class DesignIntelligenceEngine:
             },
         }
 
+    @traced(category="design")
     def search(
         self,
         query: str,
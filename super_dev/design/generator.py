@@ -7,15 +7,61 @@
 最后修改：2025-12-30
 """
 
+import copy
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from .engine import DesignIntelligenceEngine
 from .aesthetics import AestheticEngine, AestheticDirection
 from .tokens import TokenGenerator
 
 
+# 各导出格式依赖的 token 分组（只有这些分组变化时才重新序列化）
+TOKEN_SECTIONS = ("colors", "typography", "spacing", "shadows", "radius", "animations")
+DOCS_SECTIONS = ("name", "description", "colors", "typography", "aesthetic")
+
+# 增量导出清单的默认位置（相对于项目目录，记录每个导出文件对应的内容哈希）
+EXPORT_MANIFEST = Path(".super-dev") / "cache" / "design-export.json"
+
+
+def hash_tokens(payload: Any) -> str:
+    """
+    计算 token 内容哈希
+
+    Args:
+        payload: 可 JSON 序列化的 token 数据
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def write_json_stream(data: Any, path: Path, indent: Optional[int] = 2) -> Path:
+    """
+    流式写入 JSON 文件
+
+    使用 JSONEncoder.iterencode 逐块写入，不在内存中拼接完整文档。
+
+    Args:
+        data: 要写入的数据
+        path: 输出路径
+        indent: 缩进
+
+    Returns:
+        输出路径
+    """
+    path = Path(path)
+    encoder = json.JSONEncoder(indent=indent, ensure_ascii=False)
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in encoder.iterencode(data):
+            f.write(chunk)
+    return path
+
+
 @dataclass
 class DesignSystem:
     """设计系统配置"""
@@ -46,8 +92,38 @@ class DesignSystem:
     # 美学方向
     aesthetic: Optional[AestheticDirection] = None
 
+    # 序列化缓存: 格式 -> (内容哈希, 输出)
+    _render_cache: Dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def token_hash(self, sections: tuple = TOKEN_SECTIONS) -> str:
+        """
+        计算指定 token 分组的内容哈希
+
+        Args:
+            sections: 参与哈希的字段名
+
+        Returns:
+            内容哈希
+        """
+        return hash_tokens({name: getattr(self, name) for name in sections})
+
+    def _cached_render(self, key: str, sections: tuple, render: Callable[[], Any]) -> Any:
+        """仅在输入 token 变化时重新序列化（返回副本，调用方修改结果不影响缓存）"""
+        digest = self.token_hash(sections)
+        cached = self._render_cache.get(key)
+        if cached is None or cached[0] != digest:
+            cached = (digest, render())
+            self._render_cache[key] = cached
+        return copy.deepcopy(cached[1])
+
     def to_css_variables(self) -> str:
         """生成 CSS 变量"""
+        return self._cached_render("css", TOKEN_SECTIONS, self._render_css_variables)
+
+    def _render_css_variables(self) -> str:
+        """渲染 CSS 变量"""
         lines = [":root {"]
         lines.append("  /* Colors */")
 
@@ -90,6 +166,10 @@ class DesignSystem:
 
     def to_tailwind_config(self) -> Dict[str, Any]:
         """生成 Tailwind 配置"""
+        return self._cached_render("tailwind", TOKEN_SECTIONS, self._render_tailwind_config)
+
+    def _render_tailwind_config(self) -> Dict[str, Any]:
+        """渲染 Tailwind 配置"""
         return {
             "theme": {
                 "extend": {
@@ -116,8 +196,15 @@ class DesignSystemGenerator:
     5. 文档生成
     """
 
-    def __init__(self):
-        """初始化设计系统生成器"""
+    def __init__(self, manifest_path: Optional[Path] = None):
+        """
+        初始化设计系统生成器
+
+        Args:
+            manifest_path: 增量导出清单路径（如 <project>/.super-dev/cache/design-export.json）；
+                为 None 时不启用增量导出，每次都重写输出文件
+        """
+        self.manifest_path = Path(manifest_path) if manifest_path else None
         self.engine = DesignIntelligenceEngine()
         self.aesthetic_engine = AestheticEngine()
         self.token_generator = TokenGenerator()
@@ -271,6 +358,8 @@ class DesignSystemGenerator:
         """
         生成设计系统文档
 
+        启用增量导出时，输入 token 未变化且文件仍存在则跳过重写。
+
         Args:
             design_system: 设计系统
             output_dir: 输出目录
@@ -281,29 +370,86 @@ class DesignSystemGenerator:
         output_dir = Path(output_dir)
         output_dir.mkdir(exist_ok=True)
 
+        manifest = self._load_export_manifest()
         generated_files = []
 
         # 1. CSS Variables
         css_file = output_dir / "design-tokens.css"
-        css_file.write_text(design_system.to_css_variables(), encoding="utf-8")
+        self._export_if_changed(
+            css_file,
+            design_system.token_hash(TOKEN_SECTIONS),
+            manifest,
+            lambda path: path.write_text(design_system.to_css_variables(), encoding="utf-8"),
+        )
         generated_files.append(css_file)
 
         # 2. Tailwind Config
         tailwind_file = output_dir / "tailwind.config.json"
-        tailwind_file.write_text(
-            json.dumps(design_system.to_tailwind_config(), indent=2),
-            encoding="utf-8"
+        self._export_if_changed(
+            tailwind_file,
+            design_system.token_hash(TOKEN_SECTIONS),
+            manifest,
+            lambda path: write_json_stream(design_system.to_tailwind_config(), path),
         )
         generated_files.append(tailwind_file)
 
         # 3. Design System Documentation
         docs_file = output_dir / "DESIGN_SYSTEM.md"
-        docs_content = self._generate_docs_content(design_system)
-        docs_file.write_text(docs_content, encoding="utf-8")
+        self._export_if_changed(
+            docs_file,
+            design_system.token_hash(DOCS_SECTIONS),
+            manifest,
+            lambda path: path.write_text(
+                design_system._cached_render(
+                    "docs", DOCS_SECTIONS, lambda: self._generate_docs_content(design_system)
+                ),
+                encoding="utf-8",
+            ),
+        )
         generated_files.append(docs_file)
 
+        self._save_export_manifest(manifest)
+
         return generated_files
 
+    def _export_if_changed(
+        self,
+        path: Path,
+        digest: str,
+        manifest: Dict[str, str],
+        write: Callable[[Path], Any],
+    ) -> bool:
+        """
+        内容哈希变化时才写入文件（未启用增量导出时总是写入）
+
+        Returns:
+            是否实际写入
+        """
+        key = str(path.resolve())
+        if self.manifest_path is not None and path.exists() and manifest.get(key) == digest:
+            return False
+
+        write(path)
+        manifest[key] = digest
+        return True
+
+    def _load_export_manifest(self) -> Dict[str, str]:
+        """读取增量导出清单（输出文件绝对路径 -> 内容哈希）"""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, IOError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_export_manifest(self, manifest: Dict[str, str]) -> None:
+        """保存增量导出清单"""
+        if self.manifest_path is None:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_stream(manifest, self.manifest_path)
+
     def _generate_docs_content(self, design_system: DesignSystem) -> str:
         """生成文档内容"""
         lines = [
@@ -369,28 +515,120 @@ class DesignSystemGenerator:
         self,
         design_system: DesignSystem,
         output_path: Path,
-    ):
+    ) -> Path:
         """
-        导出为 Sketch 格式（未来实现）
+        导出为 Sketch Palettes 格式（.sketchpalette）
 
         Args:
             design_system: 设计系统
             output_path: 输出路径
+
+        Returns:
+            输出路径
         """
-        # TODO: 实现 Sketch 导出
-        pass
+        return self._export_tokens_file(
+            design_system, output_path, "sketch", self._build_sketch_palette
+        )
 
     def export_to_figma(
         self,
         design_system: DesignSystem,
         output_path: Path,
-    ):
+    ) -> Path:
         """
-        导出为 Figma 格式（未来实现）
+        导出为 Figma Tokens (Tokens Studio) 格式
 
         Args:
             design_system: 设计系统
             output_path: 输出路径
+
+        Returns:
+            输出路径
         """
-        # TODO: 实现 Figma 导出
-        pass
+        return self._export_tokens_file(
+            design_system, output_path, "figma", self._build_figma_tokens
+        )
+
+    def _export_tokens_file(
+        self,
+        design_system: DesignSystem,
+        output_path: Path,
+        key: str,
+        build: Callable[[DesignSystem], Dict[str, Any]],
+    ) -> Path:
+        """增量导出单个 token 文件（流式写入）"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        manifest = self._load_export_manifest()
+        written = self._export_if_changed(
+            output_path,
+            design_system.token_hash(TOKEN_SECTIONS),
+            manifest,
+            lambda path: write_json_stream(
+                design_system._cached_render(key, TOKEN_SECTIONS, lambda: build(design_system)),
+                path,
+            ),
+        )
+        if written:
+            self._save_export_manifest(manifest)
+
+        return output_path
+
+    def _build_figma_tokens(self, design_system: DesignSystem) -> Dict[str, Any]:
+        """构建 Figma Tokens 文档"""
+        groups = [
+            ("colors", design_system.colors, "color"),
+            ("fontFamilies", design_system.typography, "fontFamilies"),
+            ("spacing", design_system.spacing, "spacing"),
+            ("boxShadow", design_system.shadows, "boxShadow"),
+            ("borderRadius", design_system.radius, "borderRadius"),
+            ("animation", design_system.animations, "other"),
+        ]
+
+        return {
+            "global": {
+                group: {
+                    name: {"value": value, "type": token_type}
+                    for name, value in tokens.items()
+                    if value
+                }
+                for group, tokens, token_type in groups
+            },
+            "$metadata": {"tokenSetOrder": ["global"]},
+        }
+
+    def _build_sketch_palette(self, design_system: DesignSystem) -> Dict[str, Any]:
+        """构建 Sketch Palettes 文档"""
+        colors = []
+        for name, value in design_system.colors.items():
+            rgb = self._hex_to_rgb(value)
+            if rgb is None:
+                continue
+            red, green, blue = rgb
+            colors.append({
+                "name": name,
+                "red": red,
+                "green": green,
+                "blue": blue,
+                "alpha": 1,
+            })
+
+        return {
+            "compatibleVersion": "2.0",
+            "pluginVersion": "2.22",
+            "colors": colors,
+        }
+
+    def _hex_to_rgb(self, hex_color: str) -> Optional[tuple]:
+        """Hex 转 0-1 范围的 RGB，非 Hex 颜色返回 None"""
+        value = hex_color.lstrip("#")
+        if len(value) == 3:
+            value = "".join(c * 2 for c in value)
+        if len(value) != 6:
+            return None
+
+        try:
+            return tuple(round(int(value[i:i + 2], 16) / 255, 4) for i in (0, 2, 4))
+        except ValueError:
+            return None
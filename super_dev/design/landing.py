@@ -14,6 +14,8 @@ from enum import Enum
 import csv
 from pathlib import Path
 
+from ..tracing import traced
+
 
 class LandingCategory(str, Enum):
     """Landing 页面类别"""
@@ -271,6 +273,7 @@ class LandingPatternGenerator:
             )
         ]
 
+    @traced(category="design")
     def search(self, query: str, max_results: int = 5) -> List[LandingPattern]:
         """
         搜索 Landing 页面模式
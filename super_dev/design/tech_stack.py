@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from ..tracing import traced
+
 
 class TechStack(str, Enum):
     """技术栈枚举"""
@@ -242,8 +244,8 @@ class TechStackEngine:
                 description="Build components that share state implicitly",
                 use_case="Modals, Dropdowns, Tabs",
                 implementation="const Tabs = ({ children }) => {\n  const [active, setActive] = useState(0)\n  return (\n    <TabsContext value={{ active, setActive }}>\n      {children}\n    </TabsContext>\n  )\n}",
-                pros["Flexible API", "Less prop drilling", "Intuitive usage"],
-                cons["Harder to understand", "Requires context"]
+                pros=["Flexible API", "Less prop drilling", "Intuitive usage"],
+                cons=["Harder to understand", "Requires context"]
             )
         ]
 
@@ -270,6 +272,7 @@ class TechStackEngine:
             )
         ]
 
+    @traced(category="design")
     def search_practices(
         self,
         stack: str,
@@ -14,6 +14,8 @@ from enum import Enum
 import csv
 from pathlib import Path
 
+from ..tracing import traced
+
 
 class UXDomain(str, Enum):
     """UX 领域"""
@@ -125,6 +127,7 @@ class UXGuideEngine:
             )
         ]
 
+    @traced(category="design")
     def search(
         self,
         query: str,
@@ -7,12 +7,24 @@ from .engine import (
     WorkflowEngine,
     Phase,
     PhaseResult,
-    WorkflowContext
+    WorkflowContext,
+    WorkflowEvent,
+    WorkflowEventType,
+    DEFAULT_PHASE_DEPENDENCIES,
+    resolve_phase_graph
 )
+from .cache import PhaseCache
+from .checkpoint import RunCheckpoint
 
 __all__ = [
     "WorkflowEngine",
     "Phase",
     "PhaseResult",
-    "WorkflowContext"
+    "WorkflowContext",
+    "WorkflowEvent",
+    "WorkflowEventType",
+    "DEFAULT_PHASE_DEPENDENCIES",
+    "resolve_phase_graph",
+    "PhaseCache",
+    "RunCheckpoint"
 ]
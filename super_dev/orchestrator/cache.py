@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+工作流阶段结果缓存
+
+以阶段输入的内容哈希为键，在 .super-dev/cache/workflow/ 中保存阶段输出。
+输入包括：处理器标识、项目配置、上游阶段的输出、用户输入以及阶段声明的相关文件内容。
+输入不变的阶段直接复用上次的结果，修改某个文件后只有读取它的阶段及其下游会重新执行。
+除输出外还保存阶段对共享上下文（documents / research_data 等）的改动，命中时一并重放。
+"""
+
+import hashlib
+import json
+import os
+import sys
+import types
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+
+# 缓存格式版本，键的组成变化时递增以使旧缓存失效
+PHASE_CACHE_VERSION = 2
+
+PHASE_CACHE_DIR = Path(".super-dev") / "cache" / "workflow"
+
+# 不影响阶段输出的配置字段
+IGNORED_CONFIG_FIELDS = frozenset({
+    "phase_concurrency", "phase_timeout", "phase_timeouts", "run_timeout", "cli",
+})
+
+
+def hash_payload(payload: Any) -> str:
+    """
+    计算可 JSON 序列化数据的内容哈希
+
+    Args:
+        payload: 数据（无法序列化的对象按 repr 计入）
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def hash_files(project_dir: Path, patterns: Iterable[str]) -> dict[str, str]:
+    """
+    计算匹配文件的内容哈希
+
+    Args:
+        project_dir: 项目目录
+        patterns: 相对于项目目录的 glob 模式
+
+    Returns:
+        相对路径 -> SHA-256 摘要（按路径排序）
+    """
+    digests: dict[str, str] = {}
+    for pattern in patterns:
+        for path in project_dir.glob(pattern):
+            if not path.is_file():
+                continue
+            rel_path = path.relative_to(project_dir).as_posix()
+            if rel_path in digests:
+                continue
+            try:
+                digests[rel_path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+    return dict(sorted(digests.items()))
+
+
+def _code_digest(code: types.CodeType) -> str:
+    """字节码摘要（递归计入嵌套函数，不含行号等与行为无关的信息）"""
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            digest.update(_code_digest(const).encode("utf-8"))
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(map(repr, const))).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def context_digests(context: dict[str, Any]) -> dict[str, dict[str, str]]:
+    """
+    计算上下文各字段中每个键的内容哈希
+
+    Args:
+        context: 上下文字段名 -> 数据（非字典字段忽略）
+
+    Returns:
+        字段名 -> {键: 内容哈希}
+    """
+    return {
+        name: {key: hash_payload(value) for key, value in data.items()}
+        for name, data in context.items()
+        if isinstance(data, dict)
+    }
+
+
+def context_delta(before: dict[str, dict[str, str]], context: dict[str, Any]) -> dict[str, dict]:
+    """
+    计算上下文相对于 before 新增或改变的键
+
+    Args:
+        before: context_digests() 的结果
+        context: 上下文字段名 -> 当前数据
+
+    Returns:
+        字段名 -> {键: 新值}（只包含有变化的字段）
+    """
+    delta: dict[str, dict] = {}
+    for name, data in context.items():
+        if not isinstance(data, dict):
+            continue
+        digests = before.get(name, {})
+        changed = {
+            key: value for key, value in data.items()
+            if digests.get(key) != hash_payload(value)
+        }
+        if changed:
+            delta[name] = changed
+    return delta
+
+
+def handler_identity(handler: Callable) -> str:
+    """
+    处理器标识，更换或修改处理器时缓存失效
+
+    Args:
+        handler: 阶段处理器（函数、方法、functools.partial 或可调用对象）
+
+    Returns:
+        模块 + 限定名，加上模块的 __version__ 与字节码摘要（可获取时）
+    """
+    func = getattr(handler, "__func__", handler)
+    func = getattr(func, "func", func)  # functools.partial
+    module = getattr(func, "__module__", "") or ""
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    identity = f"{module}.{name}"
+
+    version = getattr(sys.modules.get(module), "__version__", None)
+    if version:
+        identity += f"=={version}"
+
+    code = getattr(func, "__code__", None)
+    if code is None:
+        code = getattr(getattr(type(func), "__call__", None), "__code__", None)
+    if code is not None:
+        identity += f"@{_code_digest(code)[:16]}"
+    return identity
+
+
+def phase_cache_key(
+    phase: str,
+    handler: Callable,
+    config: dict,
+    upstream: dict[str, Any],
+    user_input: dict,
+    files: dict[str, str],
+) -> str:
+    """
+    计算阶段缓存键
+
+    Args:
+        phase: 阶段名称
+        handler: 阶段处理器
+        config: 项目配置字段
+        upstream: 上游阶段名称 -> 输出
+        user_input: 用户输入
+        files: 相关文件的相对路径 -> 内容哈希
+
+    Returns:
+        缓存键（SHA-256 十六进制摘要）
+    """
+    return hash_payload({
+        "version": PHASE_CACHE_VERSION,
+        "phase": phase,
+        "handler": handler_identity(handler),
+        "config": {k: v for k, v in config.items() if k not in IGNORED_CONFIG_FIELDS},
+        "upstream": upstream,
+        "user_input": user_input,
+        "files": files,
+    })
+
+
+class PhaseCache:
+    """按内容哈希寻址的阶段结果缓存（每个键一个文件）"""
+
+    def __init__(self, project_dir: Path, cache_dir: Optional[Path] = None):
+        """
+        初始化缓存
+
+        Args:
+            project_dir: 项目目录
+            cache_dir: 缓存目录，默认为 <project>/.super-dev/cache/workflow
+        """
+        self.project_dir = Path(project_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_dir / PHASE_CACHE_DIR
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        读取缓存记录
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            记录（output / context / quality_score / duration），未命中或损坏时返回 None
+        """
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != PHASE_CACHE_VERSION:
+            return None
+        return data
+
+    def store(self, key: str, record: dict) -> bool:
+        """
+        原子写入缓存记录
+
+        Args:
+            key: 缓存键
+            record: 记录（output 与 context 须可 JSON 序列化）
+
+        Returns:
+            是否写入（无法序列化时不缓存）
+        """
+        try:
+            data = json.dumps(
+                {"version": PHASE_CACHE_VERSION, **record},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, path)
+        return True
+
+    def clear(self) -> int:
+        """
+        清空缓存
+
+        Returns:
+            删除的记录数
+        """
+        removed = 0
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+工作流运行检查点
+
+每个阶段完成后把阶段结果和共享上下文（documents / research_data / quality_reports 等）
+写入 .super-dev/runs/<run_id>/checkpoint.json，中断或失败的运行可以从第一个未完成的阶段继续，
+已通过的阶段不再重新执行。内容以 JSON 保存，无法序列化的值按 repr 保存；
+结束时输出或上下文无法经 JSON 原样还原的阶段记入 lossy，继续运行时重新执行。
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+# 检查点格式版本
+CHECKPOINT_VERSION = 1
+
+RUNS_DIR = Path(".super-dev") / "runs"
+CHECKPOINT_FILENAME = "checkpoint.json"
+
+# 保存到检查点的上下文字段
+CONTEXT_FIELDS = ("user_input", "metadata", "research_data", "documents", "quality_reports")
+
+
+def round_trips(value) -> bool:
+    """
+    判断数据能否经 JSON 原样还原
+
+    Args:
+        value: 数据
+
+    Returns:
+        序列化后再解析与原数据相等时为 True（元组、非字符串键等会被判为 False）
+    """
+    try:
+        return json.loads(json.dumps(value, ensure_ascii=False)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def new_run_id() -> str:
+    """生成运行 ID（时间戳 + 随机后缀，按时间排序）"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+class RunCheckpoint:
+    """单次工作流运行的检查点"""
+
+    def __init__(self, project_dir: Path, run_id: str, runs_dir: Optional[Path] = None):
+        """
+        初始化检查点
+
+        Args:
+            project_dir: 项目目录
+            run_id: 运行 ID
+            runs_dir: 运行目录，默认为 <project>/.super-dev/runs
+        """
+        self.project_dir = Path(project_dir)
+        self.run_id = run_id
+        self.runs_dir = Path(runs_dir) if runs_dir else self.project_dir / RUNS_DIR
+        self.run_dir = self.runs_dir / run_id
+        self.path = self.run_dir / CHECKPOINT_FILENAME
+
+    @classmethod
+    def latest(cls, project_dir: Path, runs_dir: Optional[Path] = None) -> Optional["RunCheckpoint"]:
+        """
+        最近一次运行的检查点
+
+        Args:
+            project_dir: 项目目录
+            runs_dir: 运行目录
+
+        Returns:
+            检查点，没有任何运行记录时返回 None
+        """
+        runs_dir = Path(runs_dir) if runs_dir else Path(project_dir) / RUNS_DIR
+        if not runs_dir.is_dir():
+            return None
+        run_ids = sorted(
+            path.parent.name for path in runs_dir.glob(f"*/{CHECKPOINT_FILENAME}")
+        )
+        return cls(project_dir, run_ids[-1], runs_dir) if run_ids else None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> Optional[dict]:
+        """
+        读取检查点
+
+        Returns:
+            检查点数据，不存在、损坏或版本不匹配时返回 None
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return data
+
+    def save(
+        self,
+        status: str,
+        phases: list[str],
+        results: dict[str, dict],
+        context: dict,
+        lossy: Optional[list[str]] = None
+    ) -> None:
+        """
+        原子写入检查点
+
+        Args:
+            status: 运行状态（running / completed / failed）
+            phases: 本次运行的阶段名称
+            results: 阶段名称 -> 阶段结果字典
+            context: 上下文字段名 -> 数据
+            lossy: 输出或上下文无法无损保存的阶段名称（继续运行时视为未完成）
+        """
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "run_id": self.run_id,
+            "status": status,
+            "updated_at": datetime.now().isoformat(),
+            "phases": phases,
+            "results": results,
+            "context": context,
+            "lossy": lossy or [],
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=repr)
+        os.replace(tmp_path, self.path)
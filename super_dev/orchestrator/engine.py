@@ -7,11 +7,17 @@
 最后修改：2025-12-30
 """
 
+import os
 import json
+import time
 import asyncio
+import functools
+import threading
+import contextvars
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -25,6 +31,9 @@ except ImportError:
     RICH_AVAILABLE = False
 
 from ..config.manager import ConfigManager, get_config_manager
+from ..tracing import span
+from .cache import PhaseCache, context_delta, context_digests, hash_files, phase_cache_key
+from .checkpoint import CONTEXT_FIELDS, RunCheckpoint, new_run_id, round_trips
 
 
 class Phase(Enum):
@@ -38,6 +47,35 @@ class Phase(Enum):
     DEPLOYMENT = "deployment"
 
 
+# 阶段依赖（DAG）：阶段只在其依赖全部通过质量门禁后执行，互不依赖的阶段并发执行
+DEFAULT_PHASE_DEPENDENCIES: dict[Phase, tuple[Phase, ...]] = {
+    Phase.DISCOVERY: (),
+    Phase.INTELLIGENCE: (Phase.DISCOVERY,),
+    Phase.DRAFTING: (Phase.DISCOVERY, Phase.INTELLIGENCE),
+    Phase.REDTEAM: (Phase.DRAFTING,),
+    Phase.QA: (Phase.REDTEAM,),
+    Phase.DELIVERY: (Phase.QA,),
+    Phase.DEPLOYMENT: (Phase.DISCOVERY,),
+}
+
+# 阶段读取的文件（相对于项目目录的 glob，{output_dir} 替换为输出目录），内容变化时缓存失效
+DEFAULT_PHASE_INPUTS: dict[Phase, tuple[str, ...]] = {
+    Phase.REDTEAM: ("{output_dir}/*.md",),
+    Phase.QA: ("{output_dir}/*.md",),
+    Phase.DELIVERY: ("{output_dir}/*.md",),
+}
+
+# 当前任务正在执行的阶段（report_progress 据此确定进度所属的阶段）
+_CURRENT_PHASE: contextvars.ContextVar[Optional[Phase]] = contextvars.ContextVar(
+    "super_dev_current_phase", default=None
+)
+
+# 同步处理器的执行器类型：io 在线程池中执行，cpu 在进程池中执行（不受 GIL 限制）
+EXECUTOR_IO = "io"
+EXECUTOR_CPU = "cpu"
+EXECUTOR_KINDS = (EXECUTOR_IO, EXECUTOR_CPU)
+
+
 @dataclass
 class PhaseResult:
     """阶段执行结果"""
@@ -47,6 +85,68 @@ class PhaseResult:
     output: Any = None
     errors: list = field(default_factory=list)
     quality_score: float = 0.0
+    cached: bool = False  # 是否直接复用了缓存结果
+    timed_out: bool = False  # 是否因超时被中止
+    cancelled: bool = False  # 是否因运行中止（abort / 运行超时 / 取消）被中止
+
+    def to_dict(self) -> dict:
+        """转换为字典（检查点使用）"""
+        return {
+            "phase": self.phase.value,
+            "success": self.success,
+            "duration": self.duration,
+            "output": self.output,
+            "errors": self.errors,
+            "quality_score": self.quality_score,
+            "cached": self.cached,
+            "timed_out": self.timed_out,
+            "cancelled": self.cancelled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhaseResult":
+        """从字典创建"""
+        return cls(
+            phase=Phase(data["phase"]),
+            success=data.get("success", False),
+            duration=data.get("duration", 0.0),
+            output=data.get("output"),
+            errors=list(data.get("errors", [])),
+            quality_score=data.get("quality_score", 0.0),
+            cached=data.get("cached", False),
+            timed_out=data.get("timed_out", False),
+            cancelled=data.get("cancelled", False),
+        )
+
+
+class WorkflowEventType(Enum):
+    """工作流事件类型"""
+    WORKFLOW_STARTED = "workflow_started"
+    PHASE_STARTED = "phase_started"
+    PROGRESS = "progress"
+    PHASE_COMPLETED = "phase_completed"
+    PHASE_FAILED = "phase_failed"
+    GATE_FAILED = "gate_failed"
+    PHASE_SKIPPED = "phase_skipped"
+    WORKFLOW_COMPLETED = "workflow_completed"
+
+
+@dataclass
+class WorkflowEvent:
+    """工作流事件"""
+    type: WorkflowEventType
+    phase: Optional[Phase] = None
+    data: dict = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)  # Unix 时间戳（秒）
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "type": self.type.value,
+            "phase": self.phase.value if self.phase else None,
+            "timestamp": self.timestamp,
+            "data": self.data,
+        }
 
 
 @dataclass
@@ -63,23 +163,143 @@ class WorkflowContext:
     documents: dict = field(default_factory=dict)
     quality_reports: dict = field(default_factory=dict)
 
+    # 中止信号：运行被中止或超时时置位，长时间运行的处理器（包括线程池中的同步处理器）应定期检查
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
+    # 进度回调，由引擎设置
+    progress_callback: Optional[Callable[[float, str], None]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def cancelled(self) -> bool:
+        """运行是否已被要求中止"""
+        return self.cancel_event.is_set()
+
+    def report_progress(self, fraction: float, message: str = "") -> None:
+        """
+        报告当前阶段的进度（可在线程池中的同步处理器中调用；没有订阅者时几乎无开销）
+
+        Args:
+            fraction: 完成比例（0-1）
+            message: 进度说明
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(min(max(float(fraction), 0.0), 1.0), message)
+
+    def __getstate__(self) -> dict:
+        # 进程池中的处理器收到上下文副本，Event 与回调无法 pickle
+        state = self.__dict__.copy()
+        state.pop("cancel_event", None)
+        state["progress_callback"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.cancel_event = threading.Event()
+
+
+def resolve_phase_graph(
+    phases: list[Phase],
+    dependencies: dict[Phase, tuple[Phase, ...]]
+) -> dict[Phase, set[Phase]]:
+    """
+    计算所选阶段之间的依赖关系
+
+    未选中的阶段被视为透明：A 依赖未选中的 B、B 依赖选中的 C 时，A 依赖 C。
+
+    Args:
+        phases: 要执行的阶段
+        dependencies: 阶段 -> 直接依赖的阶段
+
+    Returns:
+        阶段 -> 其依赖的已选阶段
+
+    Raises:
+        ValueError: 依赖存在环
+    """
+    selected = set(phases)
+    graph: dict[Phase, set[Phase]] = {}
+    for phase in phases:
+        deps: set[Phase] = set()
+        stack = list(dependencies.get(phase, ()))
+        visited: set[Phase] = set()
+        while stack:
+            dep = stack.pop()
+            if dep in visited:
+                continue
+            visited.add(dep)
+            if dep in selected:
+                deps.add(dep)
+            else:
+                stack.extend(dependencies.get(dep, ()))
+        graph[phase] = deps
+
+    # Kahn 拓扑排序检查环
+    remaining = {phase: set(deps) for phase, deps in graph.items()}
+    while remaining:
+        ready = [phase for phase, deps in remaining.items() if not deps]
+        if not ready:
+            cycle = ", ".join(sorted(phase.value for phase in remaining))
+            raise ValueError(f"Phase dependencies contain a cycle: {cycle}")
+        for phase in ready:
+            del remaining[phase]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return graph
+
 
 class WorkflowEngine:
     """工作流编排引擎"""
 
-    def __init__(self, project_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        project_dir: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = False,
+        io_executor: Optional[Executor] = None,
+        cpu_executor: Optional[Executor] = None
+    ):
         """
         初始化工作流引擎
 
+        同步处理器不在事件循环中直接执行：io 类型在线程池中执行，cpu 类型在进程池中执行。
+        未传入执行器时在首次需要时创建，并在每次运行结束后关闭；传入的执行器由调用方管理
+        （例如 Web 服务在多个运行之间共享同一个进程池）。
+
         Args:
             project_dir: 项目目录
+            max_concurrency: 同时执行的阶段数上限，默认使用配置中的 phase_concurrency
+            use_cache: 是否复用 .super-dev/cache/workflow 中输入未变化的阶段结果
+            io_executor: 执行 io 类型同步处理器的执行器
+            cpu_executor: 执行 cpu 类型同步处理器的执行器
         """
         self.project_dir = Path.cwd() if project_dir is None else project_dir
         self.config_manager = get_config_manager(self.project_dir)
         self.console = Console() if RICH_AVAILABLE else None
+        self.max_concurrency = max_concurrency
+        self.cache = PhaseCache(self.project_dir) if use_cache else None
+        self.run_id: Optional[str] = None  # 最近一次运行的 ID（检查点目录名）
+        self._executors: dict[str, Optional[Executor]] = {
+            EXECUTOR_IO: io_executor,
+            EXECUTOR_CPU: cpu_executor,
+        }
+        self._owned_executors: dict[str, Executor] = {}
+
+        # 当前运行的状态（供 abort() 使用）
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._context: Optional[WorkflowContext] = None
+        self._running: dict[asyncio.Task, Phase] = {}
+        self._stop_reason: Optional[str] = None  # aborted / timed_out
+        self._abandoned = False  # 是否有阶段被超时 / 取消放弃（其同步处理器可能仍在执行）
+
+        # 事件订阅者
+        self._listeners: list[Callable[[WorkflowEvent], None]] = []
 
         # 阶段注册表
         self._phase_handlers: dict[Phase, Callable] = {}
+        self.phase_dependencies: dict[Phase, tuple[Phase, ...]] = dict(DEFAULT_PHASE_DEPENDENCIES)
+        self.phase_inputs: dict[Phase, tuple[str, ...]] = dict(DEFAULT_PHASE_INPUTS)
+        self.phase_executors: dict[Phase, str] = {}  # 未声明的阶段使用 io
 
         # 注册默认阶段处理器
         self._register_default_handlers()
@@ -95,27 +315,187 @@ class WorkflowEngine:
         self._phase_handlers[Phase.DELIVERY] = self._phase_delivery
         self._phase_handlers[Phase.DEPLOYMENT] = self._phase_deployment
 
-    def register_phase_handler(self, phase: Phase, handler: Callable) -> None:
+    def register_phase_handler(
+        self,
+        phase: Phase,
+        handler: Callable,
+        depends_on: Optional[list[Phase]] = None,
+        inputs: Optional[list[str]] = None,
+        executor: Optional[str] = None
+    ) -> None:
         """
         注册自定义阶段处理器
 
         Args:
             phase: 阶段
             handler: 处理函数
+            depends_on: 该阶段依赖的阶段，默认保留原有依赖
+            inputs: 该阶段读取的文件（glob），默认保留原有声明
+            executor: 同步处理器的执行器类型，io（线程池，默认）或 cpu（进程池）。
+                cpu 处理器须可 pickle（模块级函数），在子进程中收到上下文的副本，
+                只有返回值会传回
+
+        Raises:
+            ValueError: 未知的执行器类型
         """
+        if executor is not None:
+            if executor not in EXECUTOR_KINDS:
+                raise ValueError(f"Unknown executor: {executor} (expected one of {EXECUTOR_KINDS})")
+            self.phase_executors[phase] = executor
         self._phase_handlers[phase] = handler
+        if depends_on is not None:
+            self.phase_dependencies[phase] = tuple(depends_on)
+        if inputs is not None:
+            self.phase_inputs[phase] = tuple(inputs)
+
+    def abort(self) -> None:
+        """
+        中止当前运行（可在其他线程中调用）
+
+        置位 context.cancel_event，取消正在执行的阶段，不再启动新的阶段。
+        被取消的阶段记录为 cancelled，run() 随后正常返回已有结果。
+        在 run() 开始之前调用时，该次运行不会启动任何阶段。
+        """
+        self._request_stop("aborted")
+
+    def _request_stop(self, reason: str) -> None:
+        """停止当前运行"""
+        if self._stop_reason is None:
+            self._stop_reason = reason
+        self._abandoned = True
+        if self._context is not None:
+            self._context.cancel_event.set()
+        self._call_in_loop(self._cancel_running)
+
+    def _call_in_loop(self, callback: Callable, *args: Any) -> None:
+        """在运行所在的事件循环中调用（从其他线程调用时转交给事件循环）"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            callback(*args)
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
+
+    # ==================== 事件 ====================
+
+    def add_listener(self, listener: Callable[[WorkflowEvent], None]) -> None:
+        """
+        订阅工作流事件
+
+        回调在事件循环线程中同步调用，应尽快返回；回调抛出的异常被忽略。
+
+        Args:
+            listener: 事件回调
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[WorkflowEvent], None]) -> None:
+        """取消订阅"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, event_type: WorkflowEventType, phase: Optional[Phase] = None, **data: Any) -> None:
+        """发布事件（没有订阅者时直接返回）"""
+        if not self._listeners:
+            return
+        self._call_in_loop(self._dispatch, WorkflowEvent(type=event_type, phase=phase, data=data))
+
+    def _dispatch(self, event: WorkflowEvent) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                pass
+
+    def _report_progress(self, fraction: float, message: str) -> None:
+        """context.report_progress 的回调"""
+        if self._listeners:
+            self._emit(
+                WorkflowEventType.PROGRESS, _CURRENT_PHASE.get(),
+                fraction=fraction, message=message
+            )
+
+    async def run_stream(
+        self,
+        phases: Optional[list[Phase]] = None,
+        context: Optional[WorkflowContext] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False
+    ) -> AsyncIterator[WorkflowEvent]:
+        """
+        运行工作流并逐个产出事件
+
+        最后一个事件为 workflow_completed，其 data["results"] 为各阶段结果。
+        提前关闭生成器会取消运行（已完成的阶段保存在检查点中，可继续运行）。
+
+        Args:
+            phases: 要执行的阶段列表，默认执行全部
+            context: 工作流上下文
+            run_id: 运行 ID（resume 为 True 时为要继续的运行，默认最近一次）
+            resume: 是否从检查点继续运行
+
+        Yields:
+            WorkflowEvent: 工作流事件
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self.add_listener(queue.put_nowait)
+        if resume:
+            task = asyncio.create_task(self.resume(run_id, context))
+        else:
+            task = asyncio.create_task(self.run(phases, context, run_id))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            task.result()
+        finally:
+            self.remove_listener(queue.put_nowait)
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    def _cancel_running(self) -> None:
+        for task in self._running:
+            task.cancel()
+
+    def _phase_timeout(self, phase: Phase) -> Optional[float]:
+        """阶段超时（秒），phase_timeouts 中的单独设置优先于 phase_timeout"""
+        config = self.config_manager.config
+        timeout = config.phase_timeouts.get(phase.value, config.phase_timeout)
+        return float(timeout) if timeout else None
+
+    def _concurrency_limit(self) -> int:
+        """同时执行的阶段数上限"""
+        limit = self.max_concurrency
+        if limit is None:
+            limit = self.config_manager.config.phase_concurrency
+        return max(1, int(limit))
 
     async def run(
         self,
         phases: Optional[list[Phase]] = None,
-        context: Optional[WorkflowContext] = None
+        context: Optional[WorkflowContext] = None,
+        run_id: Optional[str] = None
     ) -> dict[Phase, PhaseResult]:
         """
         运行工作流
 
+        每个阶段完成后写入 .super-dev/runs/<run_id>/ 检查点，可用 resume() 继续。
+
         Args:
             phases: 要执行的阶段列表，默认执行全部
             context: 工作流上下文
+            run_id: 运行 ID，默认自动生成
 
         Returns:
             各阶段执行结果
@@ -131,32 +511,285 @@ class WorkflowEngine:
         if phases is None:
             phases = self._get_phases_from_config()
 
-        results = {}
+        checkpoint = RunCheckpoint(self.project_dir, run_id or new_run_id())
+        return await self._execute(phases, context, checkpoint, {})
+
+    async def resume(
+        self,
+        run_id: Optional[str] = None,
+        context: Optional[WorkflowContext] = None
+    ) -> dict[Phase, PhaseResult]:
+        """
+        从检查点继续运行
 
-        # 打印工作流开始
-        self._print_workflow_start(phases)
+        恢复共享上下文，已通过质量门禁的阶段直接使用检查点中的结果，
+        从第一个未完成的阶段开始执行。输出或上下文未能无损保存的阶段视为未完成，
+        重新执行以免下游拿到 repr 字符串。
+
+        Args:
+            run_id: 运行 ID，默认为最近一次运行
+            context: 工作流上下文（其共享数据会被检查点覆盖）
+
+        Returns:
+            各阶段执行结果（包含恢复的结果）
+
+        Raises:
+            ValueError: 找不到可用的检查点
+        """
+        if run_id is None:
+            checkpoint = RunCheckpoint.latest(self.project_dir)
+        else:
+            checkpoint = RunCheckpoint(self.project_dir, run_id)
+        data = checkpoint.load() if checkpoint is not None else None
+        if data is None:
+            raise ValueError(f"No checkpoint found for run: {run_id or 'latest'}")
+
+        if context is None:
+            context = WorkflowContext(
+                project_dir=self.project_dir,
+                config=self.config_manager
+            )
+        for name in CONTEXT_FIELDS:
+            setattr(context, name, dict(data["context"].get(name, {})))
+
+        phases = [Phase(value) for value in data["phases"]]
+        gate = self.config_manager.config.quality_gate
+        lossy = set(data.get("lossy", []))
+        completed = {}
+        for name, record in data["results"].items():
+            if name in lossy:
+                continue
+            result = PhaseResult.from_dict(record)
+            if result.success and result.quality_score >= gate:
+                completed[result.phase] = result
+
+        return await self._execute(phases, context, checkpoint, completed)
+
+    async def _execute(
+        self,
+        phases: list[Phase],
+        context: WorkflowContext,
+        checkpoint: RunCheckpoint,
+        completed: dict[Phase, PhaseResult]
+    ) -> dict[Phase, PhaseResult]:
+        """
+        执行一次运行（新运行或继续运行）
+
+        Args:
+            phases: 要执行的阶段列表
+            context: 工作流上下文
+            checkpoint: 本次运行的检查点
+            completed: 已完成、无需重新执行的阶段结果
 
-        # 执行各阶段
+        Returns:
+            各阶段执行结果
+        """
+        graph = resolve_phase_graph(phases, self.phase_dependencies)
+        # 停止状态在运行结束时复位：run() 之前调用的 abort() 同样生效
+        self._context = context
+        if self._stop_reason is not None:
+            context.cancel_event.set()
+        try:
+            self.run_id = checkpoint.run_id
+            context.metadata["run_id"] = checkpoint.run_id
+            context.results.update(completed)
+            context.progress_callback = self._report_progress
+
+            # 结束时输出或上下文无法无损保存的阶段（并发时可能多记，只会导致多执行）
+            checked: set[Phase] = set(completed)
+            lossy: list[str] = []
+
+            def save_checkpoint(finished: dict[Phase, PhaseResult], status: str = "running") -> None:
+                fields = {name: getattr(context, name) for name in CONTEXT_FIELDS}
+                new = [phase for phase in finished if phase not in checked]
+                if new:
+                    context_ok = round_trips(fields)
+                    for phase in new:
+                        checked.add(phase)
+                        if not (context_ok and round_trips(finished[phase].output)):
+                            lossy.append(phase.value)
+                checkpoint.save(
+                    status,
+                    [phase.value for phase in phases],
+                    {phase.value: result.to_dict() for phase, result in finished.items()},
+                    fields,
+                    lossy,
+                )
+
+            # 打印工作流开始
+            self._print_workflow_start(phases)
+            self._emit(
+                WorkflowEventType.WORKFLOW_STARTED,
+                run_id=checkpoint.run_id,
+                phases=[phase.value for phase in phases],
+                resumed=[phase.value for phase in completed]
+            )
+
+            # 按依赖图执行各阶段
+            save_checkpoint(completed)
+            with span("workflow.run", "workflow", run_id=checkpoint.run_id, phases=len(phases)):
+                try:
+                    finished = await self._run_graph(phases, graph, context, completed, save_checkpoint)
+                finally:
+                    self._shutdown_executors()
+
+            # 结果按阶段列表顺序排列
+            results = {phase: finished[phase] for phase in phases if phase in finished}
+            skipped = [phase for phase in phases if phase not in finished]
+
+            gate = self.config_manager.config.quality_gate
+            passed = not skipped and all(
+                result.success and result.quality_score >= gate for result in results.values()
+            )
+            status = "completed" if passed else self._stop_reason or "failed"
+            save_checkpoint(results, status)
+
+            # 打印工作流完成
+            self._print_workflow_complete(results)
+            self._emit(
+                WorkflowEventType.WORKFLOW_COMPLETED,
+                run_id=checkpoint.run_id,
+                status=status,
+                results={phase.value: result.to_dict() for phase, result in results.items()},
+                skipped=[phase.value for phase in skipped]
+            )
+
+            # 保存执行报告
+            self._save_report(results, graph, skipped)
+
+            return results
+        finally:
+            self._context, self._stop_reason = None, None
+
+    async def _run_graph(
+        self,
+        phases: list[Phase],
+        graph: dict[Phase, set[Phase]],
+        context: WorkflowContext,
+        completed: Optional[dict[Phase, PhaseResult]] = None,
+        on_result: Optional[Callable[[dict[Phase, PhaseResult]], None]] = None
+    ) -> dict[Phase, PhaseResult]:
+        """
+        按依赖图调度阶段
+
+        依赖全部通过的阶段按 phases 中的顺序启动，同时运行的阶段数不超过并发上限；
+        阶段失败或未通过质量门禁时，其所有下游阶段被跳过，不相关的分支继续执行。
+        超过 run_timeout 或调用 abort() 时取消正在执行的阶段并不再启动新阶段；
+        本协程被取消时，取消会传递给正在执行的处理器。
+
+        Args:
+            phases: 要执行的阶段
+            graph: 阶段 -> 其依赖的阶段
+            context: 上下文
+            completed: 已完成的阶段结果（不再执行，视为已通过）
+            on_result: 每个阶段结束后以当前全部结果调用（写检查点）
+
+        Returns:
+            各阶段的结果（已完成的在前，其余按完成顺序）
+        """
+        limit = self._concurrency_limit()
+        results: dict[Phase, PhaseResult] = dict(completed or {})
+        waiting = {
+            phase: graph[phase] - results.keys()
+            for phase in phases
+            if phase not in results
+        }
+        dependents: dict[Phase, list[Phase]] = {phase: [] for phase in phases}
         for phase in phases:
-            result = await self._run_phase(phase, context)
-            results[phase] = result
+            for dep in graph[phase]:
+                dependents[dep].append(phase)
 
-            # 质量门禁检查
-            if not result.success:
-                self._print_phase_failed(phase, result)
-                break
+        running: dict[asyncio.Task, Phase] = {}
+        started: dict[Phase, float] = {}
 
-            if result.quality_score < self.config_manager.config.quality_gate:
-                self._print_quality_gate_failed(phase, result)
-                break
+        loop = asyncio.get_running_loop()
+        run_timeout = self.config_manager.config.run_timeout
+        deadline = loop.time() + run_timeout if run_timeout else None
+        self._loop, self._running = loop, running
 
-            self._print_phase_complete(phase, result)
+        def stopped_result(phase: Phase) -> PhaseResult:
+            timed_out = self._stop_reason == "timed_out"
+            return PhaseResult(
+                phase=phase,
+                success=False,
+                duration=time.perf_counter() - started[phase],
+                errors=["Workflow run timed out" if timed_out else "Workflow run aborted"],
+                timed_out=timed_out,
+                cancelled=True
+            )
 
-        # 打印工作流完成
-        self._print_workflow_complete(results)
+        def skip_downstream(phase: Phase) -> None:
+            stack = list(dependents[phase])
+            while stack:
+                dependent = stack.pop()
+                if waiting.pop(dependent, None) is not None:
+                    self._print_phase_skipped(dependent, phase)
+                    self._emit(WorkflowEventType.PHASE_SKIPPED, dependent, blocked_by=phase.value)
+                    stack.extend(dependents[dependent])
+
+        def start_ready() -> None:
+            for phase in phases:
+                if len(running) >= limit or self._stop_reason is not None:
+                    return
+                if phase in waiting and not waiting[phase]:
+                    del waiting[phase]
+                    task = asyncio.create_task(self._run_cached_phase(phase, graph[phase], context))
+                    running[task] = phase
+                    started[phase] = time.perf_counter()
+                    self._emit(WorkflowEventType.PHASE_STARTED, phase)
+
+        def collect(done: set) -> None:
+            for task in done:
+                phase = running.pop(task)
+                result = stopped_result(phase) if task.cancelled() else task.result()
+                results[phase] = result
+                context.results[phase] = result
+
+                # 质量门禁检查
+                gate = self.config_manager.config.quality_gate
+                if not result.success:
+                    self._print_phase_failed(phase, result)
+                    self._emit(WorkflowEventType.PHASE_FAILED, phase, result=result.to_dict())
+                    skip_downstream(phase)
+                elif result.quality_score < gate:
+                    self._print_quality_gate_failed(phase, result)
+                    self._emit(
+                        WorkflowEventType.GATE_FAILED, phase,
+                        result=result.to_dict(), quality_gate=gate
+                    )
+                    skip_downstream(phase)
+                else:
+                    self._print_phase_complete(phase, result)
+                    self._emit(WorkflowEventType.PHASE_COMPLETED, phase, result=result.to_dict())
+                    for dependent in dependents[phase]:
+                        if dependent in waiting:
+                            waiting[dependent].discard(phase)
+                if on_result is not None:
+                    on_result(results)
 
-        # 保存执行报告
-        self._save_report(results)
+        try:
+            start_ready()
+            while running:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # 运行超时：取消正在执行的阶段，等待它们结束
+                    self._request_stop("timed_out")
+                    done, _ = await asyncio.wait(running)
+                collect(done)
+                start_ready()
+        except asyncio.CancelledError:
+            # run() 本身被取消：把取消传递给正在执行的处理器
+            self._abandoned = True
+            context.cancel_event.set()
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        finally:
+            self._loop, self._running = None, {}
 
         return results
 
@@ -178,7 +811,110 @@ class WorkflowEngine:
                 phases.append(phase_map[p])
         return phases
 
+    def _phase_cache_key(
+        self,
+        phase: Phase,
+        dependencies: set[Phase],
+        context: WorkflowContext
+    ) -> Optional[str]:
+        """
+        计算阶段输入的内容哈希
+
+        Args:
+            phase: 阶段
+            dependencies: 该阶段依赖的已选阶段（其结果已在 context.results 中）
+            context: 上下文
+
+        Returns:
+            缓存键，未注册处理器时返回 None
+        """
+        handler = self._phase_handlers.get(phase)
+        if handler is None:
+            return None
+
+        config = self.config_manager.config
+        patterns = [
+            pattern.format(output_dir=config.output_dir)
+            for pattern in self.phase_inputs.get(phase, ())
+        ]
+        upstream = {
+            dep.value: context.results[dep].output
+            for dep in sorted(dependencies, key=lambda dep: dep.value)
+            if dep in context.results
+        }
+        return phase_cache_key(
+            phase.value,
+            handler,
+            dict(config.__dict__),
+            upstream,
+            context.user_input,
+            hash_files(self.project_dir, patterns),
+        )
+
+    async def _run_cached_phase(
+        self,
+        phase: Phase,
+        dependencies: set[Phase],
+        context: WorkflowContext
+    ) -> PhaseResult:
+        """
+        执行单个阶段，输入未变化时复用缓存结果
+
+        缓存记录包含阶段对共享上下文的改动（新增或改变的键），命中时重放到 context，
+        下游阶段看到的上下文与实际执行时一致。与其并发执行的阶段在此期间写入的键
+        也会被计入，重放时写入相同的值。
+
+        Args:
+            phase: 阶段
+            dependencies: 该阶段依赖的已选阶段
+            context: 上下文
+
+        Returns:
+            阶段执行结果
+        """
+        if self.cache is None:
+            return await self._run_phase(phase, context)
+
+        start_time = time.perf_counter()
+        key = self._phase_cache_key(phase, dependencies, context)
+        record = self.cache.load(key) if key else None
+        if record is not None:
+            for name, values in record.get("context", {}).items():
+                getattr(context, name).update(values)
+            return PhaseResult(
+                phase=phase,
+                success=True,
+                duration=time.perf_counter() - start_time,
+                output=record.get("output"),
+                quality_score=record.get("quality_score", 0.0),
+                cached=True
+            )
+
+        fields = {name: getattr(context, name) for name in CONTEXT_FIELDS}
+        before = context_digests(fields) if key else {}
+        result = await self._run_phase(phase, context)
+        if key and result.success:
+            self.cache.store(key, {
+                "phase": phase.value,
+                "output": result.output,
+                "context": context_delta(before, fields),
+                "quality_score": result.quality_score,
+                "duration": result.duration,
+            })
+        return result
+
     async def _run_phase(self, phase: Phase, context: WorkflowContext) -> PhaseResult:
+        """执行单个阶段（记录 span）"""
+        with span(f"workflow.{phase.value}", "workflow") as current:
+            result = await self._run_phase_handler(phase, context)
+            current.set(
+                success=result.success,
+                quality_score=result.quality_score,
+                timed_out=result.timed_out
+            )
+            return result
+
+    async def _run_phase_handler(self, phase: Phase, context: WorkflowContext) -> PhaseResult:
         """
         执行单个阶段
 
@@ -190,6 +926,8 @@ class WorkflowEngine:
             阶段执行结果
         """
         start_time = datetime.now()
+        timeout = self._phase_timeout(phase)
+        _CURRENT_PHASE.set(phase)  # 每个阶段在独立的任务中执行，不影响其他阶段
 
         try:
             # 获取阶段处理器
@@ -197,8 +935,11 @@ class WorkflowEngine:
             if handler is None:
                 raise ValueError(f"No handler registered for phase: {phase}")
 
-            # 执行阶段
-            output = await self._execute_handler(handler, context)
+            # 执行阶段（超时后取消处理器）
+            output = await asyncio.wait_for(
+                self._execute_handler(handler, context, self.phase_executors.get(phase, EXECUTOR_IO)),
+                timeout=timeout
+            )
 
             duration = (datetime.now() - start_time).total_seconds()
 
@@ -210,6 +951,20 @@ class WorkflowEngine:
                 quality_score=self._calculate_quality_score(phase, context)
             )
 
+        except asyncio.TimeoutError as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            if timeout is None or duration < timeout:
+                # 处理器自身抛出的超时异常
+                return PhaseResult(phase=phase, success=False, duration=duration, errors=[str(e)])
+            self._abandoned = True
+            return PhaseResult(
+                phase=phase,
+                success=False,
+                duration=duration,
+                errors=[f"Phase timed out after {timeout:g}s"],
+                timed_out=True
+            )
+
         except Exception as e:
             duration = (datetime.now() - start_time).total_seconds()
             return PhaseResult(
@@ -219,12 +974,47 @@ class WorkflowEngine:
                 errors=[str(e)]
             )
 
-    async def _execute_handler(self, handler: Callable, context: WorkflowContext) -> Any:
-        """执行处理器（支持同步和异步）"""
+    async def _execute_handler(
+        self,
+        handler: Callable,
+        context: WorkflowContext,
+        executor: str = EXECUTOR_IO
+    ) -> Any:
+        """执行处理器（异步处理器直接等待，同步处理器交给执行器，不阻塞事件循环）"""
         if asyncio.iscoroutinefunction(handler):
             return await handler(context)
-        else:
-            return handler(context)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(handler, context)
+        if executor == EXECUTOR_IO:
+            # 线程中保留当前阶段等上下文变量（进程池无法传递）
+            call = functools.partial(contextvars.copy_context().run, call)
+        return await loop.run_in_executor(self._get_executor(executor), call)
+
+    def _get_executor(self, kind: str) -> Executor:
+        """获取（必要时创建）指定类型的执行器"""
+        executor = self._executors.get(kind) or self._owned_executors.get(kind)
+        if executor is None:
+            if kind == EXECUTOR_CPU:
+                executor = ProcessPoolExecutor(max_workers=min(self._concurrency_limit(), os.cpu_count() or 1))
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._concurrency_limit(), thread_name_prefix="super-dev-phase"
+                )
+            self._owned_executors[kind] = executor
+        return executor
+
+    def _shutdown_executors(self) -> None:
+        """
+        关闭引擎自己创建的执行器
+
+        有阶段超时、运行被中止或被取消时，不等待仍在执行的同步处理器
+        （线程无法强制结束），取消排队中的任务后立即返回，不阻塞事件循环。
+        """
+        abandoned = self._abandoned
+        for executor in self._owned_executors.values():
+            executor.shutdown(wait=not abandoned, cancel_futures=abandoned)
+        self._owned_executors.clear()
+        self._abandoned = False
 
     def _calculate_quality_score(self, phase: Phase, context: WorkflowContext) -> float:
         """计算质量分数"""
@@ -285,9 +1075,10 @@ class WorkflowEngine:
     def _print_phase_complete(self, phase: Phase, result: PhaseResult) -> None:
         """打印阶段完成"""
         if self.console:
+            source = "缓存" if result.cached else f"{result.duration:.1f}s"
             self.console.print(
                 f"[green]✓[/green] {phase.value}: "
-                f"完成 ({result.duration:.1f}s, 质量分: {result.quality_score:.0f})"
+                f"完成 ({source}, 质量分: {result.quality_score:.0f})"
             )
 
     def _print_phase_failed(self, phase: Phase, result: PhaseResult) -> None:
@@ -307,6 +1098,14 @@ class WorkflowEngine:
                 f"质量分 ({result.quality_score:.0f}) 低于门禁 ({gate})"
             )
 
+    def _print_phase_skipped(self, phase: Phase, blocker: Phase) -> None:
+        """打印阶段被跳过"""
+        if self.console:
+            self.console.print(
+                f"[dim]-[/dim] {phase.value}: "
+                f"跳过 (上游 {blocker.value} 未通过)"
+            )
+
     def _print_workflow_complete(self, results: dict[Phase, PhaseResult]) -> None:
         """打印工作流完成"""
         if self.console:
@@ -321,7 +1120,16 @@ class WorkflowEngine:
             success_count = 0
 
             for phase, result in results.items():
-                status = "[green]成功[/green]" if result.success else "[red]失败[/red]"
+                if result.success:
+                    status = "[green]成功[/green]"
+                elif result.timed_out:
+                    status = "[red]超时[/red]"
+                elif result.cancelled:
+                    status = "[yellow]已中止[/yellow]"
+                else:
+                    status = "[red]失败[/red]"
+                if result.cached:
+                    status += " [dim](缓存)[/dim]"
                 duration = f"{result.duration:.1f}s"
                 quality = f"{result.quality_score:.0f}"
 
@@ -337,8 +1145,14 @@ class WorkflowEngine:
                 f"总耗时: {total_duration:.1f}s"
             )
 
-    def _save_report(self, results: dict[Phase, PhaseResult]) -> None:
+    def _save_report(
+        self,
+        results: dict[Phase, PhaseResult],
+        graph: Optional[dict[Phase, set[Phase]]] = None,
+        skipped: Optional[list[Phase]] = None
+    ) -> None:
         """保存执行报告"""
+        graph = graph or {}
         output_dir = self.project_dir / self.config_manager.config.output_dir
         output_dir.mkdir(exist_ok=True)
 
@@ -347,15 +1161,21 @@ class WorkflowEngine:
         report_data = {
             "timestamp": datetime.now().isoformat(),
             "project": self.config_manager.config.name,
+            "run_id": self.run_id,
             "results": {
                 phase.value: {
                     "success": result.success,
                     "duration": result.duration,
                     "quality_score": result.quality_score,
-                    "errors": result.errors
+                    "errors": result.errors,
+                    "cached": result.cached,
+                    "timed_out": result.timed_out,
+                    "cancelled": result.cancelled,
+                    "depends_on": sorted(dep.value for dep in graph.get(phase, ()))
                 }
                 for phase, result in results.items()
-            }
+            },
+            "skipped": [phase.value for phase in skipped or []]
         }
 
         with open(report_path, "w", encoding="utf-8") as f:
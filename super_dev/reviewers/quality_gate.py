@@ -13,6 +13,8 @@ from typing import Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ..analyzer.package_manifests import PackageManifests
+
 
 class CheckStatus(Enum):
     """检查状态"""
@@ -201,10 +203,18 @@ class QualityGateChecker:
         },
     }
 
-    def __init__(self, project_dir: Path, name: str, tech_stack: dict):
+    def __init__(
+        self,
+        project_dir: Path,
+        name: str,
+        tech_stack: dict,
+        manifests: Optional[PackageManifests] = None,
+    ):
         self.project_dir = Path(project_dir).resolve()
         self.name = name
         self.tech_stack = tech_stack
+        # 与项目分析器共享的清单文件解析结果
+        self.manifests = manifests or PackageManifests(self.project_dir)
         self.is_zero_to_one = self._detect_zero_to_one_scenario()
 
     def _detect_zero_to_one_scenario(self) -> bool:
@@ -237,10 +247,7 @@ class QualityGateChecker:
             "Cargo.toml", "pom.xml", "build.gradle"
         ]
 
-        has_project_config = any(
-            (self.project_dir / f).exists()
-            for f in config_files
-        )
+        has_project_config = any(self.manifests.exists(f) for f in config_files)
 
         # 如果有源代码或有项目配置，说明不是 0-1 场景
         return not (has_source_code or has_project_config)
@@ -476,12 +483,8 @@ class QualityGateChecker:
         checks = []
 
         # 检查是否有测试配置
-        has_jest = (self.project_dir / "package.json").exists() and "jest" in (
-            self.project_dir / "package.json"
-        ).read_text()
-        has_pytest = (self.project_dir / "pytest.ini").exists() or (
-            self.project_dir / "pyproject.toml"
-        ).exists()
+        has_jest = "jest" in (self.manifests.read_text("package.json") or "")
+        has_pytest = self.manifests.exists("pytest.ini") or self.manifests.exists("pyproject.toml")
 
         if has_jest or has_pytest:
             checks.append(QualityCheck(
@@ -511,13 +514,9 @@ class QualityGateChecker:
         checks = []
 
         # 检查 Linter
-        has_eslint = (self.project_dir / ".eslintrc.js").exists() or (
-            self.project_dir / ".eslintrc.json"
-        ).exists()
-        has_pylint = (self.project_dir / "pylint.ini").exists()
-        has_black = (self.project_dir / "pyproject.toml").exists() and "black" in (
-            self.project_dir / "pyproject.toml"
-        ).read_text()
+        has_eslint = self.manifests.exists(".eslintrc.js") or self.manifests.exists(".eslintrc.json")
+        has_pylint = self.manifests.exists("pylint.ini")
+        has_black = "black" in (self.manifests.read_text("pyproject.toml") or "")
 
         if has_eslint or has_pylint or has_black:
             checks.append(QualityCheck(
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 
+from ..analyzer.models import ArchitectureReport
+
 
 @dataclass
 class SecurityIssue:
@@ -235,10 +237,29 @@ class RedTeamReport:
 class RedTeamReviewer:
     """红队审查器"""
 
-    def __init__(self, project_dir: Path, name: str, tech_stack: dict):
+    # 被依赖数达到该值的模块视为依赖热点
+    HOTSPOT_FAN_IN = 20
+
+    def __init__(
+        self,
+        project_dir: Path,
+        name: str,
+        tech_stack: dict,
+        architecture: Optional[ArchitectureReport] = None,
+    ):
+        """
+        初始化审查器
+
+        Args:
+            project_dir: 项目目录
+            name: 项目名称
+            tech_stack: 技术栈配置
+            architecture: 现有代码的架构分析报告，提供时架构审查基于真实的模块依赖数据
+        """
         self.project_dir = Path(project_dir).resolve()
         self.name = name
         self.tech_stack = tech_stack
+        self.architecture = architecture
         self.platform = tech_stack.get("platform", "web")
         self.frontend = tech_stack.get("frontend", "react")
         self.backend = tech_stack.get("backend", "node")
@@ -460,7 +481,7 @@ class RedTeamReviewer:
 
     def _review_architecture(self) -> list[ArchitectureIssue]:
         """架构审查"""
-        issues = []
+        issues = self._review_import_graph()
 
         # 可扩展性
         issues.extend([
@@ -557,3 +578,51 @@ class RedTeamReviewer:
         ])
 
         return issues
+
+    def _review_import_graph(self) -> list[ArchitectureIssue]:
+        """基于模块导入图的架构审查（循环依赖、依赖热点、分层违规）"""
+        graph = self.architecture.import_graph if self.architecture else None
+        if graph is None or not graph.module_count:
+            return []
+
+        issues = []
+
+        if graph.cycle_count:
+            largest = graph.cycles[0]
+            example = " ↔ ".join(largest[:3]) + (" ..." if len(largest) > 3 else "")
+            issues.append(ArchitectureIssue(
+                severity="high",
+                category="可维护性",
+                description=(
+                    f"检测到 {graph.cycle_count} 组循环依赖，"
+                    f"最大的一组包含 {len(largest)} 个模块: {example}"
+                ),
+                recommendation="提取公共部分到独立模块，或通过接口/依赖倒置打破循环",
+                adr_needed=True
+            ))
+
+        hotspots = [h for h in graph.hotspots if h[1] >= self.HOTSPOT_FAN_IN]
+        if hotspots:
+            shown = ", ".join(f"{module} ({fan_in})" for module, fan_in, _ in hotspots[:3])
+            issues.append(ArchitectureIssue(
+                severity="medium",
+                category="可维护性",
+                description=f"{len(hotspots)} 个模块被大量模块依赖: {shown}",
+                recommendation="热点模块的改动影响面大，应保持接口稳定并按职责拆分",
+                adr_needed=False
+            ))
+
+        if graph.layer_violation_count:
+            source, target = graph.layer_violations[0]
+            issues.append(ArchitectureIssue(
+                severity="high",
+                category="可维护性",
+                description=(
+                    f"检测到 {graph.layer_violation_count} 处分层违规（内层依赖外层），"
+                    f"例如 {source} → {target}"
+                ),
+                recommendation="内层（领域/服务）不应导入外层（接口/控制器），将依赖方向反转或下沉共享代码",
+                adr_needed=True
+            ))
+
+        return issues
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 轻量级追踪
+
+基于 perf_counter_ns 记录嵌套的耗时区间（span），可导出为 Chrome trace-event 格式
+（在 Perfetto / chrome://tracing 中打开）或带父子关系的 JSON。
+
+追踪默认关闭：未启用时 span() 返回一个共享的空上下文管理器，traced 装饰的函数
+只多一次全局变量判断，可以常驻在生产代码中。父子关系通过 contextvars 传递，
+asyncio 任务各自继承创建时的当前 span；每个线程 / asyncio 任务在时间线上单独成轨。
+进程池工作进程中的 span 不会被收集。
+"""
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class Span:
+    """一个已结束或进行中的区间"""
+    span_id: int
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int = 0
+    parent_id: Optional[int] = None
+    track: int = 0  # 时间线轨道（线程或 asyncio 任务）
+    args: dict = field(default_factory=dict)
+
+    @property
+    def duration_ns(self) -> int:
+        return max(0, self.end_ns - self.start_ns)
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "category": self.category,
+            "start_ns": self.start_ns,
+            "duration_ns": self.duration_ns,
+            "track": self.track,
+            "args": self.args,
+        }
+
+
+# 当前上下文中正在进行的 span
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "super_dev_current_span", default=None
+)
+
+
+def _track() -> tuple[int, str]:
+    """当前轨道 ID 与名称：asyncio 任务中为任务，否则为线程"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return id(task), task.get_name()
+    thread = threading.current_thread()
+    return thread.ident or 0, thread.name
+
+
+class Tracer:
+    """span 收集器（线程安全）"""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self.track_names: dict[int, str] = {}
+        self.origin_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self, name: str, category: str = "super_dev", **args: Any) -> Span:
+        """开始一个 span（父 span 为当前上下文中的 span）"""
+        parent = _current_span.get()
+        track, track_name = _track()
+        span = Span(
+            span_id=next(self._ids),
+            name=name,
+            category=category,
+            start_ns=time.perf_counter_ns(),
+            parent_id=parent.span_id if parent is not None else None,
+            track=track,
+            args=args,
+        )
+        if track not in self.track_names:
+            self.track_names[track] = track_name
+        return span
+
+    def finish(self, span: Span) -> None:
+        """结束 span 并记录"""
+        span.end_ns = time.perf_counter_ns()
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self) -> dict:
+        """导出为带父子关系的 JSON 结构（按开始时间排序）"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+        return {"origin_ns": self.origin_ns, "spans": [span.to_dict() for span in spans]}
+
+    def to_chrome_trace(self) -> dict:
+        """
+        导出为 Chrome trace-event 格式
+
+        Returns:
+            {"traceEvents": [...]}，时间单位为微秒
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+            track_names = dict(self.track_names)
+
+        # 轨道 ID 映射为小整数，便于查看
+        tids: dict[int, int] = {}
+        events: list[dict] = []
+        for span in spans:
+            tid = tids.setdefault(span.track, len(tids) + 1)
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self.origin_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if span.args:
+                event["args"] = span.args
+            events.append(event)
+
+        for track, tid in tids.items():
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": track_names.get(track, str(track))},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        """
+        写入 Chrome trace 文件
+
+        Args:
+            path: 输出路径
+
+        Returns:
+            输出路径
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=repr)
+        return path
+
+
+# 当前启用的追踪器，None 表示未启用
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    """启用追踪（已启用时返回现有追踪器）"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """停用追踪并返回收集到的结果"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """当前启用的追踪器"""
+    return _tracer
+
+
+class _NullSpan:
+    """未启用追踪时使用的空上下文管理器"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    """启用追踪时的 span 上下文管理器"""
+
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.span = tracer.start(name, category, **args)
+        self.token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> "_ActiveSpan":
+        self.token = _current_span.set(self.span)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.span.args["error"] = exc_type.__name__
+        if self.token is not None:
+            _current_span.reset(self.token)
+        self.tracer.finish(self.span)
+
+    def set(self, **args: Any) -> None:
+        """补充 span 参数（如结果数量）"""
+        self.span.args.update(args)
+
+
+def span(name: str, category: str = "super_dev", **args: Any) -> Any:
+    """
+    记录一个区间
+
+    Example:
+        with span("design.search", "design", query=query) as current:
+            results = ...
+            current.set(count=len(results))
+
+    Args:
+        name: 名称
+        category: 分类（Chrome trace 的 cat）
+        **args: 附加参数
+
+    Returns:
+        上下文管理器；未启用追踪时为共享的空实现
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _ActiveSpan(tracer, name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "super_dev") -> Callable:
+    """
+    函数装饰器：每次调用记录一个 span（支持协程函数）
+
+    Args:
+        name: 名称，默认为函数的限定名
+        category: 分类
+
+    Returns:
+        装饰器
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with span(span_name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class SpanSequence:
+    """
+    依次进行的一组区间（如流水线的各个阶段）
+
+    next() 结束上一个区间并开始下一个，close() 结束最后一个；
+    适用于不便把每一段代码包进 with 语句的长流程。
+    """
+
+    def __init__(self, category: str = "super_dev"):
+        self.category = category
+        self._current: Any = None
+
+    def next(self, name: str, **args: Any) -> None:
+        """开始下一个区间"""
+        self.close()
+        if _tracer is not None:
+            self._current = span(name, self.category, **args)
+            self._current.__enter__()
+
+    def close(self) -> None:
+        """结束当前区间"""
+        if self._current is not None:
+            current, self._current = self._current, None
+            current.__exit__(None, None, None)
@@ -82,6 +82,9 @@ frontend_path = Path(__file__).parent / "frontend" / "dist"
 if frontend_path.exists():
     app.mount("/", StaticFiles(directory=str(frontend_path), html=True), name="frontend")
 
+# 正在运行的工作流（run_id -> 引擎），用于中止
+_active_workflows: dict[str, WorkflowEngine] = {}
+
 
 # ==================== API 路由 ====================
 
@@ -206,9 +209,14 @@ async def run_workflow(
         run_id = str(uuid.uuid4())[:8]
 
         # 后台运行工作流
+        engine = WorkflowEngine(Path(project_dir))
+        _active_workflows[run_id] = engine
+
         async def run_workflow_background():
-            engine = WorkflowEngine(Path(project_dir))
-            await engine.run(phases=phases)
+            try:
+                await engine.run(phases=phases, run_id=run_id)
+            finally:
+                _active_workflows.pop(run_id, None)
 
         background_tasks.add_task(run_workflow_background)
 
@@ -224,6 +232,16 @@ async def run_workflow(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/workflow/abort/{run_id}")
+async def abort_workflow(run_id: str) -> dict:
+    """中止正在运行的工作流"""
+    engine = _active_workflows.get(run_id)
+    if engine is None:
+        raise HTTPException(status_code=404, detail="工作流未在运行")
+    engine.abort()
+    return {"run_id": run_id, "status": "aborting"}
+
+
 @app.get("/api/workflow/status/{run_id}")
 async def get_workflow_status(run_id: str, project_dir: str = ".") -> dict:
     """获取工作流状态"""
@@ -7,10 +7,10 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Dict, Generator, Optional
 
 from super_dev.config import ConfigManager, ProjectConfig
-from super_dev.orchestrator import WorkflowEngine, WorkflowContext
+from super_dev.orchestrator import Phase, WorkflowEngine, WorkflowContext
 
 
 @pytest.fixture(autouse=True)
@@ -57,6 +57,32 @@ def workflow_engine(temp_project_dir: Path) -> WorkflowEngine:
     return WorkflowEngine(temp_project_dir)
 
 
+@pytest.fixture
+def engine_factory(temp_project_dir: Path) -> Callable[..., WorkflowEngine]:
+    """可配置的工作流引擎工厂
+
+    返回的工厂每次调用都在 temp_project_dir 上写入测试配置并创建新引擎，
+    默认注册一个直接返回的 discovery 处理器；其余处理器由各测试自行注册。
+
+    工厂参数:
+        config: 传给 ConfigManager.create 的额外配置项
+        **kwargs: 传给 WorkflowEngine 的关键字参数
+    """
+    def factory(config: Optional[Dict[str, Any]] = None, **kwargs) -> WorkflowEngine:
+        manager = ConfigManager(temp_project_dir)
+        manager.create(name="test", quality_gate=80, **(config or {}))
+        engine = WorkflowEngine(temp_project_dir, **kwargs)
+        engine.config_manager = manager
+
+        async def discovery(context):
+            return "discovery"
+
+        engine.register_phase_handler(Phase.DISCOVERY, discovery)
+        return engine
+
+    return factory
+
+
 @pytest.fixture
 def workflow_context(temp_project_dir: Path, config_manager: ConfigManager) -> WorkflowContext:
     """工作流上下文"""
@@ -3,6 +3,7 @@
 Super Dev CLI 集成测试
 """
 
+import json
 import os
 import pytest
 import yaml
@@ -187,3 +188,99 @@ class TestCLIDeploy:
         result = cli.run(["deploy", "--cicd", "gitlab"])
 
         assert result == 0
+
+
+class TestCLIWorkflow:
+    """测试 workflow 命令"""
+
+    def test_events_stdout_is_ndjson(self, temp_project_dir: Path, capsys, monkeypatch):
+        """测试 --events 时标准输出的每一行都是 JSON 事件"""
+        monkeypatch.setattr("super_dev.config.manager._global_config_manager", None)
+        original_cwd = os.getcwd()
+        os.chdir(temp_project_dir)
+
+        try:
+            cli = SuperDevCLI()
+            cli.run(["init", "test-project"])
+            capsys.readouterr()
+
+            cli = SuperDevCLI()
+            cli.run(["workflow", "--phase", "discovery", "--events", "--no-cache"])
+            stdout = capsys.readouterr().out
+
+            events = [json.loads(line) for line in stdout.splitlines()]
+            types = [event["type"] for event in events]
+            assert types[0] == "workflow_started"
+            assert types[-1] == "workflow_completed"
+        finally:
+            os.chdir(original_cwd)
+
+
+class TestCLIPipeline:
+    """测试 pipeline 命令"""
+
+    def test_manifests_read_once(self, temp_project_dir: Path, monkeypatch):
+        """测试一次流水线中每个清单文件只从磁盘读取一次"""
+        from super_dev.analyzer.package_manifests import PackageManifests
+
+        (temp_project_dir / "package.json").write_text(
+            json.dumps({"name": "demo", "dependencies": {"react": "^18.0.0"}}), encoding="utf-8"
+        )
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "index.js").write_text("export default 1;\n", encoding="utf-8")
+
+        reads: dict = {}
+        read_text = PackageManifests.read_text
+
+        def counting_read_text(self, name):
+            if name not in self._texts and self.exists(name):
+                reads[name] = reads.get(name, 0) + 1
+            return read_text(self, name)
+
+        monkeypatch.setattr(PackageManifests, "read_text", counting_read_text)
+        original_cwd = os.getcwd()
+        os.chdir(temp_project_dir)
+
+        try:
+            cli = SuperDevCLI()
+            cli.run(["pipeline", "用户认证系统", "--name", "demo"])
+        finally:
+            os.chdir(original_cwd)
+
+        assert reads.get("package.json") == 1
+
+    def test_no_analysis_cache_written(self, temp_project_dir: Path):
+        """测试红队审查阶段的项目分析不写入分析缓存"""
+        (temp_project_dir / "main.py").write_text("print('hi')\n", encoding="utf-8")
+        original_cwd = os.getcwd()
+        os.chdir(temp_project_dir)
+
+        try:
+            cli = SuperDevCLI()
+            cli.run(["pipeline", "用户认证系统", "--name", "demo", "--skip-quality-gate"])
+        finally:
+            os.chdir(original_cwd)
+
+        assert (temp_project_dir / "output" / "demo-redteam.md").exists()
+        assert not (temp_project_dir / ".super-dev" / "cache" / "analysis.json").exists()
+
+
+class TestCLIAnalyze:
+    """测试 analyze 命令"""
+
+    def test_sampled_text_output_marks_estimates(self, temp_project_dir: Path, capsys):
+        """测试抽样模式的文本输出标注估计值与置信区间"""
+        for directory in ("core", "api"):
+            (temp_project_dir / directory).mkdir()
+            for i in range(30):
+                (temp_project_dir / directory / f"m{i}.py").write_text("x = 1\n" * (i + 1))
+
+        cli = SuperDevCLI()
+        result = cli.run(["analyze", str(temp_project_dir), "--sample-rate", "0.3", "--no-cache"])
+        output = capsys.readouterr().out
+
+        assert result == 0
+        assert "抽样: 读取" in output
+        assert "代码行数: ≈" in output
+        assert "95% CI" in output
+        assert "Python: ≈" in output
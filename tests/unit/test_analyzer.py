@@ -464,3 +464,1203 @@ def read_root():
         # src 应该有子目录
         assert "components" in report.directory_structure.get("src", {})
         assert "utils" in report.directory_structure.get("src", {})
+
+
+class TestFileManifest:
+    """测试文件清单"""
+
+    def test_build_manifest(self, temp_project_dir: Path):
+        """测试一次遍历生成清单"""
+        from super_dev.analyzer import build_manifest
+
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "app.py").write_text("print('hi')\n")
+        (temp_project_dir / "README.md").write_text("# readme\n")
+
+        manifest = build_manifest(temp_project_dir)
+        by_path = {entry.rel_path: entry for entry in manifest.files}
+
+        assert manifest.dirs == ["src"]
+        assert by_path["src/app.py"].language == "Python"
+        assert by_path["src/app.py"].size == len("print('hi')\n")
+        assert by_path["README.md"].language is None
+        assert [entry.rel_path for entry in manifest.code_files] == ["src/app.py"]
+
+    def test_manifest_prunes_ignored_dirs(self, temp_project_dir: Path):
+        """测试忽略目录不被遍历，Python 模式检测也不会进入"""
+        (temp_project_dir / "requirements.txt").write_text("flask\n")
+        for ignored in ("node_modules", "venv"):
+            (temp_project_dir / ignored).mkdir()
+            (temp_project_dir / ignored / "vendored.py").write_text(
+                "class Registry:\n    def get_instance(self):\n        pass\n"
+            )
+        (temp_project_dir / "main.py").write_text("x = 1\n")
+
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert report.file_count == 1
+        assert report.design_patterns == []
+        assert "node_modules" not in report.directory_structure
+
+    def test_parallel_scan_matches_serial(self, temp_project_dir: Path, monkeypatch):
+        """测试进程池扫描结果与单进程一致"""
+        from super_dev.analyzer import scanner
+
+        (temp_project_dir / "requirements.txt").write_text("flask\n")
+        for i in range(12):
+            (temp_project_dir / f"mod_{i:02d}.py").write_text(
+                "class Bus:\n    def subscribe(self):\n        pass\n" + "x = 1\n" * i
+            )
+
+        serial = ProjectAnalyzer(temp_project_dir).analyze()
+
+        monkeypatch.setattr(scanner, "MIN_PARALLEL_TASKS", 0)
+        parallel = ProjectAnalyzer(temp_project_dir).analyze(workers=3)
+
+        assert parallel.file_count == serial.file_count == 12
+        assert parallel.total_lines == serial.total_lines
+        assert [p.to_dict() for p in parallel.design_patterns] == [
+            p.to_dict() for p in serial.design_patterns
+        ]
+
+
+class TestAnalysisCache:
+    """测试增量分析缓存"""
+
+    def _make_project(self, project_dir: Path) -> None:
+        (project_dir / "requirements.txt").write_text("flask\n")
+        (project_dir / "service.py").write_text(
+            "class Service:\n    def get_instance(self):\n        pass\n"
+        )
+        (project_dir / "util.py").write_text("x = 1\ny = 2\n")
+
+    def test_warm_run_skips_unchanged_files(self, temp_project_dir: Path, monkeypatch):
+        """测试缓存命中时不再扫描文件"""
+        from super_dev.analyzer import analyzer as analyzer_module
+
+        self._make_project(temp_project_dir)
+        cold = ProjectAnalyzer(temp_project_dir).analyze(use_cache=True)
+        assert (temp_project_dir / ".super-dev" / "cache" / "analysis.json").exists()
+
+        scanned: list = []
+        original = analyzer_module.scan_files
+
+        def tracking_scan(tasks, *args, **kwargs):
+            scanned.extend(entry.rel_path for entry, _ in tasks)
+            return original(tasks, *args, **kwargs)
+
+        monkeypatch.setattr(analyzer_module, "scan_files", tracking_scan)
+
+        warm = ProjectAnalyzer(temp_project_dir).analyze(use_cache=True)
+        assert scanned == []
+        assert warm.total_lines == cold.total_lines
+        assert [p.to_dict() for p in warm.design_patterns] == [
+            p.to_dict() for p in cold.design_patterns
+        ]
+
+        (temp_project_dir / "util.py").write_text("x = 1\ny = 2\nz = 3\n")
+        changed = ProjectAnalyzer(temp_project_dir).analyze(use_cache=True)
+        assert scanned == ["util.py"]
+        assert changed.total_lines == cold.total_lines + 1
+
+
+    def test_lowered_size_cap_skips_cached_file(self, temp_project_dir: Path):
+        """测试缓存后调低大小上限时，超过上限的文件不再从缓存计入"""
+        (temp_project_dir / "big.py").write_text("x = 1\n" * 5000)
+
+        cold = ProjectAnalyzer(temp_project_dir).analyze(use_cache=True, max_file_size=None)
+        assert cold.total_lines == 5000
+
+        warm = ProjectAnalyzer(temp_project_dir).analyze(use_cache=True, max_file_size=10_000)
+        uncached = ProjectAnalyzer(temp_project_dir).analyze(use_cache=False, max_file_size=10_000)
+
+        assert warm.total_lines == uncached.total_lines == 0
+        assert warm.skipped_files == {"too_large": 1}
+
+
+class TestLineCounting:
+    """测试行数统计"""
+
+    def test_count_matches_readlines(self, temp_project_dir: Path):
+        """测试二进制计数与 readlines 结果一致"""
+        from super_dev.analyzer.scanner import CHUNK_SIZE, count_file_lines
+
+        samples = {
+            "empty.py": b"",
+            "no_trailing.py": b"a = 1\nb = 2",
+            "trailing.py": b"a = 1\nb = 2\n",
+            "multi_chunk.py": b"x = 1\n" * (CHUNK_SIZE // 3),
+        }
+        for name, data in samples.items():
+            path = temp_project_dir / name
+            path.write_bytes(data)
+            with open(path, "r", encoding="utf-8") as f:
+                expected = len(f.readlines())
+
+            lines, digest, skipped, _ = count_file_lines(str(path), len(data), max_size=None)
+            assert lines == expected, name
+            assert skipped is None
+
+    def test_chunk_boundaries(self, temp_project_dir: Path, monkeypatch):
+        """测试跨块读取时行数、哈希与内容完整"""
+        import hashlib
+
+        from super_dev.analyzer import scanner
+
+        monkeypatch.setattr(scanner, "CHUNK_SIZE", 64)
+
+        data = b"value = 42\n" * 100 + b"tail"
+        path = temp_project_dir / "big.py"
+        path.write_bytes(data)
+
+        lines, digest, _, content = scanner.count_file_lines(
+            str(path), len(data), max_size=None, keep_content=True
+        )
+        assert lines == 101
+        assert content == data
+        assert digest == hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def test_skip_large_minified_and_generated(self, temp_project_dir: Path):
+        """测试超过上限、压缩和生成文件被跳过"""
+        (temp_project_dir / "package.json").write_text(json.dumps({"name": "test"}))
+        (temp_project_dir / "app.js").write_text("const a = 1;\n")
+        (temp_project_dir / "vendor.min.js").write_text("var a=1;" * 10)
+        (temp_project_dir / "bundle.js").write_text("var a=1;" * 600)
+        (temp_project_dir / "schema.ts").write_text("// @generated\nexport const x = 1;\n")
+        (temp_project_dir / "huge.js").write_text("let x = 1;\n" * 1000)
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(max_file_size=10_000)
+
+        assert report.file_count == 1
+        assert report.total_lines == 1
+        assert report.skipped_files == {"minified": 2, "generated": 1, "too_large": 1}
+
+
+class TestPythonPatternEngine:
+    """测试 Python 设计模式检测引擎"""
+
+    SOURCE = b"""
+class Config:
+    _instance = None
+
+    def __new__(cls):
+        return super().__new__(cls)
+
+
+class EventBus:
+    async def subscribe(self, handler):
+        pass
+
+    def notify(self, event):
+        pass
+
+
+class WidgetFactory:
+    pass
+
+
+class RetryStrategy:
+    pass
+
+
+class QueryBuilder:
+    def build(self):
+        return ""
+"""
+
+    def test_detects_registered_patterns(self):
+        """测试一次遍历检测所有已注册模式"""
+        from super_dev.analyzer.patterns import detect_file_patterns
+
+        patterns = detect_file_patterns(Path("app.py"), "python", self.SOURCE)
+        names = [p.name for p in patterns]
+
+        assert names.count(PatternType.SINGLETON) == 1
+        assert names.count(PatternType.OBSERVER) == 2
+        assert PatternType.FACTORY in names
+        assert PatternType.STRATEGY in names
+        assert PatternType.BUILDER in names
+
+    def test_single_traversal(self, monkeypatch):
+        """测试新增检测器不会增加 AST 遍历次数"""
+        import ast
+
+        from super_dev.analyzer import patterns as patterns_module
+
+        visited: list[str] = []
+
+        class FunctionCounter(patterns_module.PythonPatternDetector):
+            node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+            def visit(self, node):
+                visited.append(node.name)
+
+        monkeypatch.setattr(
+            patterns_module,
+            "PYTHON_DETECTORS",
+            [*patterns_module.PYTHON_DETECTORS, FunctionCounter],
+        )
+        walks: list[int] = []
+        original_visit = patterns_module.PatternVisitor.visit
+
+        def counting_visit(self, node):
+            if isinstance(node, ast.Module):
+                walks.append(1)
+            return original_visit(self, node)
+
+        monkeypatch.setattr(patterns_module.PatternVisitor, "visit", counting_visit)
+
+        patterns_module.detect_file_patterns(Path("app.py"), "python", self.SOURCE)
+
+        assert walks == [1]
+        assert visited == ["__new__", "subscribe", "notify", "build"]
+
+    def test_syntax_error_is_ignored(self):
+        """测试无法解析的文件不产生模式"""
+        from super_dev.analyzer.patterns import detect_file_patterns
+
+        assert detect_file_patterns(Path("bad.py"), "python", b"def broken(:\n") == []
+
+    def test_detector_requires_visit(self):
+        """测试未实现 visit() 的检测器无法实例化"""
+        import ast
+
+        from super_dev.analyzer.patterns import PythonPatternDetector
+
+        class Incomplete(PythonPatternDetector):
+            node_types = (ast.ClassDef,)
+
+        with pytest.raises(TypeError):
+            Incomplete(Path("app.py"), [])
+
+    def test_scan_reads_file_once(self, temp_project_dir: Path, monkeypatch):
+        """测试扫描时行数统计与模式检测共享一次读取"""
+        import builtins
+
+        from super_dev.analyzer.manifest import build_manifest
+        from super_dev.analyzer.scanner import scan_file
+
+        (temp_project_dir / "app.py").write_bytes(self.SOURCE)
+        entry = build_manifest(temp_project_dir).files[0]
+
+        opened: list[str] = []
+        original_open = builtins.open
+
+        def tracking_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return original_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", tracking_open)
+        result = scan_file(entry, "python")
+
+        assert opened == [entry.path]
+        assert result.lines == self.SOURCE.count(b"\n")
+        assert any(p.name == PatternType.BUILDER for p in result.patterns)
+
+
+class TestTextPatternScanner:
+    """测试 JS/TS 关键字扫描"""
+
+    def test_scan_keywords_positions(self):
+        """测试单次扫描返回关键字首次出现位置"""
+        from super_dev.analyzer.patterns import scan_keywords
+
+        data = b"const bus = {};\nbus.subscribe(fn);\nbus.emit('x');\nbus.subscribe(g);\n"
+        found = scan_keywords(data)
+
+        assert found == {"subscribe": data.index(b"subscribe"), "emit": data.index(b"emit")}
+
+    def test_rules_and_line_numbers(self):
+        """测试规则组合与行号"""
+        from super_dev.analyzer.patterns import detect_file_patterns
+
+        data = (
+            b"import x from 'y';\n"
+            b"export class ShapeFactory {\n"
+            b"  create(kind) { return new Circle(); }\n"
+            b"}\n"
+            b"window.addEventListener('load', init);\n"
+        )
+        patterns = detect_file_patterns(Path("shapes.ts"), "typescript", data)
+        by_name = {p.name: p for p in patterns}
+
+        assert set(by_name) == {PatternType.FACTORY, PatternType.OBSERVER}
+        assert by_name[PatternType.FACTORY].description.endswith("（第 3 行）")
+        assert by_name[PatternType.OBSERVER].description.endswith("（第 5 行）")
+
+    def test_all_of_requires_every_group(self):
+        """测试 all_of 规则需要每组关键字都出现"""
+        from super_dev.analyzer.patterns import detect_file_patterns
+
+        assert detect_file_patterns(Path("a.js"), "javascript", b"const factory = 1;\n") == []
+
+    def test_jsx_mjs_and_vue_files_are_scanned(self, temp_project_dir: Path):
+        """测试 .jsx/.mjs/.vue 文件参与设计模式检测"""
+        (temp_project_dir / "package.json").write_text(json.dumps({"name": "test"}))
+        src = temp_project_dir / "src"
+        src.mkdir()
+        (src / "App.jsx").write_text("store.subscribe(render);\n")
+        (src / "strategy.mjs").write_text("export class RetryStrategy {}\n")
+        (src / "Panel.vue").write_text("<script>\nthis.$emit('close');\n</script>\n")
+
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+        locations = {(p.name, Path(p.location).name) for p in report.design_patterns}
+
+        assert (PatternType.OBSERVER, "App.jsx") in locations
+        assert (PatternType.STRATEGY, "strategy.mjs") in locations
+        assert (PatternType.OBSERVER, "Panel.vue") in locations
+
+
+class TestWatchMode:
+    """测试监听模式与增量更新"""
+
+    def _make_project(self, root: Path) -> None:
+        (root / "requirements.txt").write_text("flask\n")
+        (root / "main.py").write_text("x = 1\n")
+        (root / "util.py").write_text("y = 2\n")
+
+    def test_update_rescans_only_changed_files(self, temp_project_dir: Path, monkeypatch):
+        """测试修改、新增、删除文件时只扫描受影响的文件"""
+        from super_dev.analyzer import analyzer as analyzer_module
+
+        self._make_project(temp_project_dir)
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        first = analyzer.analyze()
+        assert first.total_lines == 2
+
+        scanned: list[str] = []
+        original_scan_files = analyzer_module.scan_files
+
+        def tracking_scan(tasks, *args, **kwargs):
+            scanned.extend(entry.rel_path for entry, _ in tasks)
+            return original_scan_files(tasks, *args, **kwargs)
+
+        monkeypatch.setattr(analyzer_module, "scan_files", tracking_scan)
+
+        (temp_project_dir / "main.py").write_text("x = 1\nx += 1\nx += 2\n")
+        report = analyzer.update({"main.py"})
+        assert scanned == ["main.py"]
+        assert report.total_lines == 4
+
+        scanned.clear()
+        (temp_project_dir / "pkg").mkdir()
+        (temp_project_dir / "pkg" / "new.py").write_text("class QueryBuilder:\n    def build(self): ...\n")
+        report = analyzer.update({"pkg", "pkg/new.py"})
+        assert scanned == ["pkg/new.py"]
+        assert report.file_count == 3
+        assert any(p.name == PatternType.BUILDER for p in report.design_patterns)
+
+        scanned.clear()
+        (temp_project_dir / "util.py").unlink()
+        report = analyzer.update({"util.py"})
+        assert scanned == []
+        assert report.file_count == 2
+        assert "util.py" not in report.directory_structure
+
+    def test_irrelevant_changes_keep_report(self, temp_project_dir: Path):
+        """测试与分析无关的变化不产生新报告"""
+        self._make_project(temp_project_dir)
+        (temp_project_dir / ".gitignore").write_text("out/\n")
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        report = analyzer.analyze()
+
+        (temp_project_dir / "notes.txt").write_text("hello\n")
+        assert analyzer.update({"notes.txt", "node_modules/a/index.js", "out/x.py"}) is report
+
+    def test_polling_watcher(self, temp_project_dir: Path):
+        """测试轮询监听器检测增删改"""
+        from super_dev.analyzer.watch import PollingWatcher
+
+        self._make_project(temp_project_dir)
+        watcher = PollingWatcher(temp_project_dir, interval=0.01)
+
+        assert watcher.poll(0) == set()
+        (temp_project_dir / "util.py").unlink()
+        (temp_project_dir / "extra.py").write_text("z = 3\n")
+        assert watcher.poll(0.1) == {"util.py", "extra.py"}
+
+    def test_watcher_requires_poll(self):
+        """测试未实现 poll() 的监听器无法实例化"""
+        from super_dev.analyzer.watch import BaseWatcher
+
+        class Incomplete(BaseWatcher):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_watch_emits_updated_report(self, temp_project_dir: Path):
+        """测试 watch 在文件变化后重新输出报告"""
+        import threading
+
+        self._make_project(temp_project_dir)
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        stop = threading.Event()
+        reports: list = []
+
+        def on_report(report):
+            reports.append(report.total_lines)
+            if len(reports) == 1:
+                (temp_project_dir / "main.py").write_text("x = 1\nx = 2\n")
+            else:
+                stop.set()
+
+        for use_inotify in (True, False):
+            reports.clear()
+            stop.clear()
+            (temp_project_dir / "main.py").write_text("x = 1\n")
+            thread = threading.Thread(
+                target=analyzer.watch,
+                args=(on_report,),
+                kwargs={"interval": 0.05, "stop": stop, "use_inotify": use_inotify},
+            )
+            thread.start()
+            thread.join(timeout=10)
+            stop.set()
+
+            assert reports[:2] == [2, 3]
+
+
+class TestWorkspaces:
+    """测试 monorepo 工作区检测与按包汇总"""
+
+    def _write(self, root: Path, files: dict[str, str]) -> None:
+        for rel, content in files.items():
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def _detect(self, root: Path) -> list[tuple[str, str]]:
+        from super_dev.analyzer import build_manifest, detect_workspaces
+
+        return [(p.rel_path, p.kind) for p in detect_workspaces(root, build_manifest(root))]
+
+    def test_node_workspaces(self, temp_project_dir: Path):
+        """测试 npm/yarn 与 pnpm 工作区（含排除规则）"""
+        self._write(temp_project_dir, {
+            "package.json": json.dumps({"private": True, "workspaces": ["packages/*", "apps/web"]}),
+            "packages/ui/package.json": json.dumps({"name": "ui"}),
+            "packages/docs/README.md": "no package.json",
+            "apps/web/package.json": json.dumps({"name": "web"}),
+            "apps/admin/package.json": json.dumps({"name": "admin"}),
+        })
+        assert self._detect(temp_project_dir) == [("apps/web", "npm"), ("packages/ui", "npm")]
+
+        self._write(temp_project_dir, {
+            "pnpm-workspace.yaml": "packages:\n  - 'apps/*'\n  - '!apps/admin'\n",
+        })
+        assert self._detect(temp_project_dir) == [("apps/web", "pnpm")]
+
+    def test_python_and_go_workspaces(self, temp_project_dir: Path):
+        """测试 uv、Poetry 与 Go 工作区"""
+        self._write(temp_project_dir, {
+            "pyproject.toml": (
+                "[tool.uv.workspace]\nmembers = [\"libs/*\"]\nexclude = [\"libs/old\"]\n"
+                "[tool.poetry.dependencies]\nsvc = { path = \"./services/svc\", develop = true }\n"
+            ),
+            "libs/core/pyproject.toml": "[project]\nname = 'core'\n",
+            "libs/old/pyproject.toml": "[project]\nname = 'old'\n",
+            "services/svc/pyproject.toml": "[project]\nname = 'svc'\n",
+            "go.work": "go 1.22\n\nuse (\n\t./cmd/api // api\n)\nuse ./tools\n",
+            "cmd/api/go.mod": "module example.com/api\n",
+            "tools/go.mod": "module example.com/tools\n",
+        })
+        assert self._detect(temp_project_dir) == [
+            ("cmd/api", "go"),
+            ("libs/core", "uv"),
+            ("services/svc", "poetry"),
+            ("tools", "go"),
+        ]
+
+    def test_per_package_reports(self, temp_project_dir: Path):
+        """测试按包拆分统计并推断整体项目类型"""
+        self._write(temp_project_dir, {
+            "package.json": json.dumps({"private": True, "workspaces": ["apps/*"]}),
+            "apps/web/package.json": json.dumps({"dependencies": {"react": "^18.0.0"}}),
+            "apps/web/src/App.jsx": "export const App = () => null;\nstore.subscribe(render);\n",
+            "apps/api/package.json": json.dumps({"dependencies": {"express": "^4.0.0"}}),
+            "apps/api/index.js": "const app = express();\n",
+            "scripts/release.js": "console.log('release');\n",
+        })
+
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert set(report.packages) == {"apps/api", "apps/web"}
+        assert report.file_count == 3
+        assert report.packages["apps/web"].file_count == 1
+        assert report.packages["apps/web"].total_lines == 2
+        assert report.packages["apps/web"].category == ProjectCategory.FRONTEND
+        assert report.packages["apps/api"].category == ProjectCategory.BACKEND
+        assert set(report.packages["apps/web"].directory_structure) == {"src"}
+        assert [p.name for p in report.packages["apps/web"].design_patterns] == [PatternType.OBSERVER]
+
+        data = report.to_dict()
+        assert data["packages"]["apps/api"]["file_count"] == 1
+        assert "## 工作区成员包 (2)" in report.to_markdown()
+
+    def test_package_detection_honours_workers(self, temp_project_dir: Path, monkeypatch):
+        """测试成员包检测的线程数受 workers 限制"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from super_dev.analyzer import analyzer as analyzer_module
+
+        sizes = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers=None, **kwargs):
+                sizes.append(max_workers)
+                super().__init__(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(analyzer_module, "ThreadPoolExecutor", RecordingExecutor)
+        self._write(temp_project_dir, {
+            "package.json": json.dumps({"private": True, "workspaces": ["apps/*"]}),
+            "apps/web/package.json": json.dumps({"name": "web"}),
+            "apps/api/package.json": json.dumps({"name": "api"}),
+            "apps/cli/package.json": json.dumps({"name": "cli"}),
+        })
+
+        ProjectAnalyzer(temp_project_dir).analyze(workers=1)
+        assert sizes == [1]
+
+        sizes.clear()
+        ProjectAnalyzer(temp_project_dir).analyze(workers=8)
+        assert sizes == [3]
+
+
+class TestSampling:
+    """测试抽样估计模式"""
+
+    def _make_project(self, root: Path) -> dict[str, int]:
+        """生成两种语言、多个目录的项目，返回各语言真实行数"""
+        import random
+
+        rng = random.Random(7)
+        (root / "requirements.txt").write_text("flask\n")
+        truth = {"Python": 0, "JavaScript": 0}
+        for directory in ("core", "api", "web"):
+            (root / directory).mkdir()
+            for i in range(60):
+                lines = rng.randint(5, 80)
+                suffix, language = (".py", "Python") if i % 3 else (".js", "JavaScript")
+                (root / directory / f"m{i}{suffix}").write_text("x = 1\n" * lines)
+                truth[language] += lines
+        return truth
+
+    def test_sampling_order_is_stratified(self):
+        """测试任意前缀按比例覆盖各分层"""
+        from super_dev.analyzer.sampling import sampling_order
+
+        keys = [("a", "Python")] * 80 + [("b", "Python")] * 20
+        order = sampling_order(keys)
+
+        assert sorted(index for _, index in order) == list(range(100))
+        prefix = [keys[index] for _, index in order[:10]]
+        assert prefix.count(("a", "Python")) == 8
+        assert prefix.count(("b", "Python")) == 2
+
+    def test_estimates_cover_true_totals(self, temp_project_dir: Path):
+        """测试估计值的置信区间覆盖真实值"""
+        truth = self._make_project(temp_project_dir)
+        exact = ProjectAnalyzer(temp_project_dir).analyze()
+        assert exact.estimates == {}
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(sample_rate=0.3)
+        total = report.estimates["total_lines"]
+
+        assert 0 < total.sampled < total.population == 180
+        assert total.low <= exact.total_lines <= total.high
+        assert report.estimates["file_count"].value == pytest.approx(180)
+        for language, lines in truth.items():
+            estimate = report.estimates[f"languages_used.{language}"]
+            assert estimate.low <= lines <= estimate.high
+        assert "≈" in report.to_markdown()
+        assert report.to_dict()["estimates"]["total_lines"]["population"] == 180
+
+    def test_full_sample_is_exact(self, temp_project_dir: Path):
+        """测试抽样比例为 1 时结果与完整分析一致"""
+        self._make_project(temp_project_dir)
+        exact = ProjectAnalyzer(temp_project_dir).analyze()
+        sampled = ProjectAnalyzer(temp_project_dir).analyze(sample_rate=1.0)
+
+        assert sampled.estimates == {}
+        assert sampled.total_lines == exact.total_lines
+
+    def test_budget_stops_reading(self, temp_project_dir: Path, monkeypatch):
+        """测试时间预算耗尽后停止读取"""
+        from super_dev.analyzer import analyzer, scanner
+
+        self._make_project(temp_project_dir)
+        ticks = iter(range(1000))
+        monkeypatch.setattr(scanner.time, "monotonic", lambda: float(next(ticks)))
+        # 只测试读取阶段的截止，遍历不受预算限制
+        monkeypatch.setattr(analyzer, "WALK_BUDGET_FRACTION", float("inf"))
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(budget_seconds=1e6)
+        assert report.estimates == {}
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(budget_seconds=0.001)
+        assert report.estimates["total_lines"].sampled == 1
+
+    def test_budget_bounds_walk(self, temp_project_dir: Path, monkeypatch):
+        """测试时间预算同样限制目录遍历，未遍历的目录记入报告"""
+        from super_dev.analyzer import analyzer
+
+        self._make_project(temp_project_dir)
+        monkeypatch.setattr(analyzer, "WALK_BUDGET_FRACTION", 0.0)
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(budget_seconds=1e6)
+
+        assert report.unvisited_dirs > 0
+        assert report.to_dict()["unvisited_dirs"] == report.unvisited_dirs
+        assert "遍历未完成" in report.to_markdown()
+
+    def test_invalid_sample_rate(self, temp_project_dir: Path):
+        """测试无效的抽样比例"""
+        with pytest.raises(ValueError):
+            ProjectAnalyzer(temp_project_dir).analyze(sample_rate=1.5)
+
+
+class TestPackageManifests:
+    """测试清单文件解析缓存"""
+
+    def test_manifests_parsed_once(self, temp_project_dir: Path, monkeypatch):
+        """测试一次分析中每个清单文件只读取一次"""
+        from super_dev.analyzer import package_manifests
+
+        (temp_project_dir / "package.json").write_text(json.dumps({
+            "dependencies": {"react": "^18.0.0"},
+            "devDependencies": {"jest": "^29.0.0"},
+        }))
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "App.js").write_text("export default 1;\n")
+
+        reads: list[str] = []
+        original_read_text = Path.read_text
+
+        def tracking_read_text(self, *args, **kwargs):
+            if self.name == "package.json":
+                reads.append(str(self))
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(package_manifests.Path, "read_text", tracking_read_text)
+
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        report = analyzer.analyze()
+
+        from super_dev.reviewers.quality_gate import QualityGateChecker
+
+        checker = QualityGateChecker(
+            temp_project_dir, "demo", {}, manifests=analyzer.package_manifests
+        )
+        testing = checker._check_testing()
+
+        assert report.category == ProjectCategory.FRONTEND
+        assert report.tech_stack.testing_framework == "jest"
+        assert testing[0].score == 100
+        assert len(reads) == 1
+
+    def test_composer_project(self, temp_project_dir: Path):
+        """测试 PHP 项目类型检测"""
+        (temp_project_dir / "composer.json").write_text(
+            json.dumps({"require": {"laravel/framework": "^10.0"}})
+        )
+        assert detect_project_type(temp_project_dir) == ProjectCategory.BACKEND
+
+    def test_invalid_package_json(self, temp_project_dir: Path):
+        """测试 package.json 无法解析时的降级结果"""
+        from super_dev.analyzer.package_manifests import PackageManifests
+
+        (temp_project_dir / "package.json").write_text("{ not json")
+        manifests = PackageManifests(temp_project_dir)
+
+        assert manifests.exists("package.json")
+        assert manifests.package_json is None
+        assert detect_project_type(temp_project_dir, manifests) == ProjectCategory.UNKNOWN
+        assert detect_tech_stack(temp_project_dir, manifests).language == "javascript"
+
+
+class TestImportGraph:
+    """测试模块导入图"""
+
+    def _write(self, root: Path, files: dict[str, str]) -> None:
+        for rel_path, content in files.items():
+            path = root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def test_python_imports_and_cycles(self, temp_project_dir: Path):
+        """测试 Python 导入解析、循环依赖与分层违规"""
+        self._write(temp_project_dir, {
+            "requirements.txt": "flask\n",
+            "src/app/__init__.py": "",
+            "src/app/models/__init__.py": "",
+            "src/app/models/user.py": "from ..api import routes\nimport os\n",
+            "src/app/api/__init__.py": "",
+            "src/app/api/routes.py": "from app.models.user import User\nfrom . import helpers\n",
+            "src/app/api/helpers.py": (
+                "from typing import TYPE_CHECKING\n"
+                "if TYPE_CHECKING:\n    from app.api import routes\n"
+            ),
+        })
+
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        report = analyzer.analyze()
+        graph = report.import_graph
+
+        assert graph is not None
+        assert graph.module_count == 6
+        assert graph.edge_count == 3
+        assert graph.cycle_count == 1
+        assert graph.cycles[0] == ["src/app/api/routes.py", "src/app/models/user.py"]
+        assert graph.layer_violations == [("src/app/models/user.py", "src/app/api/routes.py")]
+        assert report.to_dict()["import_graph"]["cycle_count"] == 1
+        assert "## 模块依赖" in report.to_markdown()
+
+    def test_js_relative_and_alias_imports(self):
+        """测试 JS/TS 相对路径、index 文件和 @/ 别名解析"""
+        from super_dev.analyzer.imports import build_import_graph, extract_js_imports
+
+        source = (
+            b"import React from 'react';\n"
+            b"import { a } from './utils';\n"
+            b"export * from \"../lib\";\n"
+            b"const b = require('./b.js');\n"
+            b"const c = await import('@/store/c');\n"
+        )
+        imports = extract_js_imports(source)
+        assert imports == ["react", "./utils", "../lib", "./b.js", "@/store/c"]
+
+        graph = build_import_graph([
+            ("web/src/pages/index.tsx", imports),
+            ("web/src/pages/utils.ts", []),
+            ("web/src/lib/index.js", []),
+            ("web/src/pages/b.js", []),
+            ("web/src/store/c.ts", ["../pages/utils"]),
+        ])
+        assert list(graph.successors(0)) == [1, 2, 3, 4]
+        assert list(graph.successors(4)) == [1]
+        assert list(graph.fan_in()) == [0, 2, 1, 1, 1]
+
+    def test_tarjan_handles_deep_graphs(self):
+        """测试大图与长链不受递归深度限制"""
+        from array import array
+        from super_dev.analyzer.imports import ImportGraph, find_cycles, summarize_import_graph
+
+        size = 50_000
+        # 0 -> 1 -> ... -> n-1 -> 0 构成一个大环，另加一个独立的二元环
+        targets = array("i", range(1, size)) + array("i", [0])
+        offsets = array("i", range(size + 1))
+        modules = [f"m{i}.py" for i in range(size)] + ["x.py", "y.py"]
+        targets.extend([size + 1, size])
+        offsets.extend([size + 1, size + 2])
+        graph = ImportGraph(modules=modules, offsets=offsets, targets=targets)
+
+        cycles = find_cycles(graph)
+        assert [len(c) for c in cycles] == [size, 2]
+        summary = summarize_import_graph(graph, limit=5)
+        assert summary.cycle_count == 2
+        assert len(summary.hotspots) == 5
+
+    def test_redteam_uses_import_graph(self, temp_project_dir: Path):
+        """测试红队架构审查使用真实依赖数据"""
+        from super_dev.analyzer.models import ImportGraphSummary
+        from super_dev.reviewers import RedTeamReviewer
+
+        report = ArchitectureReport(
+            project_path=temp_project_dir,
+            category=ProjectCategory.BACKEND,
+            tech_stack=TechStack(category=ProjectCategory.BACKEND, language="python", framework="flask"),
+            import_graph=ImportGraphSummary(
+                module_count=3,
+                edge_count=3,
+                cycle_count=1,
+                cycles=[["a.py", "b.py"]],
+                hotspots=[("core.py", 25, 0)],
+            ),
+        )
+        reviewer = RedTeamReviewer(temp_project_dir, "demo", {}, architecture=report)
+        descriptions = [issue.description for issue in reviewer.review().architecture_issues]
+
+        assert any("循环依赖" in d and "a.py" in d for d in descriptions)
+        assert any("core.py (25)" in d for d in descriptions)
+        assert not any("分层违规" in d for d in descriptions)
+
+
+class TestNDJSONStream:
+    """测试 NDJSON 流式输出"""
+
+    def test_records_stream_during_analysis(self, temp_project_dir: Path, monkeypatch):
+        """测试文件记录在扫描过程中输出，报告其余部分在结束时输出"""
+        import io
+        from super_dev.analyzer import NDJSONWriter
+        from super_dev.analyzer import analyzer as analyzer_module
+
+        (temp_project_dir / "requirements.txt").write_text("flask\n")
+        (temp_project_dir / "app").mkdir()
+        (temp_project_dir / "app" / "main.py").write_text(
+            "class Config:\n    _instance = None\n"
+        )
+        (temp_project_dir / "app" / "util.py").write_text("import app.main\n")
+
+        buffer = io.StringIO()
+        writer = NDJSONWriter(buffer)
+        seen_during_scan: list[int] = []
+        original_build_report = analyzer_module.ProjectAnalyzer._build_report
+
+        def tracking_build_report(self):
+            seen_during_scan.append(writer.count)
+            return original_build_report(self)
+
+        monkeypatch.setattr(analyzer_module.ProjectAnalyzer, "_build_report", tracking_build_report)
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(emit=writer)
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        types = [record["type"] for record in records]
+
+        assert types[0] == "project"
+        assert types[-1] == "summary"
+        assert "design_pattern" not in types
+        files = {r["path"]: r for r in records if r["type"] == "file"}
+        assert set(files) == {"app/main.py", "app/util.py"}
+        assert files["app/main.py"]["patterns"][0]["name"] == "singleton"
+        assert seen_during_scan == [1 + len(files)]
+        assert {"path": "app", "kind": "dir", "type": "directory"} in records
+        assert records[-1]["total_lines"] == report.total_lines
+
+    def test_iter_records_sections(self, temp_project_dir: Path):
+        """测试按部分输出完整报告"""
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "a.py").write_text("x = 1\n")
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert [r["type"] for r in report.iter_records(("summary",))] == ["summary"]
+        paths = [r["path"] for r in report.iter_records(("directory",))]
+        assert paths == ["src", "src/a.py"]
+
+
+class TestDirectoryTree:
+    """测试紧凑目录树"""
+
+    def test_view_matches_nested_dict(self):
+        """测试视图与嵌套 dict 格式一致（目录在前、按名称排序）"""
+        from super_dev.analyzer.tree import DirectoryTree
+
+        tree = DirectoryTree.from_paths([
+            "src/utils/b.py", "src/a.py", "main.py", "src/utils/a.py", "src/a.py",
+        ])
+        view = tree.view()
+
+        assert view.to_dict() == {
+            "src": {"utils": {"a.py": None, "b.py": None}, "a.py": None},
+            "main.py": None,
+        }
+        assert list(view) == ["src", "main.py"]
+        assert list(view["src"]) == ["utils", "a.py"]
+        assert view["main.py"] is None
+        # 路径段驻留：a.py 只保存一次
+        assert tree.segments.count("a.py") == 1
+
+    def test_depth_limited_expansion(self):
+        """测试深度限制只保留含可见文件的目录，并可按需展开"""
+        from super_dev.analyzer.tree import DirectoryTree, render_tree
+
+        tree = DirectoryTree.from_paths(["a/b/c/d/deep.py", "a/top.py", "x/y/z/w/v.py"])
+        view = tree.view(1)
+
+        assert view == {"a": {"top.py": None}}
+        assert view.expand(None)["a"]["b"]["c"]["d"] == {"deep.py": None}
+        assert render_tree(tree.view(), max_depth=2) == ["- a/", "  - b/", "  - top.py", "- x/", "  - y/"]
+
+    def test_report_serializes_view(self, temp_project_dir: Path):
+        """测试报告中的目录视图可序列化"""
+        (temp_project_dir / "a" / "b" / "c" / "d").mkdir(parents=True)
+        (temp_project_dir / "a" / "b" / "c" / "d" / "deep.py").write_text("x = 1\n")
+        (temp_project_dir / "a" / "main.py").write_text("x = 1\n")
+
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert report.to_dict()["directory_structure"] == {"a": {"main.py": None}}
+        assert "d" in report.directory_structure.expand(None)["a"]["b"]["c"]
+        json.dumps(report.to_dict())
+        assert "## 目录结构" in report.to_markdown()
+
+
+class TestProfiling:
+    """测试分阶段剖析"""
+
+    def test_profile_records_stages(self, temp_project_dir: Path):
+        """测试记录各阶段的耗时、文件数、读取量和内存峰值"""
+        (temp_project_dir / "requirements.txt").write_text("flask\n")
+        (temp_project_dir / "app.py").write_text("class A:\n    pass\n" * 50)
+        (temp_project_dir / "util.js").write_text("export const a = 1;\n")
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(profile=True)
+        timings = {t.name: t for t in report.timings}
+
+        assert list(timings) == ["walk", "detect", "scan", "scan.parse", "report"]
+        assert timings["walk"].files == 3
+        assert timings["detect"].files == 1
+        assert timings["detect"].bytes_read == len("flask\n")
+        assert timings["scan"].files == 2
+        assert timings["scan"].bytes_read == (temp_project_dir / "app.py").stat().st_size + len(
+            "export const a = 1;\n"
+        )
+        assert timings["scan.parse"].files == 2
+        assert all(t.wall_seconds >= 0 and t.peak_memory is not None for t in report.timings[:3])
+        assert report.to_dict()["timings"][0]["name"] == "walk"
+        assert "## 性能剖析" in report.to_markdown()
+
+    def test_parse_cpu_time_measured(self, temp_project_dir: Path, monkeypatch):
+        """测试 scan.parse 的 CPU 时间单独测量，而不是复制墙钟时间"""
+        from super_dev.analyzer import scanner
+
+        (temp_project_dir / "app.py").write_text("class A:\n    pass\n")
+        cpu_ticks = iter(range(0, 10**6, 1000))
+        monkeypatch.setattr(scanner.time, "thread_time_ns", lambda: next(cpu_ticks))
+
+        report = ProjectAnalyzer(temp_project_dir).analyze(profile=True)
+        parse = next(t for t in report.timings if t.name == "scan.parse")
+
+        assert parse.cpu_seconds == pytest.approx(1000 / 1e9)
+        assert parse.wall_seconds != parse.cpu_seconds
+
+    def test_update_is_profiled(self, temp_project_dir: Path):
+        """测试增量更新时重新剖析"""
+        (temp_project_dir / "app.py").write_text("x = 1\n")
+        analyzer = ProjectAnalyzer(temp_project_dir)
+        analyzer.analyze(profile=True)
+
+        (temp_project_dir / "app.py").write_text("x = 1\ny = 2\nz = 3\n")
+        report = analyzer.update(["app.py"])
+        assert [t.name for t in report.timings] == ["scan", "report"]
+        assert report.timings[0].files == 1
+
+        (temp_project_dir / "new.py").write_text("x = 1\n")
+        report = analyzer.update(["new.py"])
+        assert [t.name for t in report.timings] == ["walk", "scan", "report"]
+
+    def test_profile_disabled_by_default(self, temp_project_dir: Path):
+        """测试默认不剖析、不启用 tracemalloc"""
+        import tracemalloc
+
+        (temp_project_dir / "app.py").write_text("x = 1\n")
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert report.timings == []
+        assert not tracemalloc.is_tracing()
+
+
+class TestInodeTraversal:
+    """测试按 inode 去重的遍历"""
+
+    def test_hardlinks_counted_once(self, temp_project_dir: Path):
+        """测试硬链接的文件只计入一次"""
+        import os
+        from super_dev.analyzer import build_manifest
+
+        (temp_project_dir / "a.py").write_text("x = 1\ny = 2\n")
+        os.link(temp_project_dir / "a.py", temp_project_dir / "b.py")
+
+        manifest = build_manifest(temp_project_dir)
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert [entry.rel_path for entry in manifest.files] == ["a.py"]
+        assert manifest.duplicates == 1
+        assert report.total_lines == 2
+        assert report.skipped_files == {"duplicate": 1}
+
+    def test_symlinks_skipped_by_default(self, temp_project_dir: Path):
+        """测试默认不跟随符号链接"""
+        from super_dev.analyzer import build_manifest
+
+        (temp_project_dir / "pkg").mkdir()
+        (temp_project_dir / "pkg" / "mod.py").write_text("x = 1\n")
+        (temp_project_dir / "pkg" / "loop").symlink_to(temp_project_dir)
+        (temp_project_dir / "alias.py").symlink_to(temp_project_dir / "pkg" / "mod.py")
+
+        manifest = build_manifest(temp_project_dir)
+
+        assert [entry.rel_path for entry in manifest.files] == ["pkg/mod.py"]
+        assert manifest.dirs == ["pkg"]
+
+    def test_follow_symlinks_stops_at_visited_inodes(self, temp_project_dir: Path):
+        """测试跟随符号链接时链接环和重复目录只遍历一次"""
+        from super_dev.analyzer import build_manifest
+
+        store = temp_project_dir / "store" / "lib@1.0"
+        store.mkdir(parents=True)
+        (store / "index.js").write_text("module.exports = 1;\n")
+        (store / "self").symlink_to(store)
+        (temp_project_dir / "deps").mkdir()
+        (temp_project_dir / "deps" / "lib").symlink_to(store)
+        (temp_project_dir / "deps" / "again").symlink_to(store)
+
+        manifest = build_manifest(temp_project_dir, follow_symlinks=True)
+        report = ProjectAnalyzer(temp_project_dir).analyze(follow_symlinks=True)
+
+        # 按名称深度优先：deps/again 最先访问到该目录
+        assert [entry.rel_path for entry in manifest.files] == ["deps/again/index.js"]
+        assert sorted(manifest.dirs) == ["deps", "deps/again", "store"]
+        assert manifest.duplicates == 3
+        assert report.file_count == 1
+
+
+    def test_missing_inode_from_direntry(self, temp_project_dir: Path, monkeypatch):
+        """测试 DirEntry.stat() 不提供 inode（Windows）时改用 os.stat，不误判为重复"""
+        import os
+        from contextlib import contextmanager
+        from types import SimpleNamespace
+        from super_dev.analyzer import build_manifest
+
+        class WindowsEntry:
+            def __init__(self, entry):
+                self._entry = entry
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_symlink(self):
+                return self._entry.is_symlink()
+
+            def is_dir(self):
+                return self._entry.is_dir()
+
+            def is_file(self):
+                return self._entry.is_file()
+
+            def stat(self):
+                stat = self._entry.stat()
+                return SimpleNamespace(
+                    st_ino=0, st_dev=0, st_nlink=0,
+                    st_size=stat.st_size, st_mtime_ns=stat.st_mtime_ns,
+                )
+
+        scandir = os.scandir
+
+        @contextmanager
+        def windows_scandir(path):
+            with scandir(path) as it:
+                yield [WindowsEntry(entry) for entry in it]
+
+        (temp_project_dir / "pkg").mkdir()
+        (temp_project_dir / "pkg" / "a.py").write_text("x = 1\n")
+        (temp_project_dir / "pkg" / "b.py").write_text("y = 2\n")
+        (temp_project_dir / "pkg" / "loop").symlink_to(temp_project_dir / "pkg")
+        monkeypatch.setattr(os, "scandir", windows_scandir)
+
+        manifest = build_manifest(temp_project_dir, follow_symlinks=True)
+
+        assert [entry.rel_path for entry in manifest.files] == ["pkg/a.py", "pkg/b.py"]
+        assert manifest.duplicates == 1
+
+    def test_walk_deadline(self, temp_project_dir: Path):
+        """测试到达截止时间后只遍历根目录"""
+        import time
+        from super_dev.analyzer import build_manifest
+
+        for name in ("a", "b"):
+            (temp_project_dir / name).mkdir()
+            (temp_project_dir / name / "mod.py").write_text("x = 1\n")
+        (temp_project_dir / "main.py").write_text("x = 1\n")
+
+        manifest = build_manifest(temp_project_dir, deadline=time.monotonic())
+
+        assert [entry.rel_path for entry in manifest.files] == ["main.py"]
+        assert manifest.unvisited_dirs == 2
+        assert build_manifest(temp_project_dir).unvisited_dirs == 0
+
+
+class TestBatchAnalysis:
+    """测试多仓库批量分析"""
+
+    def _make_repos(self, root: Path) -> list[Path]:
+        api = root / "api"
+        api.mkdir()
+        (api / "requirements.txt").write_text("fastapi\nrequests\n")
+        (api / "main.py").write_text("import os\n" * 10)
+
+        web = root / "web"
+        (web / "src").mkdir(parents=True)
+        (web / "package.json").write_text(json.dumps({"dependencies": {"react": "^18.0.0"}}))
+        (web / "src" / "App.tsx").write_text("export const App = 1;\n" * 4)
+        return [api, web, root / "missing"]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_analyze_many_streams_and_aggregates(self, temp_project_dir: Path, jobs: int):
+        """测试并发分析、逐个回调与跨仓库汇总"""
+        from super_dev.analyzer import aggregate_results
+
+        repos = self._make_repos(temp_project_dir)
+        streamed: list[str] = []
+
+        results = ProjectAnalyzer.analyze_many(
+            repos, jobs=jobs, on_result=lambda r: streamed.append(r.path.name)
+        )
+        summary = aggregate_results(results)
+
+        assert [r.path for r in results] == repos
+        assert sorted(streamed) == ["api", "missing", "web"]
+        assert results[0].report.tech_stack.language == "python"
+        assert "FileNotFoundError" in results[2].error
+        assert summary.repositories == 3 and summary.succeeded == 2
+        assert summary.total_lines == 14
+        assert summary.categories == {"backend": 1, "frontend": 1}
+        assert summary.language_lines == {"Python": 10, "TypeScript": 4}
+        assert summary.dependencies["react"] == 1
+        assert "## 框架分布" in summary.to_markdown()
+
+    def test_read_batch_file(self, temp_project_dir: Path):
+        """测试仓库列表文件解析"""
+        from super_dev.analyzer.batch import read_batch_file
+
+        batch = temp_project_dir / "repos.txt"
+        batch.write_text("# nightly\nsvc-a\n\n/abs/svc-b\n")
+
+        assert read_batch_file(batch) == [temp_project_dir.resolve() / "svc-a", Path("/abs/svc-b")]
+
+
+class TestIgnoreMatcher:
+    """测试忽略规则"""
+
+    def test_gitignore_semantics(self):
+        """测试 gitignore 语法"""
+        from super_dev.analyzer.ignore import IgnoreMatcher
+
+        matcher = IgnoreMatcher()
+        matcher.add_lines([
+            "# comment",
+            "*.log",
+            "/out",
+            "data/",
+            "docs/**/*.tmp",
+            "!keep.log",
+        ])
+
+        assert matcher.match("app.log")
+        assert matcher.match("nested/dir/app.log")
+        assert not matcher.match("keep.log")
+        assert matcher.match("out", is_dir=True)
+        assert not matcher.match("src/out", is_dir=True)
+        assert matcher.match("src/data", is_dir=True)
+        assert not matcher.match("src/data")  # 仅匹配目录
+        assert matcher.match("docs/a/b/c.tmp")
+        assert not matcher.match("src/main.py")
+
+    def test_analyzer_honors_ignore_sources(self, temp_project_dir: Path):
+        """测试 .gitignore、.git/info/exclude、子目录 .gitignore 和 super-dev.yaml exclude"""
+        (temp_project_dir / "requirements.txt").write_text("flask\n")
+        (temp_project_dir / ".gitignore").write_text("generated/\n")
+        (temp_project_dir / ".git" / "info").mkdir(parents=True)
+        (temp_project_dir / ".git" / "info" / "exclude").write_text("scratch.py\n")
+        (temp_project_dir / "super-dev.yaml").write_text("name: test\nexclude:\n  - dumps/\n")
+
+        for rel in ("main.py", "generated/models.py", "scratch.py", "dumps/rows.py",
+                    "pkg/keep.py", "pkg/local/tmp.py"):
+            path = temp_project_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        (temp_project_dir / "pkg" / ".gitignore").write_text("local/\n")
+
+        report = ProjectAnalyzer(temp_project_dir).analyze()
+
+        assert report.file_count == 2
+        assert set(report.directory_structure) == {"pkg", "main.py"}
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 设计系统生成器单元测试
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from super_dev.design import DesignSystem, DesignSystemGenerator
+from super_dev.design.generator import write_json_stream
+
+
+@pytest.fixture
+def design_system() -> DesignSystem:
+    """最小设计系统"""
+    return DesignSystem(
+        name="demo",
+        description="demo design system",
+        colors={"primary": "#2563eb", "text": "#111827"},
+        typography={"body": "Inter, sans-serif"},
+        spacing={"sm": "8px", "md": "16px"},
+        radius={"md": "8px"},
+    )
+
+
+class TestRenderCache:
+    """测试序列化缓存"""
+
+    def test_cached_result_is_copy(self, design_system: DesignSystem):
+        """测试修改返回结果不影响后续调用"""
+        config = design_system.to_tailwind_config()
+        expected = json.loads(json.dumps(config))
+        config["theme"]["extend"]["colors"]["primary"] = "#000000"
+        config.clear()
+
+        assert design_system.to_tailwind_config() == expected
+
+    def test_token_change_rerenders(self, design_system: DesignSystem):
+        """测试 token 变化时重新序列化"""
+        assert "#2563eb" in design_system.to_css_variables()
+
+        design_system.colors["primary"] = "#dc2626"
+
+        css = design_system.to_css_variables()
+        assert "#dc2626" in css
+        assert "#2563eb" not in css
+
+
+class TestIncrementalExport:
+    """测试增量导出"""
+
+    def test_unchanged_tokens_skip_rewrite(self, design_system: DesignSystem, temp_project_dir: Path):
+        """测试 token 未变化时不重写文件，变化后重写"""
+        manifest_path = temp_project_dir / ".super-dev" / "cache" / "design-export.json"
+        output_dir = temp_project_dir / "design"
+        generator = DesignSystemGenerator(manifest_path=manifest_path)
+
+        files = generator.generate_documentation(design_system, output_dir)
+        css_file = output_dir / "design-tokens.css"
+        css_file.write_text("/* edited */", encoding="utf-8")
+
+        generator.generate_documentation(design_system, output_dir)
+        assert css_file.read_text(encoding="utf-8") == "/* edited */"
+
+        design_system.colors["primary"] = "#dc2626"
+        generator.generate_documentation(design_system, output_dir)
+        assert "#dc2626" in css_file.read_text(encoding="utf-8")
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        assert set(manifest) == {str(path.resolve()) for path in files}
+        assert sorted(path.name for path in output_dir.iterdir()) == sorted(path.name for path in files)
+
+    def test_disabled_by_default(self, design_system: DesignSystem, temp_project_dir: Path):
+        """测试未指定清单路径时总是重写且不写清单"""
+        generator = DesignSystemGenerator()
+        output_path = temp_project_dir / "tokens" / "figma.json"
+
+        generator.export_to_figma(design_system, output_path)
+        output_path.write_text("{}", encoding="utf-8")
+        generator.export_to_figma(design_system, output_path)
+
+        assert json.loads(output_path.read_text(encoding="utf-8")) != {}
+        assert [path.name for path in output_path.parent.iterdir()] == ["figma.json"]
+
+
+class TestJsonStream:
+    """测试流式 JSON 写入"""
+
+    def test_round_trip(self, temp_project_dir: Path):
+        """测试写入内容与 json.dumps 一致"""
+        data = {"name": "设计", "values": [1, 2.5, None, True], "nested": {"a": {"b": []}}}
+        path = write_json_stream(data, temp_project_dir / "data.json")
+
+        text = path.read_text(encoding="utf-8")
+        assert json.loads(text) == data
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Super Dev 追踪单元测试
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from super_dev import tracing
+from super_dev.tracing import SpanSequence, span, start_tracing, stop_tracing, traced
+from super_dev.config import ConfigManager
+from super_dev.orchestrator import WorkflowEngine, Phase
+
+
+@pytest.fixture
+def tracer():
+    """启用追踪，测试结束后停用"""
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+class TestTracing:
+    """测试 span 记录与导出"""
+
+    def test_disabled_is_noop(self):
+        """测试未启用时不记录"""
+        assert tracing.get_tracer() is None
+
+        @traced()
+        def work():
+            return 42
+
+        with span("ignored") as current:
+            current.set(count=1)
+        assert work() == 42
+        assert span("ignored") is span("other")
+
+    def test_nested_spans(self, tracer):
+        """测试嵌套与参数"""
+        with span("outer", "test", size=3):
+            with span("inner", "test") as current:
+                current.set(count=2)
+
+        spans = {item["name"]: item for item in tracer.to_dict()["spans"]}
+
+        assert spans["outer"]["parent"] is None
+        assert spans["inner"]["parent"] == spans["outer"]["id"]
+        assert spans["inner"]["args"] == {"count": 2}
+        assert spans["outer"]["duration_ns"] >= spans["inner"]["duration_ns"]
+
+    def test_error_recorded(self, tracer):
+        """测试异常记录到 span"""
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+
+        assert tracer.spans[0].args["error"] == "ValueError"
+
+    def test_async_tasks_get_own_tracks(self, tracer):
+        """测试 asyncio 任务单独成轨并继承父 span"""
+        @traced("child", "test")
+        async def child():
+            await asyncio.sleep(0.01)
+
+        async def main():
+            with span("parent", "test"):
+                await asyncio.gather(child(), child())
+
+        asyncio.run(main())
+        spans = tracer.to_dict()["spans"]
+        parent = next(item for item in spans if item["name"] == "parent")
+        children = [item for item in spans if item["name"] == "child"]
+
+        assert len(children) == 2
+        assert all(item["parent"] == parent["id"] for item in children)
+        assert children[0]["track"] != children[1]["track"]
+
+    def test_span_sequence(self, tracer):
+        """测试依次进行的区间"""
+        stages = SpanSequence("pipeline")
+        stages.next("first")
+        stages.next("second", skipped=True)
+        stages.close()
+        stages.close()
+
+        spans = tracer.to_dict()["spans"]
+        assert [item["name"] for item in spans] == ["first", "second"]
+        assert spans[0]["start_ns"] + spans[0]["duration_ns"] <= spans[1]["start_ns"]
+        assert spans[1]["args"] == {"skipped": True}
+
+    def test_chrome_trace_export(self, tracer, temp_project_dir: Path):
+        """测试 Chrome trace 导出"""
+        with span("outer", "test"):
+            with span("inner", "test"):
+                pass
+
+        path = tracer.write_chrome_trace(temp_project_dir / "trace.json")
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+        complete = [event for event in events if event["ph"] == "X"]
+        metadata = [event for event in events if event["ph"] == "M"]
+
+        assert [event["name"] for event in complete] == ["outer", "inner"]
+        assert complete[0]["ts"] <= complete[1]["ts"]
+        assert complete[0]["dur"] >= complete[1]["dur"]
+        assert metadata and metadata[0]["name"] == "thread_name"
+
+
+class TestInstrumentation:
+    """测试各模块的埋点"""
+
+    def test_workflow_phases(self, tracer, temp_project_dir: Path):
+        """测试工作流运行与阶段 span"""
+        config_manager = ConfigManager(temp_project_dir)
+        config_manager.create(name="test", quality_gate=80)
+        engine = WorkflowEngine(temp_project_dir)
+        engine.config_manager = config_manager
+
+        async def handler(context):
+            return "ok"
+
+        engine.register_phase_handler(Phase.DISCOVERY, handler)
+        engine.register_phase_handler(Phase.INTELLIGENCE, handler)
+        asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]))
+
+        spans = {item["name"]: item for item in tracer.to_dict()["spans"]}
+
+        assert spans["workflow.discovery"]["parent"] == spans["workflow.run"]["id"]
+        assert spans["workflow.intelligence"]["args"]["success"]
+
+    def test_analyzer_stages(self, tracer, temp_project_dir: Path):
+        """测试分析阶段 span"""
+        from super_dev.analyzer import ProjectAnalyzer
+
+        (temp_project_dir / "main.py").write_text("print('hi')\n", encoding="utf-8")
+        ProjectAnalyzer(temp_project_dir).analyze(use_cache=False)
+
+        names = {item.name for item in tracer.spans}
+        assert {"analyze.walk", "analyze.detect", "analyze.scan", "analyze.report"} <= names
+
+    def test_document_generation(self, tracer):
+        """测试文档生成 span"""
+        from super_dev.creators import DocumentGenerator
+
+        DocumentGenerator(name="demo", description="demo project").generate_prd()
+
+        assert [item.name for item in tracer.spans] == ["docs.generate_prd"]
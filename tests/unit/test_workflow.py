@@ -3,6 +3,13 @@
 Super Dev 工作流引擎单元测试
 """
 
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pathlib import Path
 
@@ -10,7 +17,10 @@ from super_dev.orchestrator import (
     WorkflowEngine,
     Phase,
     PhaseResult,
-    WorkflowContext
+    WorkflowContext,
+    WorkflowEventType,
+    RunCheckpoint,
+    resolve_phase_graph
 )
 from super_dev.config import ConfigManager, ProjectConfig
 
@@ -256,3 +266,629 @@ class TestWorkflowEngine:
         # 第二阶段不应执行（质量门禁停止）
         assert Phase.INTELLIGENCE not in results
         assert results[Phase.DISCOVERY].quality_score == 75.0
+
+
+class TestPhaseScheduling:
+    """测试阶段依赖调度"""
+
+    def _context(self, engine: WorkflowEngine) -> WorkflowContext:
+        return WorkflowContext(project_dir=engine.project_dir, config=engine.config_manager)
+
+    def test_resolve_graph_skips_unselected_phases(self):
+        """测试未选中的阶段在依赖图中透明"""
+        graph = resolve_phase_graph(
+            [Phase.DISCOVERY, Phase.REDTEAM, Phase.DEPLOYMENT],
+            {
+                Phase.DISCOVERY: (),
+                Phase.DRAFTING: (Phase.DISCOVERY,),
+                Phase.REDTEAM: (Phase.DRAFTING,),
+                Phase.DEPLOYMENT: (Phase.DISCOVERY,),
+            }
+        )
+
+        assert graph[Phase.DISCOVERY] == set()
+        assert graph[Phase.REDTEAM] == {Phase.DISCOVERY}
+        assert graph[Phase.DEPLOYMENT] == {Phase.DISCOVERY}
+
+    def test_resolve_graph_rejects_cycle(self):
+        """测试依赖环"""
+        with pytest.raises(ValueError):
+            resolve_phase_graph(
+                [Phase.QA, Phase.DELIVERY],
+                {Phase.QA: (Phase.DELIVERY,), Phase.DELIVERY: (Phase.QA,)}
+            )
+
+    def test_independent_phases_run_concurrently(self, engine_factory):
+        """测试互不依赖的阶段并发执行"""
+        engine = engine_factory(max_concurrency=2)
+
+        async def run():
+            intelligence_started = asyncio.Event()
+            deployment_started = asyncio.Event()
+
+            async def intelligence(context):
+                intelligence_started.set()
+                await asyncio.wait_for(deployment_started.wait(), timeout=1)
+                return "intelligence"
+
+            async def deployment(context):
+                deployment_started.set()
+                await asyncio.wait_for(intelligence_started.wait(), timeout=1)
+                return "deployment"
+
+            engine.register_phase_handler(Phase.INTELLIGENCE, intelligence)
+            engine.register_phase_handler(Phase.DEPLOYMENT, deployment)
+            return await engine.run(
+                phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DEPLOYMENT],
+                context=self._context(engine)
+            )
+
+        results = asyncio.run(run())
+
+        assert list(results) == [Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DEPLOYMENT]
+        assert all(result.success for result in results.values())
+
+    def test_concurrency_limit(self, engine_factory):
+        """测试并发上限"""
+        engine = engine_factory(max_concurrency=1)
+        active = []
+        peak = []
+
+        async def handler(context):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        for phase in Phase:
+            engine.register_phase_handler(phase, handler, depends_on=[])
+
+        results = asyncio.run(engine.run(phases=list(Phase), context=self._context(engine)))
+
+        assert len(results) == len(Phase)
+        assert max(peak) == 1
+
+    def test_failure_skips_only_downstream(self, engine_factory):
+        """测试失败只跳过下游阶段"""
+        engine = engine_factory()
+
+        async def fail_handler(context):
+            raise Exception("Test failure")
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, fail_handler)
+
+        results = asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING, Phase.DEPLOYMENT],
+            context=self._context(engine)
+        ))
+
+        assert not results[Phase.INTELLIGENCE].success
+        assert Phase.DRAFTING not in results
+        assert results[Phase.DEPLOYMENT].success
+
+
+class TestPhaseCache:
+    """测试阶段结果缓存"""
+
+    def _record_calls(self, engine: WorkflowEngine, calls: list) -> WorkflowEngine:
+        def make_handler(phase: Phase):
+            async def handler(context):
+                calls.append(phase)
+                return {"phase": phase.value}
+            return handler
+
+        for phase in (Phase.DISCOVERY, Phase.DRAFTING, Phase.REDTEAM):
+            engine.register_phase_handler(phase, make_handler(phase))
+        return engine
+
+    def _run(self, engine: WorkflowEngine) -> dict:
+        context = WorkflowContext(project_dir=engine.project_dir, config=engine.config_manager)
+        return asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.DRAFTING, Phase.REDTEAM],
+            context=context
+        ))
+
+    def test_unchanged_phases_hit_cache(self, engine_factory):
+        """测试输入未变化时复用结果"""
+        calls: list = []
+        self._run(self._record_calls(engine_factory(use_cache=True), calls))
+        assert len(calls) == 3
+
+        calls.clear()
+        results = self._run(self._record_calls(engine_factory(use_cache=True), calls))
+
+        assert calls == []
+        assert all(result.cached for result in results.values())
+        assert results[Phase.REDTEAM].output == {"phase": "redteam"}
+
+    def test_input_file_change_reruns_reader(self, temp_project_dir: Path, engine_factory):
+        """测试相关文件变化时只重新执行读取它的阶段"""
+        prd = temp_project_dir / "output" / "project-prd.md"
+        prd.parent.mkdir(exist_ok=True)
+        prd.write_text("# PRD\n", encoding="utf-8")
+
+        calls: list = []
+        self._run(self._record_calls(engine_factory(use_cache=True), calls))
+
+        prd.write_text("# PRD\n\n- new requirement\n", encoding="utf-8")
+        calls.clear()
+        results = self._run(self._record_calls(engine_factory(use_cache=True), calls))
+
+        assert calls == [Phase.REDTEAM]
+        assert results[Phase.DRAFTING].cached
+        assert not results[Phase.REDTEAM].cached
+
+    def test_config_change_invalidates(self, engine_factory):
+        """测试配置变化时缓存失效"""
+        calls: list = []
+        engine = self._record_calls(engine_factory(use_cache=True), calls)
+        self._run(engine)
+
+        engine.config_manager.update(database="mysql")
+        calls.clear()
+        self._run(engine)
+
+        assert len(calls) == 3
+
+    def test_timeout_config_does_not_invalidate(self, engine_factory):
+        """测试超时配置不影响缓存"""
+        calls: list = []
+        engine = self._record_calls(engine_factory(use_cache=True), calls)
+        self._run(engine)
+
+        engine.config_manager.update(phase_timeout=30, run_timeout=600)
+        calls.clear()
+        self._run(engine)
+
+        assert calls == []
+
+    def test_handler_change_invalidates(self, engine_factory):
+        """测试处理器代码变化时缓存失效"""
+        calls: list = []
+        engine = self._record_calls(engine_factory(use_cache=True), calls)
+        self._run(engine)
+
+        def make_handler(phase: Phase):
+            async def handler(context):
+                calls.append(phase)
+                return {"phase": phase.value, "version": 2}
+            return handler
+
+        engine = self._record_calls(engine_factory(use_cache=True), calls)
+        engine.register_phase_handler(Phase.REDTEAM, make_handler(Phase.REDTEAM))
+        calls.clear()
+        results = self._run(engine)
+
+        assert calls == [Phase.REDTEAM]
+        assert results[Phase.REDTEAM].output["version"] == 2
+
+    def test_cache_hit_replays_context(self, temp_project_dir: Path, engine_factory):
+        """测试命中缓存时重放阶段对上下文的改动"""
+        calls: list = []
+        seen: list = []
+
+        def setup() -> WorkflowEngine:
+            engine = self._record_calls(engine_factory(use_cache=True), calls)
+
+            async def drafting(context):
+                calls.append(Phase.DRAFTING)
+                context.documents["prd"] = "# PRD"
+                context.quality_reports["drafting"] = {"score": 90}
+                return "drafted"
+
+            async def redteam(context):
+                calls.append(Phase.REDTEAM)
+                seen.append(context.documents.get("prd"))
+                return f"reviewed {context.documents.get('prd')}"
+
+            engine.register_phase_handler(Phase.DRAFTING, drafting)
+            engine.register_phase_handler(Phase.REDTEAM, redteam)
+            return engine
+
+        self._run(setup())
+        (temp_project_dir / "output").mkdir(exist_ok=True)
+        (temp_project_dir / "output" / "notes.md").write_text("changed\n", encoding="utf-8")
+        calls.clear()
+        seen.clear()
+        engine = setup()
+        context = WorkflowContext(project_dir=engine.project_dir, config=engine.config_manager)
+        results = asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.DRAFTING, Phase.REDTEAM], context=context
+        ))
+
+        assert calls == [Phase.REDTEAM]
+        assert results[Phase.DRAFTING].cached
+        assert seen == ["# PRD"]
+        assert context.quality_reports["drafting"] == {"score": 90}
+
+    def test_failed_phase_not_cached(self, engine_factory):
+        """测试失败结果不缓存"""
+        calls: list = []
+        engine = self._record_calls(engine_factory(use_cache=True), calls)
+
+        async def fail_handler(context):
+            calls.append(Phase.DRAFTING)
+            raise Exception("Test failure")
+
+        engine.register_phase_handler(Phase.DRAFTING, fail_handler)
+        self._run(engine)
+        calls.clear()
+        results = self._run(engine)
+
+        assert calls == [Phase.DRAFTING]
+        assert results[Phase.DISCOVERY].cached
+        assert not results[Phase.DRAFTING].success
+
+
+class TestCheckpointResume:
+    """测试检查点与继续运行"""
+
+    def _record_calls(self, engine: WorkflowEngine, calls: list, failing: set) -> WorkflowEngine:
+        def make_handler(phase: Phase):
+            async def handler(context):
+                calls.append(phase)
+                if phase in failing:
+                    raise Exception("Test failure")
+                context.documents[phase.value] = f"{phase.value}.md"
+                return {"phase": phase.value}
+            return handler
+
+        for phase in (Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING):
+            engine.register_phase_handler(phase, make_handler(phase))
+        return engine
+
+    def test_checkpoint_written(self, temp_project_dir: Path, engine_factory):
+        """测试运行后写入检查点"""
+        engine = self._record_calls(engine_factory(), [], {Phase.DRAFTING})
+        asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING]))
+
+        data = RunCheckpoint(temp_project_dir, engine.run_id).load()
+
+        assert data["status"] == "failed"
+        assert data["phases"] == ["discovery", "intelligence", "drafting"]
+        assert data["results"]["discovery"]["success"]
+        assert not data["results"]["drafting"]["success"]
+        assert data["context"]["documents"] == {
+            "discovery": "discovery.md",
+            "intelligence": "intelligence.md",
+        }
+
+    def test_resume_skips_completed_phases(self, temp_project_dir: Path, engine_factory):
+        """测试继续运行时只执行未完成的阶段"""
+        first = self._record_calls(engine_factory(), [], {Phase.DRAFTING})
+        asyncio.run(first.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING]))
+
+        calls: list = []
+        second = self._record_calls(engine_factory(), calls, set())
+        context = WorkflowContext(project_dir=temp_project_dir, config=second.config_manager)
+        results = asyncio.run(second.resume(first.run_id, context=context))
+
+        assert calls == [Phase.DRAFTING]
+        assert all(result.success for result in results.values())
+        assert list(results) == [Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING]
+        assert results[Phase.DISCOVERY].output == {"phase": "discovery"}
+        assert set(context.documents) == {"discovery", "intelligence", "drafting"}
+        assert RunCheckpoint(temp_project_dir, first.run_id).load()["status"] == "completed"
+
+    def test_resume_reruns_lossy_phase(self, temp_project_dir: Path, engine_factory):
+        """测试上下文无法无损保存的阶段在继续运行时重新执行"""
+        first = self._record_calls(engine_factory(), [], {Phase.DRAFTING})
+
+        async def intelligence(context):
+            context.research_data["started"] = datetime(2026, 1, 1)
+            return {"phase": "intelligence"}
+
+        first.register_phase_handler(Phase.INTELLIGENCE, intelligence)
+        asyncio.run(first.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING]))
+        assert "intelligence" in RunCheckpoint(temp_project_dir, first.run_id).load()["lossy"]
+
+        calls: list = []
+        second = self._record_calls(engine_factory(), calls, set())
+        results = asyncio.run(second.resume(first.run_id))
+
+        assert calls == [Phase.INTELLIGENCE, Phase.DRAFTING]
+        assert all(result.success for result in results.values())
+
+    def test_resume_latest_and_missing(self, temp_project_dir: Path, engine_factory):
+        """测试继续最近一次运行及缺失检查点"""
+        engine = self._record_calls(engine_factory(), [], set())
+
+        with pytest.raises(ValueError):
+            asyncio.run(engine.resume())
+
+        asyncio.run(engine.run(phases=[Phase.DISCOVERY]))
+        assert RunCheckpoint.latest(temp_project_dir).run_id == engine.run_id
+
+
+def _cpu_handler(context):
+    """进程池中执行的处理器（须为模块级函数）"""
+    return {"pid": os.getpid()}
+
+
+class TestHandlerExecutors:
+    """测试同步处理器的执行器"""
+
+    def test_sync_handlers_do_not_block_loop(self, engine_factory):
+        """测试同步处理器在线程池中并发执行"""
+        engine = engine_factory(max_concurrency=2)
+        barrier = threading.Barrier(2, timeout=2)
+
+        def handler(context):
+            barrier.wait()
+            return threading.current_thread().name
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, handler)
+        engine.register_phase_handler(Phase.DEPLOYMENT, handler)
+
+        results = asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DEPLOYMENT]
+        ))
+
+        assert all(result.success for result in results.values())
+        assert results[Phase.INTELLIGENCE].output != threading.current_thread().name
+
+    def test_cpu_handler_runs_in_process_pool(self, engine_factory):
+        """测试 cpu 类型处理器在子进程中执行"""
+        engine = engine_factory()
+        engine.register_phase_handler(Phase.INTELLIGENCE, _cpu_handler, executor="cpu")
+
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]))
+
+        assert results[Phase.INTELLIGENCE].success
+        assert results[Phase.INTELLIGENCE].output["pid"] != os.getpid()
+
+    def test_unknown_executor(self, engine_factory):
+        """测试未知的执行器类型"""
+        engine = engine_factory()
+
+        with pytest.raises(ValueError):
+            engine.register_phase_handler(Phase.QA, _cpu_handler, executor="gpu")
+
+    def test_supplied_executor_left_open(self, engine_factory):
+        """测试调用方传入的执行器不会被关闭"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            engine = engine_factory(io_executor=executor)
+            engine.register_phase_handler(Phase.DISCOVERY, lambda context: "discovery")
+            asyncio.run(engine.run(phases=[Phase.DISCOVERY]))
+
+            assert executor.submit(lambda: 1).result() == 1
+
+
+class TestTimeoutsAndAbort:
+    """测试超时、取消与中止"""
+
+    def test_phase_timeout(self, engine_factory):
+        """测试阶段超时"""
+        engine = engine_factory(config={"phase_timeouts": {"intelligence": 0.05}})
+
+        async def hang(context):
+            await asyncio.sleep(10)
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, hang)
+
+        results = asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING]
+        ))
+
+        assert results[Phase.INTELLIGENCE].timed_out
+        assert not results[Phase.INTELLIGENCE].success
+        assert Phase.DRAFTING not in results
+
+    def test_handler_timeout_error_is_failure(self, engine_factory):
+        """测试处理器自身抛出的超时异常不记为阶段超时"""
+        engine = engine_factory(config={"phase_timeout": 5})
+
+        async def handler(context):
+            raise asyncio.TimeoutError("upstream timeout")
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, handler)
+
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]))
+
+        assert not results[Phase.INTELLIGENCE].success
+        assert not results[Phase.INTELLIGENCE].timed_out
+
+    def test_run_timeout(self, temp_project_dir: Path, engine_factory):
+        """测试整体运行超时"""
+        engine = engine_factory(config={"run_timeout": 0.1})
+
+        async def hang(context):
+            await asyncio.sleep(10)
+
+        engine.register_phase_handler(Phase.DEPLOYMENT, hang)
+
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.DEPLOYMENT]))
+
+        assert results[Phase.DISCOVERY].success
+        assert results[Phase.DEPLOYMENT].cancelled
+        assert results[Phase.DEPLOYMENT].timed_out
+        assert RunCheckpoint(temp_project_dir, engine.run_id).load()["status"] == "timed_out"
+
+    def test_abort_releases_sync_handler(self, temp_project_dir: Path, engine_factory):
+        """测试中止时线程池中的处理器通过 cancel_event 尽快结束"""
+        engine = engine_factory()
+        released = threading.Event()
+
+        def wait_for_cancel(context):
+            threading.Timer(0.05, engine.abort).start()
+            context.cancel_event.wait(5)
+            released.set()
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, wait_for_cancel)
+        context = WorkflowContext(project_dir=temp_project_dir, config=engine.config_manager)
+
+        results = asyncio.run(engine.run(
+            phases=[Phase.DISCOVERY, Phase.INTELLIGENCE, Phase.DRAFTING], context=context
+        ))
+
+        assert released.wait(1)
+        assert context.cancelled
+        assert results[Phase.INTELLIGENCE].cancelled
+        assert not results[Phase.INTELLIGENCE].timed_out
+        assert Phase.DRAFTING not in results
+
+    def test_abort_before_run(self, temp_project_dir: Path, engine_factory):
+        """测试 run() 之前调用 abort() 时不启动任何阶段，运行结束后状态复位"""
+        engine = engine_factory()
+        engine.abort()
+
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY]))
+        checkpoint = RunCheckpoint(temp_project_dir, engine.run_id).load()
+
+        assert results == {}
+        assert checkpoint["status"] == "aborted"
+
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY]))
+        assert results[Phase.DISCOVERY].success
+
+    def test_outer_cancellation_reaches_handler(self, engine_factory):
+        """测试 run() 被取消时处理器收到取消"""
+        engine = engine_factory()
+        seen = []
+
+        async def hang(context):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                seen.append("cancelled")
+                raise
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, hang)
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]), timeout=0.1
+                )
+
+        asyncio.run(run())
+
+        assert seen == ["cancelled"]
+
+
+class TestEventStream:
+    """测试工作流事件流"""
+
+    def _collect(self, engine: WorkflowEngine, **kwargs) -> list:
+        async def run():
+            return [event async for event in engine.run_stream(**kwargs)]
+        return asyncio.run(run())
+
+    def test_event_sequence(self, engine_factory):
+        """测试事件顺序与进度事件"""
+        engine = engine_factory()
+
+        def intelligence(context):
+            context.report_progress(0.5, "half way")
+            return "intelligence"
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, intelligence)
+
+        events = self._collect(engine, phases=[Phase.DISCOVERY, Phase.INTELLIGENCE])
+        kinds = [(event.type, event.phase) for event in events]
+
+        assert kinds == [
+            (WorkflowEventType.WORKFLOW_STARTED, None),
+            (WorkflowEventType.PHASE_STARTED, Phase.DISCOVERY),
+            (WorkflowEventType.PHASE_COMPLETED, Phase.DISCOVERY),
+            (WorkflowEventType.PHASE_STARTED, Phase.INTELLIGENCE),
+            (WorkflowEventType.PROGRESS, Phase.INTELLIGENCE),
+            (WorkflowEventType.PHASE_COMPLETED, Phase.INTELLIGENCE),
+            (WorkflowEventType.WORKFLOW_COMPLETED, None),
+        ]
+        assert events[4].data == {"fraction": 0.5, "message": "half way"}
+        assert events[-1].data["status"] == "completed"
+        assert events[-1].data["results"]["intelligence"]["output"] == "intelligence"
+        assert all(a.timestamp <= b.timestamp for a, b in zip(events, events[1:]))
+        assert engine._listeners == []
+
+    def test_gate_failed_and_skipped_events(self, engine_factory):
+        """测试质量门禁失败事件"""
+        engine = engine_factory()
+        engine._calculate_quality_score = lambda phase, context: 50.0
+
+        events = self._collect(engine, phases=[Phase.DISCOVERY, Phase.INTELLIGENCE])
+        kinds = [event.type for event in events]
+
+        assert WorkflowEventType.GATE_FAILED in kinds
+        assert events[kinds.index(WorkflowEventType.PHASE_SKIPPED)].phase == Phase.INTELLIGENCE
+        assert events[-1].data["status"] == "failed"
+
+    def test_progress_without_listeners(self, engine_factory):
+        """测试没有订阅者时进度报告为空操作"""
+        engine = engine_factory()
+
+        async def intelligence(context):
+            context.report_progress(2.0)
+            return "intelligence"
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, intelligence)
+        results = asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]))
+
+        assert results[Phase.INTELLIGENCE].success
+
+    def test_closing_stream_cancels_run(self, engine_factory):
+        """测试提前关闭事件流会取消运行"""
+        engine = engine_factory()
+        seen = []
+
+        async def hang(context):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                seen.append("cancelled")
+                raise
+
+        engine.register_phase_handler(Phase.INTELLIGENCE, hang)
+
+        async def run():
+            stream = engine.run_stream(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE])
+            async for event in stream:
+                if event.type == WorkflowEventType.PHASE_STARTED and event.phase == Phase.INTELLIGENCE:
+                    break
+            await stream.aclose()
+
+        asyncio.run(run())
+
+        assert seen == ["cancelled"]
+
+
+class TestExecutorShutdown:
+    """测试超时 / 取消后不等待仍在执行的同步处理器"""
+
+    def test_sync_phase_timeout_returns_promptly(self, engine_factory):
+        """测试同步处理器超时后 run() 立即返回"""
+        engine = engine_factory(config={"phase_timeouts": {"intelligence": 0.1}})
+        release = threading.Event()
+        engine.register_phase_handler(Phase.INTELLIGENCE, lambda context: release.wait(3))
+
+        started = time.perf_counter()
+        try:
+            results = asyncio.run(engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]))
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+
+        assert results[Phase.INTELLIGENCE].timed_out
+        assert elapsed < 1.5
+
+    def test_outer_cancellation_with_sync_handler(self, engine_factory):
+        """测试 run() 被取消时不阻塞在执行器关闭上"""
+        engine = engine_factory()
+        release = threading.Event()
+        engine.register_phase_handler(Phase.INTELLIGENCE, lambda context: release.wait(3))
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    engine.run(phases=[Phase.DISCOVERY, Phase.INTELLIGENCE]), timeout=0.2
+                )
+
+        started = time.perf_counter()
+        try:
+            asyncio.run(run())
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+
+        assert elapsed < 1.5